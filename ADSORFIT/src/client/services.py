@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import asyncio
 import copy
+import json
 import math
-from collections.abc import Sequence
+from collections.abc import Callable, Sequence
 from typing import Any
 
 import httpx
@@ -17,6 +19,12 @@ from ADSORFIT.src.packages.constants import MODEL_PARAMETER_DEFAULTS
 type DatasetPayload = dict[str, Any]
 type ParameterKey = tuple[str, str, str]
 
+# Registered uploads can be evicted or lost when the backend restarts
+DATASET_UNAVAILABLE_MESSAGE = (
+    "[ERROR] The loaded dataset is no longer available on the server, "
+    "please upload it again."
+)
+
 
 # [SETTINGS]
 ###############################################################################
@@ -96,14 +104,22 @@ class DatasetEndpointService():
                 detail = "Failed to load dataset."
             return {"dataset": None, "message": f"[ERROR] {detail}"}
 
-        dataset = payload.get("dataset") if isinstance(payload, dict) else None
-        summary = payload.get("summary") if isinstance(payload, dict) else None
+        # Uploads stay registered server-side, the client only keeps the
+        # identifier together with the preview shown to the user.
+        dataset_id = payload.get("dataset_id")
+        summary = payload.get("summary")
 
-        if not isinstance(dataset, dict):
+        if not isinstance(dataset_id, str) or not dataset_id:
             return {
                 "dataset": None,
                 "message": "[ERROR] Backend returned an invalid dataset payload.",
             }
+        dataset: DatasetPayload = {
+            "dataset_id": dataset_id,
+            "columns": list(payload.get("columns") or []),
+            "preview": list(payload.get("preview") or []),
+            "row_count": payload.get("row_count"),
+        }
 
         if not isinstance(summary, str):
             summary = "[INFO] Dataset loaded successfully."
@@ -136,6 +152,11 @@ class FittingEndpointService():
 
         return f"HTTP error {response.status_code}"
 
+    # -------------------------------------------------------------------------
+    def is_unknown_dataset(self, response: httpx.Response) -> bool:
+        # Unknown jobs are reported with 404 as well, only datasets need a re-upload
+        return self.extract_error_message(response).startswith("Unknown dataset")
+
     # -------------------------------------------------------------------------
     def build_parameter_bounds(
         self,
@@ -197,6 +218,44 @@ class FittingEndpointService():
             configuration[model_name] = config_entry
         return configuration
 
+    # -------------------------------------------------------------------------
+    async def wait_for_job(
+        self, client: httpx.AsyncClient, job_url: str
+    ) -> httpx.Response:
+        # Jobs run server-side, so the client only polls their status and fetches
+        # the result once the job leaves the active states.
+        while True:
+            response = await client.get(job_url)
+            response.raise_for_status()
+            job_status = response.json().get("status")
+            if job_status not in ("queued", "running"):
+                break
+            await asyncio.sleep(self.config.client.ui.job_poll_interval)
+        response = await client.get(f"{job_url}/result")
+        response.raise_for_status()
+        return response
+
+    # -------------------------------------------------------------------------
+    async def stream_job_events(
+        self,
+        client: httpx.AsyncClient,
+        events_url: str,
+        event_handler: Callable[[dict[str, Any]], None],
+    ) -> None:
+        # Server-sent events are parsed line by line: every ``data:`` line carries a
+        # complete JSON progress update.
+        async with client.stream("GET", events_url, timeout=None) as response:
+            response.raise_for_status()
+            async for line in response.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                try:
+                    event = json.loads(line[len("data:") :].strip())
+                except ValueError:
+                    continue
+                if isinstance(event, dict):
+                    event_handler(event)
+
     # -------------------------------------------------------------------------
     async def start_fitting(
         self,
@@ -207,6 +266,7 @@ class FittingEndpointService():
         dataset: DatasetPayload | None,
         selected_models: list[str],
         *values: Any,
+        event_handler: Callable[[dict[str, Any]], None] | None = None,
     ) -> dict[str, Any]:
         if dataset is None:
             return {
@@ -253,25 +313,44 @@ class FittingEndpointService():
 
         configuration = self.build_solver_configuration(bounds, selected_models)
 
-        dataset_payload = {
-            "columns": list(dataset.get("columns", [])),
-            "records": list(dataset.get("records", [])),
-        }
-
-        payload = {
+        payload: dict[str, Any] = {
             "max_iterations": iterations,
             "save_best": bool(save_best),
             "parameter_bounds": configuration,
-            "dataset": dataset_payload,
         }
+        # Uploaded datasets are registered by the backend and referenced by id
+        dataset_id = dataset.get("dataset_id")
+        if not isinstance(dataset_id, str) or not dataset_id:
+            return {"message": DATASET_UNAVAILABLE_MESSAGE, "json": None}
+        payload["dataset_id"] = dataset_id
 
         try:
             async with httpx.AsyncClient(timeout=self.config.client.ui.http_timeout) as client:
                 response = await client.post(url, json=payload)
                 response.raise_for_status()
+                job_id = response.json().get("job_id")
+                if event_handler is not None:
+                    try:
+                        await self.stream_job_events(
+                            client, f"{url}/{job_id}/events", event_handler
+                        )
+                    except httpx.HTTPError:
+                        # Losing the stream only degrades feedback, the job result
+                        # is still collected by polling below.
+                        pass
+                response = await self.wait_for_job(client, f"{url}/{job_id}")
         except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404 and self.is_unknown_dataset(
+                exc.response
+            ):
+                return {"message": DATASET_UNAVAILABLE_MESSAGE, "json": None}
             message = self.extract_error_message(exc.response)
             return {"message": f"[ERROR] {message}", "json": None}
+        except ValueError:
+            return {
+                "message": "[ERROR] Invalid job response from ADSORFIT backend.",
+                "json": None,
+            }
         except httpx.RequestError as exc:
             return {
                 "message": f"[ERROR] Failed to reach ADSORFIT backend: {exc}",
@@ -8,8 +8,11 @@ from nicegui import ui
 from nicegui.elements.checkbox import Checkbox
 from nicegui.elements.expansion import Expansion
 from nicegui.elements.markdown import Markdown
+from nicegui.elements.label import Label
 from nicegui.elements.number import Number
+from nicegui.elements.progress import LinearProgress
 from nicegui.elements.switch import Switch
+from nicegui.elements.table import Table
 from nicegui.elements.textarea import Textarea
 
 from ADSORFIT.src.client.services import (
@@ -31,6 +34,13 @@ api_settings = configurations.server.fastapi
 dataset_settings = configurations.server.datasets
 fitting_settings = configurations.server.fitting
 
+BEST_MODEL_COLUMNS = [
+    {"name": "experiment", "label": "Experiment", "field": "experiment"},
+    {"name": "best model", "label": "Best model", "field": "best model"},
+    {"name": "best LSS", "label": "Best LSS", "field": "best LSS"},
+    {"name": "worst model", "label": "Worst model", "field": "worst model"},
+]
+
 
 # [INTERFACE CONTROLLER]
 ###############################################################################
@@ -167,15 +177,55 @@ class InterfaceService:
 
         return _handler
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def format_progress(event: dict[str, Any]) -> str:
+        completed = int(event.get("completed") or 0)
+        total = int(event.get("total") or 0)
+        parts = [f"{completed}/{total} experiments"]
+        throughput = event.get("throughput")
+        if isinstance(throughput, (int, float)) and throughput > 0:
+            parts.append(f"{throughput:.1f} exp/s")
+        eta = event.get("eta")
+        if isinstance(eta, (int, float)):
+            parts.append(f"ETA {eta:.0f} s")
+        return " | ".join(parts)
+
+    # -------------------------------------------------------------------------
+    def build_progress_handler(
+        self,
+        progress_bar: LinearProgress,
+        progress_label: Label,
+        best_model_table: Table,
+    ) -> Callable[[dict[str, Any]], None]:
+        def _handler(event: dict[str, Any]) -> None:
+            total = int(event.get("total") or 0)
+            completed = int(event.get("completed") or 0)
+            progress_bar.value = completed / total if total else 0.0
+            progress_label.text = self.format_progress(event)
+            rows = event.get("rows") or []
+            if rows:
+                best_model_table.rows.extend(rows)
+                best_model_table.update()
+
+        return _handler
+
     # -------------------------------------------------------------------------
     def build_start_fitting_handler(
         self,
         max_iterations_input: Number,
         save_best_checkbox: Checkbox,
         status_area: Textarea,
+        progress_bar: LinearProgress,
+        progress_label: Label,
+        best_model_table: Table,
     ) -> Callable[[], CoroutineType[Any, Any, None]]:
         async def _handler() -> None:
             status_area.value = "[INFO] Starting fitting process..."
+            progress_bar.value = 0.0
+            progress_label.text = ""
+            best_model_table.rows.clear()
+            best_model_table.update()
             metadata, values = self.collect_parameter_payload()
 
             max_iterations_value = max_iterations_input.value
@@ -194,7 +244,7 @@ class InterfaceService:
                 if bool(toggle.value)
             ]
 
-            url = f"{api_settings.api_base_url}/fitting/run"
+            url = f"{api_settings.api_base_url}/fitting/jobs"
             result = await self.fitting_endpoint.start_fitting(
                 url,
                 metadata,
@@ -203,6 +253,9 @@ class InterfaceService:
                 self.dataset_state.get("dataset"),
                 selected_models,
                 *values,
+                event_handler=self.build_progress_handler(
+                    progress_bar, progress_label, best_model_table
+                ),
             )
             status_area.value = result.get("message", "")
 
@@ -312,6 +365,17 @@ class InterfaceStructure:
                 )
 
                 fit_button = ui.button("Start fitting").props("color=primary")
+
+                progress_bar = ui.linear_progress(value=0.0, show_value=False).classes(
+                    "w-full"
+                )
+                progress_label = ui.label("").classes("w-full text-sm")
+                best_model_table = ui.table(
+                    columns=BEST_MODEL_COLUMNS,
+                    rows=[],
+                    row_key="experiment",
+                    pagination=10,
+                ).classes("w-full")
                 
         return {
             "max_iterations_input": max_iterations_input,
@@ -320,6 +384,9 @@ class InterfaceStructure:
             "status_area": status_area,
             "dataset_upload": dataset_upload,
             "fit_button": fit_button,
+            "progress_bar": progress_bar,
+            "progress_label": progress_label,
+            "best_model_table": best_model_table,
         }
 
     # -------------------------------------------------------------------------
@@ -346,6 +413,9 @@ class InterfaceStructure:
                 controls["max_iterations_input"],
                 controls["save_best_checkbox"],
                 controls["status_area"],
+                controls["progress_bar"],
+                controls["progress_label"],
+                controls["best_model_table"],
             )
         )
 
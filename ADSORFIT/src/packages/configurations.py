@@ -38,12 +38,22 @@ class DatabaseSettings:
     ssl_ca: str | None         
     connect_timeout: int
     insert_batch_size: int
+    sqlite_journal_mode: str
+    sqlite_synchronous: str
+    sqlite_cache_size_mb: int
+    sqlite_mmap_size_mb: int
+    sqlite_busy_timeout_ms: int
+    sqlite_reader_pool_size: int
 
 # -----------------------------------------------------------------------------
 @dataclass(frozen=True)
 class DatasetSettings:
     allowed_extensions: tuple[str, ...]
     column_detection_cutoff: float
+    preview_rows: int
+    registry_memory_mb: int
+    registry_disk_mb: int
+    sniff_bytes: int
 
 # -----------------------------------------------------------------------------
 @dataclass(frozen=True)
@@ -55,6 +65,38 @@ class FittingSettings:
     parameter_min_default: float
     parameter_max_default: float
     preview_row_limit: int
+    parallel_workers: int
+    parallel_chunk_size: int
+    solver_backend: str
+    batch_size: int
+    analytic_jacobian: bool
+    data_driven_initial_guess: bool
+    tighten_bounds: bool
+    bound_tightening_factor: float
+    initial_guess_report_sample: int
+    separable_fast_paths: bool
+    fit_cache_enabled: bool
+    fit_cache_memory_entries: int
+    fit_cache_max_mb: int
+    streaming_memory_mb: int
+    write_behind: bool
+    write_queue_size: int
+    result_batch_size: int
+
+# -----------------------------------------------------------------------------
+@dataclass(frozen=True)
+class JobSettings:
+    workers: int
+    queue_size: int
+    progress_interval: float
+    stale_after: float
+    stream_interval: float
+
+# -----------------------------------------------------------------------------
+@dataclass(frozen=True)
+class ResultSettings:
+    default_page_size: int
+    max_page_size: int
 
 # -----------------------------------------------------------------------------
 @dataclass(frozen=True)
@@ -63,6 +105,8 @@ class ServerSettings:
     database: DatabaseSettings
     datasets: DatasetSettings
     fitting: FittingSettings
+    jobs: JobSettings
+    results: ResultSettings
 
 
 # [CLIENT SETTINGS]
@@ -75,6 +119,7 @@ class UIRuntimeSettings:
     show_welcome_message: bool
     reconnect_timeout: int    
     http_timeout: float
+    job_poll_interval: float
 
 # -----------------------------------------------------------------------------
 @dataclass(frozen=True)
@@ -124,6 +169,29 @@ def build_fastapi_settings(payload: dict[str, Any] | Any) -> FastAPISettings:
 # -----------------------------------------------------------------------------
 def build_database_settings(payload: dict[str, Any] | Any) -> DatabaseSettings:
     embedded = bool(payload.get("embedded_database", True))
+    # Pragma values are interpolated into statements, so only known modes pass
+    journal_mode = coerce_str(payload.get("sqlite_journal_mode"), "WAL").upper()
+    if journal_mode not in {"WAL", "DELETE", "TRUNCATE", "PERSIST", "MEMORY"}:
+        journal_mode = "WAL"
+    synchronous = coerce_str(payload.get("sqlite_synchronous"), "NORMAL").upper()
+    if synchronous not in {"OFF", "NORMAL", "FULL", "EXTRA"}:
+        synchronous = "NORMAL"
+    sqlite_profile: dict[str, Any] = {
+        "sqlite_journal_mode": journal_mode,
+        "sqlite_synchronous": synchronous,
+        "sqlite_cache_size_mb": coerce_int(
+            payload.get("sqlite_cache_size_mb"), 64, minimum=0
+        ),
+        "sqlite_mmap_size_mb": coerce_int(
+            payload.get("sqlite_mmap_size_mb"), 256, minimum=0
+        ),
+        "sqlite_busy_timeout_ms": coerce_int(
+            payload.get("sqlite_busy_timeout_ms"), 5000, minimum=0
+        ),
+        "sqlite_reader_pool_size": coerce_int(
+            payload.get("sqlite_reader_pool_size"), 4, minimum=1
+        ),
+    }
     if embedded:
         # External fields are ignored entirely when embedded DB is active
         return DatabaseSettings(
@@ -138,6 +206,7 @@ def build_database_settings(payload: dict[str, Any] | Any) -> DatabaseSettings:
             ssl_ca=None,
             connect_timeout=10,
             insert_batch_size=coerce_int(payload.get("insert_batch_size"), 1000, minimum=1),
+            **sqlite_profile,
         )
 
     # External DB mode
@@ -155,6 +224,7 @@ def build_database_settings(payload: dict[str, Any] | Any) -> DatabaseSettings:
         ssl_ca=coerce_str_or_none(payload.get("ssl_ca")),
         connect_timeout=coerce_int(payload.get("connect_timeout"), 10, minimum=1),
         insert_batch_size=coerce_int(payload.get("insert_batch_size"), 1000, minimum=1),
+        **sqlite_profile,
     )
 
 # -----------------------------------------------------------------------------
@@ -166,6 +236,12 @@ def build_dataset_settings(payload: dict[str, Any] | Any) -> DatasetSettings:
         column_detection_cutoff=coerce_float(
             payload.get("column_detection_cutoff"), 0.6, minimum=0.0, maximum=1.0
         ),
+        preview_rows=coerce_int(payload.get("preview_rows"), 20, minimum=0),
+        registry_memory_mb=coerce_int(
+            payload.get("registry_memory_mb"), 512, minimum=1
+        ),
+        registry_disk_mb=coerce_int(payload.get("registry_disk_mb"), 4096, minimum=0),
+        sniff_bytes=coerce_int(payload.get("sniff_bytes"), 65536, minimum=1024),
     )
 
 # -----------------------------------------------------------------------------
@@ -185,6 +261,9 @@ def build_fitting_settings(payload: dict[str, Any] | Any) -> FittingSettings:
     parameter_max_default = coerce_float(
         payload.get("default_parameter_max"), 100.0, minimum=parameter_min_default
     )
+    solver_backend = coerce_str(payload.get("solver_backend"), "curve_fit").lower()
+    if solver_backend not in {"curve_fit", "batched"}:
+        solver_backend = "curve_fit"
     return FittingSettings(
         default_max_iterations=default_iterations,
         max_iterations_upper_bound=upper_bound,
@@ -193,6 +272,62 @@ def build_fitting_settings(payload: dict[str, Any] | Any) -> FittingSettings:
         parameter_min_default=parameter_min_default,
         parameter_max_default=parameter_max_default,
         preview_row_limit=coerce_int(payload.get("preview_row_limit"), 5, minimum=1),
+        parallel_workers=coerce_int(payload.get("parallel_workers"), 1, minimum=0),
+        parallel_chunk_size=coerce_int(
+            payload.get("parallel_chunk_size"), 0, minimum=0
+        ),
+        solver_backend=solver_backend,
+        batch_size=coerce_int(payload.get("batch_size"), 512, minimum=1),
+        analytic_jacobian=coerce_bool(payload.get("analytic_jacobian"), True),
+        data_driven_initial_guess=coerce_bool(
+            payload.get("data_driven_initial_guess"), False
+        ),
+        tighten_bounds=coerce_bool(payload.get("tighten_bounds"), False),
+        bound_tightening_factor=coerce_float(
+            payload.get("bound_tightening_factor"), 100.0, minimum=1.0
+        ),
+        initial_guess_report_sample=coerce_int(
+            payload.get("initial_guess_report_sample"), 0, minimum=0
+        ),
+        separable_fast_paths=coerce_bool(payload.get("separable_fast_paths"), True),
+        fit_cache_enabled=coerce_bool(payload.get("fit_cache_enabled"), True),
+        fit_cache_memory_entries=coerce_int(
+            payload.get("fit_cache_memory_entries"), 10000, minimum=0
+        ),
+        fit_cache_max_mb=coerce_int(payload.get("fit_cache_max_mb"), 256, minimum=0),
+        streaming_memory_mb=coerce_int(
+            payload.get("streaming_memory_mb"), 1024, minimum=16
+        ),
+        write_behind=coerce_bool(payload.get("write_behind"), True),
+        write_queue_size=coerce_int(payload.get("write_queue_size"), 8, minimum=1),
+        result_batch_size=coerce_int(payload.get("result_batch_size"), 500, minimum=1),
+    )
+
+# -----------------------------------------------------------------------------
+def build_job_settings(payload: dict[str, Any] | Any) -> JobSettings:
+    return JobSettings(
+        workers=coerce_int(payload.get("workers"), 2, minimum=1),
+        queue_size=coerce_int(payload.get("queue_size"), 8, minimum=0),
+        progress_interval=coerce_float(
+            payload.get("progress_interval"), 1.0, minimum=0.0
+        ),
+        stale_after=coerce_float(payload.get("stale_after"), 600.0, minimum=1.0),
+        stream_interval=coerce_float(
+            payload.get("stream_interval"), 0.5, minimum=0.05
+        ),
+    )
+
+# -----------------------------------------------------------------------------
+def build_result_settings(payload: dict[str, Any] | Any) -> ResultSettings:
+    max_page_size = coerce_int(payload.get("max_page_size"), 1000, minimum=1)
+    return ResultSettings(
+        default_page_size=coerce_int(
+            payload.get("default_page_size"),
+            100,
+            minimum=1,
+            maximum=max_page_size,
+        ),
+        max_page_size=max_page_size,
     )
 
 # -----------------------------------------------------------------------------
@@ -203,12 +338,16 @@ def build_server_settings(data: dict[str, Any] | Any) -> ServerSettings:
     database_payload = ensure_mapping(payload.get("database"))
     dataset_payload = ensure_mapping(payload.get("datasets"))
     fitting_payload = ensure_mapping(payload.get("fitting"))
+    jobs_payload = ensure_mapping(payload.get("jobs"))
+    results_payload = ensure_mapping(payload.get("results"))
 
     return ServerSettings(
         fastapi=build_fastapi_settings(fastapi_payload),
         database=build_database_settings(database_payload),
         datasets=build_dataset_settings(dataset_payload),
         fitting=build_fitting_settings(fitting_payload),
+        jobs=build_job_settings(jobs_payload),
+        results=build_result_settings(results_payload),
     )
 
 # -----------------------------------------------------------------------------
@@ -219,7 +358,10 @@ def build_ui_settings(payload: dict[str, Any] | Any | Any) -> UIRuntimeSettings:
         title=coerce_str(payload.get("title"), "ADSORFIT Model Fitting"),        
         show_welcome_message=coerce_bool(payload.get("show_welcome_message"), False),
         reconnect_timeout=coerce_int(payload.get("reconnect_timeout"), 180, minimum=1),        
-        http_timeout=coerce_float(payload.get("timeout"), 120.0, minimum=1.0)
+        http_timeout=coerce_float(payload.get("timeout"), 120.0, minimum=1.0),
+        job_poll_interval=coerce_float(
+            payload.get("job_poll_interval"), 1.0, minimum=0.1
+        ),
     )
 
 # -----------------------------------------------------------------------------
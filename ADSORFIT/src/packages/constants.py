@@ -9,6 +9,7 @@ PROJECT_DIR = join(ROOT_DIR, "ADSORFIT")
 SETTING_PATH = join(PROJECT_DIR, "setup", "settings")
 RESOURCES_PATH = join(PROJECT_DIR, "resources")
 DATA_PATH = join(RESOURCES_PATH, "database")
+DATASETS_PATH = join(DATA_PATH, "datasets")
 CONFIG_PATH = join(RESOURCES_PATH, "configurations")
 LOGS_PATH = join(RESOURCES_PATH, "logs")
 TEMPLATES_PATH = join(RESOURCES_PATH, "templates")
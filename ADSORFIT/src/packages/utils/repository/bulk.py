@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from sqlalchemy.engine import Connection, Engine
+
+
+# -----------------------------------------------------------------------------
+def column_values(series: pd.Series) -> np.ndarray:
+    # Casting to object yields Python scalars, which every driver accepts;
+    # missing values become None so they are stored as NULL.
+    values = series.to_numpy(dtype=object, copy=True)
+    missing = series.isna().to_numpy()
+    if missing.any():
+        values[missing] = None
+    return values
+
+
+# -----------------------------------------------------------------------------
+def iterate_row_batches(
+    df: pd.DataFrame, batch_size: int
+) -> Iterator[list[tuple[Any, ...]]]:
+    """Stream the rows of a DataFrame as tuples built from its NumPy columns.
+
+    Keyword arguments:
+    df -- DataFrame whose rows are written.
+    batch_size -- Maximum number of rows per yielded batch.
+
+    Return value:
+    Iterator over lists of row tuples in column order. Each column is converted
+    once, so no per-row dictionaries are built.
+    """
+    columns = [column_values(df.iloc[:, index]) for index in range(df.shape[1])]
+    step = max(1, batch_size)
+    for start in range(0, df.shape[0], step):
+        yield list(zip(*(values[start : start + step] for values in columns)))
+
+
+# -----------------------------------------------------------------------------
+def build_insert_statement(
+    engine: Engine,
+    table_name: str,
+    columns: Sequence[str],
+    conflict_columns: Sequence[str] = (),
+) -> str:
+    # Raw driver SQL lets executemany reuse one prepared statement; the
+    # ON CONFLICT clause is shared by SQLite and PostgreSQL.
+    preparer = engine.dialect.identifier_preparer
+    marker = "?" if engine.dialect.paramstyle == "qmark" else "%s"
+    names = [preparer.quote(column) for column in columns]
+    statement = (
+        f"INSERT INTO {preparer.quote(table_name)} ({', '.join(names)}) "
+        f"VALUES ({', '.join([marker] * len(names))})"
+    )
+    if not conflict_columns:
+        return statement
+    target = ", ".join(preparer.quote(column) for column in conflict_columns)
+    updates = [
+        f"{name} = excluded.{name}"
+        for column, name in zip(columns, names, strict=True)
+        if column not in conflict_columns
+    ]
+    if not updates:
+        return f"{statement} ON CONFLICT ({target}) DO NOTHING"
+    return f"{statement} ON CONFLICT ({target}) DO UPDATE SET {', '.join(updates)}"
+
+
+# -----------------------------------------------------------------------------
+def insert_rows(
+    conn: Connection, statement: str, df: pd.DataFrame, batch_size: int
+) -> None:
+    # Batches only bound the tuples held in memory, the caller owns the
+    # transaction so the whole frame is committed once.
+    for rows in iterate_row_batches(df, batch_size):
+        conn.exec_driver_sql(statement, rows)
@@ -1,9 +1,10 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from typing import Any, Protocol
 
 import pandas as pd
+import sqlalchemy
 
 from ADSORFIT.src.packages.configurations import DatabaseSettings, configurations
 from ADSORFIT.src.packages.logger import logger
@@ -19,17 +20,81 @@ class DatabaseBackend(Protocol):
     engine: Any
 
     # -------------------------------------------------------------------------
-    def load_from_database(self, table_name: str) -> pd.DataFrame: ...
+    def load_from_database(
+        self, table_name: str, columns: list[str] | None = None
+    ) -> pd.DataFrame: ...
+
+    # -------------------------------------------------------------------------
+    def load_rows(
+        self,
+        table_name: str,
+        column: str,
+        values: list[Any],
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame: ...
+
+    # -------------------------------------------------------------------------
+    def load_in_chunks(
+        self,
+        table_name: str,
+        chunk_size: int,
+        order_by: list[str],
+        filters: dict[str, Any] | None = None,
+    ) -> Iterator[pd.DataFrame]: ...
+
+    # -------------------------------------------------------------------------
+    def delete_rows(self, table_name: str, column: str, values: list[Any]) -> None: ...
+
+    # -------------------------------------------------------------------------
+    def update_rows(
+        self,
+        table_name: str,
+        column: str,
+        values: list[Any],
+        assignments: dict[str, Any],
+    ) -> None: ...
+
+    # -------------------------------------------------------------------------
+    def copy_rows(
+        self,
+        table_name: str,
+        column: str,
+        values: list[Any],
+        filters: dict[str, Any],
+        overrides: dict[str, Any],
+    ) -> None: ...
+
+    # -------------------------------------------------------------------------
+    def insert_from_select(
+        self, table_name: str, columns: list[str], statement: sqlalchemy.Select
+    ) -> None: ...
+
+    # -------------------------------------------------------------------------
+    def clear_table(self, table_name: str) -> None: ...
 
     # -------------------------------------------------------------------------
     def save_into_database(self, df: pd.DataFrame, table_name: str) -> None: ...
 
+    # -------------------------------------------------------------------------
+    def append_into_database(self, df: pd.DataFrame, table_name: str) -> None: ...
+
     # -------------------------------------------------------------------------
     def upsert_into_database(self, df: pd.DataFrame, table_name: str) -> None: ...
 
     # -------------------------------------------------------------------------
     def count_rows(self, table_name: str) -> int: ...
 
+    # -------------------------------------------------------------------------
+    def read_query(self, statement: sqlalchemy.Select) -> pd.DataFrame: ...
+
+    # -------------------------------------------------------------------------
+    def count_distinct(
+        self,
+        table_name: str,
+        column: str,
+        filters: dict[str, Any] | None = None,
+    ) -> int: ...
+
 
 BackendFactory = Callable[[DatabaseSettings], DatabaseBackend]
 
@@ -72,13 +137,74 @@ class ADSORFITDatabase:
         return getattr(self.backend, "db_path", None)
 
     # -------------------------------------------------------------------------
-    def load_from_database(self, table_name: str) -> pd.DataFrame:
-        return self.backend.load_from_database(table_name)
+    def load_from_database(
+        self, table_name: str, columns: list[str] | None = None
+    ) -> pd.DataFrame:
+        return self.backend.load_from_database(table_name, columns)
+
+    # -------------------------------------------------------------------------
+    def load_rows(
+        self,
+        table_name: str,
+        column: str,
+        values: list[Any],
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        return self.backend.load_rows(table_name, column, values, columns)
+
+    # -------------------------------------------------------------------------
+    def load_in_chunks(
+        self,
+        table_name: str,
+        chunk_size: int,
+        order_by: list[str],
+        filters: dict[str, Any] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        return self.backend.load_in_chunks(table_name, chunk_size, order_by, filters)
+
+    # -------------------------------------------------------------------------
+    def delete_rows(self, table_name: str, column: str, values: list[Any]) -> None:
+        self.backend.delete_rows(table_name, column, values)
+
+    # -------------------------------------------------------------------------
+    def update_rows(
+        self,
+        table_name: str,
+        column: str,
+        values: list[Any],
+        assignments: dict[str, Any],
+    ) -> None:
+        self.backend.update_rows(table_name, column, values, assignments)
+
+    # -------------------------------------------------------------------------
+    def copy_rows(
+        self,
+        table_name: str,
+        column: str,
+        values: list[Any],
+        filters: dict[str, Any],
+        overrides: dict[str, Any],
+    ) -> None:
+        self.backend.copy_rows(table_name, column, values, filters, overrides)
+
+    # -------------------------------------------------------------------------
+    def insert_from_select(
+        self, table_name: str, columns: list[str], statement: sqlalchemy.Select
+    ) -> None:
+        self.backend.insert_from_select(table_name, columns, statement)
+
+    # -------------------------------------------------------------------------
+    def clear_table(self, table_name: str) -> None:
+        self.backend.clear_table(table_name)
 
     # -------------------------------------------------------------------------
     def save_into_database(self, df: pd.DataFrame, table_name: str) -> None:
         self.backend.save_into_database(df, table_name)
 
+    # -------------------------------------------------------------------------
+    def append_into_database(self, df: pd.DataFrame, table_name: str) -> None:
+        self.backend.append_into_database(df, table_name)
+
     # -------------------------------------------------------------------------
     def upsert_into_database(self, df: pd.DataFrame, table_name: str) -> None:
         self.backend.upsert_into_database(df, table_name)
@@ -86,6 +212,19 @@ class ADSORFITDatabase:
     # -------------------------------------------------------------------------
     def count_rows(self, table_name: str) -> int:
         return self.backend.count_rows(table_name)
+
+    # -------------------------------------------------------------------------
+    def read_query(self, statement: sqlalchemy.Select) -> pd.DataFrame:
+        return self.backend.read_query(statement)
+
+    # -------------------------------------------------------------------------
+    def count_distinct(
+        self,
+        table_name: str,
+        column: str,
+        filters: dict[str, Any] | None = None,
+    ) -> int:
+        return self.backend.count_distinct(table_name, column, filters)
    
 
 database = ADSORFITDatabase()
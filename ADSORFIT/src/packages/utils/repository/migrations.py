@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import pandas as pd
+import sqlalchemy
+from sqlalchemy import LargeBinary, inspect
+from sqlalchemy.engine import Engine
+
+from ADSORFIT.src.packages.logger import logger
+from ADSORFIT.src.packages.utils.repository.schema import Base
+from ADSORFIT.src.packages.utils.repository.vectors import (
+    VECTOR_COLUMNS,
+    VECTOR_TABLES,
+    encode_vector,
+    parse_legacy_vector,
+)
+
+# Rows written before results were versioned are grouped under one completed run
+LEGACY_RUN_ID = "legacy"
+# Indexes declared on these tables are also created on existing databases
+RUN_TABLES = (
+    "ADSORPTION_DATA",
+    "ADSORPTION_PROCESSED_DATA",
+    "ADSORPTION_FITTING_RESULTS",
+    "ADSORPTION_BEST_FIT",
+    "ADSORPTION_MODEL_FITS",
+    "ADSORPTION_BEST_MODELS",
+)
+
+
+# -----------------------------------------------------------------------------
+def apply_migrations(engine: Engine) -> None:
+    # Vector tables are rebuilt first, their rows are then assigned to a run
+    migrate_vector_columns(engine)
+    migrate_run_columns(engine)
+    migrate_run_metadata_columns(engine)
+    migrate_fit_cache_columns(engine)
+
+
+# -----------------------------------------------------------------------------
+def migrate_vector_columns(engine: Engine) -> None:
+    """Convert text vector columns created by older versions into BLOB columns.
+
+    Keyword arguments:
+    engine -- Engine bound to the database to migrate.
+
+    Return value:
+    None. Each table still declaring a text vector column is rebuilt from the
+    current schema inside one transaction, with its stored vectors re-encoded.
+    """
+    inspector = inspect(engine)
+    for table_name in VECTOR_TABLES:
+        if not inspector.has_table(table_name):
+            continue
+        declared = {
+            column["name"]: column["type"]
+            for column in inspector.get_columns(table_name)
+        }
+        legacy = [
+            name
+            for name in VECTOR_COLUMNS
+            if name in declared and not isinstance(declared[name], LargeBinary)
+        ]
+        if not legacy:
+            continue
+        table = Base.metadata.tables[table_name]
+        with engine.begin() as conn:
+            stored = pd.read_sql_table(table_name, conn)
+            for name in legacy:
+                stored[name] = [
+                    encode_vector(parse_legacy_vector(value))
+                    if isinstance(value, str)
+                    else value
+                    for value in stored[name]
+                ]
+            table.drop(conn)
+            table.create(conn)
+            kept = [name for name in stored.columns if name in table.c]
+            stored[kept].to_sql(table_name, conn, if_exists="append", index=False)
+        logger.info(
+            "Migrated %s rows of %s to binary vector storage",
+            stored.shape[0],
+            table_name,
+        )
+
+
+# -----------------------------------------------------------------------------
+def migrate_run_columns(engine: Engine) -> None:
+    """Add the run identifier to tables created before results were versioned.
+
+    Keyword arguments:
+    engine -- Engine bound to the database to migrate.
+
+    Return value:
+    None. Missing ``run_id`` columns and indexes are created, and rows without a
+    run are assigned to the completed legacy run so they stay visible as the
+    latest results until a new run completes.
+    """
+    runs = Base.metadata.tables["FITTING_RUNS"]
+    legacy_tables: list[str] = []
+    with engine.begin() as conn:
+        # Inspected through the open connection, engines may hold a single one
+        inspector = inspect(conn)
+        for table_name in RUN_TABLES:
+            if not inspector.has_table(table_name):
+                continue
+            table = Base.metadata.tables[table_name]
+            declared = {column["name"] for column in inspector.get_columns(table_name)}
+            if "run_id" not in declared:
+                conn.execute(
+                    sqlalchemy.text(
+                        f'ALTER TABLE "{table_name}" ADD COLUMN run_id VARCHAR'
+                    )
+                )
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
+            updated = conn.execute(
+                sqlalchemy.update(table)
+                .where(table.c.run_id.is_(None))
+                .values(run_id=LEGACY_RUN_ID)
+            )
+            if updated.rowcount:
+                legacy_tables.append(table_name)
+        if not legacy_tables:
+            return
+        registered = conn.execute(
+            sqlalchemy.select(runs.c.id).where(runs.c.run_id == LEGACY_RUN_ID)
+        ).first()
+        if registered is None:
+            conn.execute(
+                sqlalchemy.insert(runs).values(
+                    run_id=LEGACY_RUN_ID,
+                    status="completed",
+                    best_saved=int("ADSORPTION_BEST_FIT" in legacy_tables),
+                    created_at=0.0,
+                    finished_at=0.0,
+                )
+            )
+    logger.info(
+        "Assigned stored rows of %s to the legacy run", ", ".join(legacy_tables)
+    )
+
+
+# -----------------------------------------------------------------------------
+def migrate_run_metadata_columns(engine: Engine) -> None:
+    # Runs created before these columns existed stored their own measurements and
+    # have an unknown configuration, which NULL values already express
+    table = Base.metadata.tables["FITTING_RUNS"]
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        if not inspector.has_table(table.name):
+            return
+        declared = {column["name"] for column in inspector.get_columns(table.name)}
+        for name in ("source_run_id", "configuration_hash"):
+            if name not in declared:
+                conn.execute(
+                    sqlalchemy.text(
+                        f'ALTER TABLE "FITTING_RUNS" ADD COLUMN {name} VARCHAR'
+                    )
+                )
+        # The latest-run lookup relies on the status index
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
+# -----------------------------------------------------------------------------
+def migrate_fit_cache_columns(engine: Engine) -> None:
+    """Add the access timestamp used to evict fit cache entries by recency.
+
+    Keyword arguments:
+    engine -- Engine bound to the database to migrate.
+
+    Return value:
+    None. Entries cached before the column existed start from their creation
+    time, and the recency index is created.
+    """
+    table = Base.metadata.tables["ADSORPTION_FIT_CACHE"]
+    with engine.begin() as conn:
+        inspector = inspect(conn)
+        if not inspector.has_table(table.name):
+            return
+        declared = {column["name"] for column in inspector.get_columns(table.name)}
+        if "last_accessed" in declared:
+            return
+        conn.execute(
+            sqlalchemy.text(
+                f'ALTER TABLE "{table.name}" ADD COLUMN last_accessed FLOAT'
+            )
+        )
+        conn.execute(
+            sqlalchemy.update(table)
+            .where(table.c.last_accessed.is_(None))
+            .values(last_accessed=table.c.created_at)
+        )
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+    logger.info("Added access timestamps to the fit cache")
@@ -1,19 +1,87 @@
 from __future__ import annotations
 
+import io
 import urllib.parse
+from collections.abc import Iterator
 from typing import Any
 
 import pandas as pd
 import sqlalchemy
 from sqlalchemy import UniqueConstraint, inspect
-from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import Connection, Engine
 
 from ADSORFIT.src.packages.configurations import DatabaseSettings
 from ADSORFIT.src.packages.logger import logger
+from ADSORFIT.src.packages.utils.repository.bulk import (
+    build_insert_statement,
+    insert_rows,
+    iterate_row_batches,
+)
+from ADSORFIT.src.packages.utils.repository.migrations import apply_migrations
 from ADSORFIT.src.packages.utils.repository.schema import Base
 
+# COPY streams a text buffer per batch, so larger batches mostly save round trips
+POSTGRES_COPY_BATCH_FACTOR = 50
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
+# -----------------------------------------------------------------------------
+def format_copy_value(value: Any) -> str:
+    # Text format of COPY: tab separated, \N for NULL and backslash escapes
+    if value is None:
+        return "\\N"
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return "\\\\x" + bytes(value).hex()
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, float):
+        # NumPy scalars would otherwise render with their type name
+        return repr(float(value))
+    return str(value).translate(COPY_ESCAPES)
+
+
+# -----------------------------------------------------------------------------
+def copy_dataframe(
+    conn: Connection, df: pd.DataFrame, table_name: str, batch_size: int
+) -> bool:
+    """Write a DataFrame with COPY FROM STDIN on the connection's transaction.
+
+    Keyword arguments:
+    conn -- Open connection whose transaction receives the rows.
+    df -- DataFrame whose columns match the target table.
+    table_name -- Name of the target table.
+    batch_size -- Number of rows formatted into each COPY buffer.
+
+    Return value:
+    True when the rows were copied, False when the driver has no COPY support.
+    """
+    preparer = conn.dialect.identifier_preparer
+    columns = ", ".join(preparer.quote(str(column)) for column in df.columns)
+    statement = f"COPY {preparer.quote(table_name)} ({columns}) FROM STDIN"
+    cursor = conn.connection.dbapi_connection.cursor()
+    try:
+        batches = (
+            "".join(
+                "\t".join(format_copy_value(value) for value in row) + "\n"
+                for row in rows
+            )
+            for rows in iterate_row_batches(df, batch_size)
+        )
+        if hasattr(cursor, "copy_expert"):
+            # psycopg2
+            for payload in batches:
+                cursor.copy_expert(statement, io.StringIO(payload))
+        elif hasattr(cursor, "copy"):
+            # psycopg 3
+            with cursor.copy(statement) as copy:
+                for payload in batches:
+                    copy.write(payload)
+        else:
+            return False
+    finally:
+        cursor.close()
+    return True
+
 
 ###############################################################################
 class PostgresRepository:
@@ -48,8 +116,11 @@ class PostgresRepository:
             connect_args=connect_args,
             pool_pre_ping=True,
         )
-        self.Session = sessionmaker(bind=self.engine, future=True)
         self.insert_batch_size = settings.insert_batch_size
+        self.bulk_batch_size = settings.insert_batch_size
+        self.copy_batch_size = settings.insert_batch_size * POSTGRES_COPY_BATCH_FACTOR
+        Base.metadata.create_all(self.engine)
+        apply_migrations(self.engine)
 
     # -------------------------------------------------------------------------
     def get_table_class(self, table_name: str) -> Any:
@@ -61,51 +132,172 @@ class PostgresRepository:
     # -------------------------------------------------------------------------
     def upsert_dataframe(self, df: pd.DataFrame, table_cls) -> None:
         table = table_cls.__table__
-        session = self.Session()
-        try:
-            unique_cols = []
-            for uc in table.constraints:
-                if isinstance(uc, UniqueConstraint):
-                    unique_cols = uc.columns.keys()
-                    break
-            if not unique_cols:
-                raise ValueError(f"No unique constraint found for {table_cls.__name__}")
-            records = df.to_dict(orient="records")
-            for i in range(0, len(records), self.insert_batch_size):
-                batch = records[i : i + self.insert_batch_size]
-                if not batch:
-                    continue
-                stmt = insert(table).values(batch)
-                update_cols = {
-                    col: getattr(stmt.excluded, col)  # type: ignore[attr-defined]
-                    for col in batch[0]
-                    if col not in unique_cols
-                }
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=unique_cols, set_=update_cols
-                )
-                session.execute(stmt)
-                session.commit()
-        finally:
-            session.close()
+        unique_cols = []
+        for uc in table.constraints:
+            if isinstance(uc, UniqueConstraint):
+                unique_cols = uc.columns.keys()
+                break
+        if not unique_cols:
+            raise ValueError(f"No unique constraint found for {table_cls.__name__}")
+        statement = build_insert_statement(
+            self.engine, table.name, list(df.columns), unique_cols
+        )
+        with self.engine.begin() as conn:
+            insert_rows(conn, statement, df, self.bulk_batch_size)
 
     # -------------------------------------------------------------------------
-    def load_from_database(self, table_name: str) -> pd.DataFrame:
+    def load_from_database(
+        self, table_name: str, columns: list[str] | None = None
+    ) -> pd.DataFrame:
         with self.engine.connect() as conn:
             inspector = inspect(conn)
             if not inspector.has_table(table_name):
                 logger.warning("Table %s does not exist", table_name)
                 return pd.DataFrame()
-            data = pd.read_sql_table(table_name, conn)
+            data = pd.read_sql_table(table_name, conn, columns=columns)
         return data
 
+    # -------------------------------------------------------------------------
+    def load_rows(
+        self,
+        table_name: str,
+        column: str,
+        values: list[Any],
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        table = self.get_table_class(table_name).__table__
+        selected = [table.c[name] for name in columns] if columns else [table]
+        frames: list[pd.DataFrame] = []
+        with self.engine.connect() as conn:
+            for i in range(0, len(values), self.insert_batch_size):
+                batch = values[i : i + self.insert_batch_size]
+                stmt = sqlalchemy.select(*selected).where(table.c[column].in_(batch))
+                frames.append(pd.read_sql(stmt, conn))
+        if not frames:
+            return pd.DataFrame(columns=columns or list(table.columns.keys()))
+        return pd.concat(frames, ignore_index=True)
+
+    # -------------------------------------------------------------------------
+    def load_in_chunks(
+        self,
+        table_name: str,
+        chunk_size: int,
+        order_by: list[str],
+        filters: dict[str, Any] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        # Keyset pagination runs one short query per chunk, so no cursor stays
+        # open while the caller writes the processed chunk back.
+        table = self.get_table_class(table_name).__table__
+        keys = [table.c[column] for column in order_by]
+        last: list[Any] | None = None
+        while True:
+            stmt = sqlalchemy.select(table).order_by(*keys).limit(chunk_size)
+            for name, value in (filters or {}).items():
+                stmt = stmt.where(table.c[name] == value)
+            if last is not None:
+                stmt = stmt.where(sqlalchemy.tuple_(*keys) > sqlalchemy.tuple_(*last))
+            with self.engine.connect() as conn:
+                chunk = pd.read_sql(stmt, conn)
+            if chunk.empty:
+                return
+            yield chunk
+            if chunk.shape[0] < chunk_size:
+                return
+            last = [chunk[column].iloc[-1:].tolist()[0] for column in order_by]
+
+    # -------------------------------------------------------------------------
+    def delete_rows(self, table_name: str, column: str, values: list[Any]) -> None:
+        table = self.get_table_class(table_name).__table__
+        with self.engine.begin() as conn:
+            for i in range(0, len(values), self.insert_batch_size):
+                batch = values[i : i + self.insert_batch_size]
+                conn.execute(sqlalchemy.delete(table).where(table.c[column].in_(batch)))
+
+    # -------------------------------------------------------------------------
+    def update_rows(
+        self,
+        table_name: str,
+        column: str,
+        values: list[Any],
+        assignments: dict[str, Any],
+    ) -> None:
+        table = self.get_table_class(table_name).__table__
+        with self.engine.begin() as conn:
+            for i in range(0, len(values), self.insert_batch_size):
+                batch = values[i : i + self.insert_batch_size]
+                conn.execute(
+                    sqlalchemy.update(table)
+                    .where(table.c[column].in_(batch))
+                    .values(**assignments)
+                )
+
+    # -------------------------------------------------------------------------
+    def copy_rows(
+        self,
+        table_name: str,
+        column: str,
+        values: list[Any],
+        filters: dict[str, Any],
+        overrides: dict[str, Any],
+    ) -> None:
+        # Rows are duplicated with INSERT ... SELECT, so they never leave the
+        # database; the primary key is assigned anew.
+        table = self.get_table_class(table_name).__table__
+        copied = [item for item in table.columns if not item.primary_key]
+        selected = [
+            sqlalchemy.literal(overrides[item.name]).label(item.name)
+            if item.name in overrides
+            else item
+            for item in copied
+        ]
+        with self.engine.begin() as conn:
+            for i in range(0, len(values), self.insert_batch_size):
+                batch = values[i : i + self.insert_batch_size]
+                stmt = sqlalchemy.select(*selected).where(table.c[column].in_(batch))
+                for name, value in filters.items():
+                    stmt = stmt.where(table.c[name] == value)
+                conn.execute(
+                    sqlalchemy.insert(table).from_select(
+                        [item.name for item in copied], stmt
+                    )
+                )
+
+    # -------------------------------------------------------------------------
+    def insert_from_select(
+        self, table_name: str, columns: list[str], statement: sqlalchemy.Select
+    ) -> None:
+        table = self.get_table_class(table_name).__table__
+        with self.engine.begin() as conn:
+            conn.execute(sqlalchemy.insert(table).from_select(columns, statement))
+
+    # -------------------------------------------------------------------------
+    def clear_table(self, table_name: str) -> None:
+        with self.engine.begin() as conn:
+            inspector = inspect(conn)
+            if inspector.has_table(table_name):
+                conn.execute(sqlalchemy.text(f'DELETE FROM "{table_name}"'))
+
     # -------------------------------------------------------------------------
     def save_into_database(self, df: pd.DataFrame, table_name: str) -> None:
         with self.engine.begin() as conn:
             inspector = inspect(conn)
             if inspector.has_table(table_name):
                 conn.execute(sqlalchemy.text(f'DELETE FROM "{table_name}"'))
-            df.to_sql(table_name, conn, if_exists="append", index=False)
+            self.bulk_insert(conn, df, table_name)
+
+    # -------------------------------------------------------------------------
+    def append_into_database(self, df: pd.DataFrame, table_name: str) -> None:
+        with self.engine.begin() as conn:
+            self.bulk_insert(conn, df, table_name)
+
+    # -------------------------------------------------------------------------
+    def bulk_insert(self, conn: Connection, df: pd.DataFrame, table_name: str) -> None:
+        if df.empty:
+            return
+        if copy_dataframe(conn, df, table_name, self.copy_batch_size):
+            return
+        statement = build_insert_statement(self.engine, table_name, list(df.columns))
+        insert_rows(conn, statement, df, self.bulk_batch_size)
 
     # -------------------------------------------------------------------------
     def upsert_into_database(self, df: pd.DataFrame, table_name: str) -> None:
@@ -120,3 +312,27 @@ class PostgresRepository:
             )
             value = result.scalar() or 0
         return int(value)
+
+    # -------------------------------------------------------------------------
+    def read_query(self, statement: sqlalchemy.Select) -> pd.DataFrame:
+        with self.engine.connect() as conn:
+            return pd.read_sql(statement, conn)
+
+    # -------------------------------------------------------------------------
+    def count_distinct(
+        self,
+        table_name: str,
+        column: str,
+        filters: dict[str, Any] | None = None,
+    ) -> int:
+        table = self.get_table_class(table_name).__table__
+        stmt = sqlalchemy.select(
+            sqlalchemy.func.count(sqlalchemy.distinct(table.c[column]))
+        )
+        for name, value in (filters or {}).items():
+            stmt = stmt.where(table.c[name] == value)
+        with self.engine.connect() as conn:
+            if not inspect(conn).has_table(table_name):
+                return 0
+            value = conn.execute(stmt).scalar() or 0
+        return int(value)
@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import sqlalchemy
+
+from ADSORFIT.src.packages.utils.repository.schema import (
+    AdsorptionProcessedData,
+    Base,
+)
+
+# Labels of the keyset columns appended to every page query
+SORT_KEY = "page_sort_key"
+ROW_KEY = "page_row_key"
+# Strings starting with a prefix sort below the prefix followed by this character
+PREFIX_UPPER_BOUND = "\U0010ffff"
+PROCESSED_FIELDS = (
+    "temperature [K]",
+    "measurement_count",
+    "min_pressure",
+    "max_pressure",
+    "min_uptake",
+    "max_uptake",
+)
+VECTOR_FIELDS = ("pressure [Pa]", "uptake [mol/g]")
+
+
+###############################################################################
+@dataclass(frozen=True)
+class ResultsView:
+    table_name: str
+    default_fields: tuple[str, ...]
+    sort_fields: tuple[str, ...]
+    model_field: str
+    lss_field: str
+
+    # -------------------------------------------------------------------------
+    @property
+    def fields(self) -> tuple[str, ...]:
+        return (*self.default_fields, *VECTOR_FIELDS)
+
+
+RESULT_VIEWS = {
+    "fits": ResultsView(
+        table_name="ADSORPTION_MODEL_FITS",
+        default_fields=(
+            "experiment",
+            "model",
+            "lss",
+            "parameter_names",
+            "parameters",
+            "errors",
+            *PROCESSED_FIELDS,
+        ),
+        sort_fields=("experiment", "temperature [K]", "lss"),
+        model_field="model",
+        lss_field="lss",
+    ),
+    "best": ResultsView(
+        table_name="ADSORPTION_BEST_MODELS",
+        default_fields=(
+            "experiment",
+            "best model",
+            "best LSS",
+            "worst model",
+            "worst LSS",
+            *PROCESSED_FIELDS,
+        ),
+        sort_fields=("experiment", "temperature [K]", "best LSS"),
+        model_field="best model",
+        lss_field="best LSS",
+    ),
+}
+
+
+###############################################################################
+@dataclass(frozen=True)
+class ResultsQuery:
+    limit: int
+    run_id: str | None = None
+    columns: tuple[str, ...] = ()
+    sort: str = "experiment"
+    descending: bool = False
+    cursor: str | None = None
+    experiment_prefix: str | None = None
+    min_temperature: float | None = None
+    max_temperature: float | None = None
+    model: str | None = None
+    max_lss: float | None = None
+
+
+###############################################################################
+@dataclass(frozen=True)
+class ResultsPage:
+    run_id: str | None
+    rows: pd.DataFrame
+    next_cursor: str | None
+
+
+# -----------------------------------------------------------------------------
+def validate_query(view: ResultsView, query: ResultsQuery) -> None:
+    unknown = [name for name in query.columns if name not in view.fields]
+    if unknown:
+        raise ValueError(f"Unknown result columns: {', '.join(unknown)}")
+    if query.sort not in view.sort_fields:
+        raise ValueError(
+            f"Results can only be sorted by {', '.join(view.sort_fields)}."
+        )
+
+
+# -----------------------------------------------------------------------------
+def encode_cursor(query: ResultsQuery, sort_value: Any, row_id: Any) -> str:
+    # The cursor records the sort order it was issued for, so it cannot be
+    # replayed against a different ordering.
+    if isinstance(sort_value, np.generic):
+        sort_value = sort_value.item()
+    payload = json.dumps([query.sort, query.descending, sort_value, int(row_id)])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+# -----------------------------------------------------------------------------
+def decode_cursor(query: ResultsQuery) -> tuple[Any, int]:
+    try:
+        payload = base64.urlsafe_b64decode(str(query.cursor).encode("ascii"))
+        sort, descending, sort_value, row_id = json.loads(payload)
+        row_id = int(row_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as exc:
+        raise ValueError("Invalid results page cursor.") from exc
+    if sort != query.sort or descending != query.descending:
+        raise ValueError("The page cursor was issued for a different sort order.")
+    return sort_value, row_id
+
+
+# -----------------------------------------------------------------------------
+def build_page_statement(view: ResultsView, query: ResultsQuery) -> sqlalchemy.Select:
+    """Translate a results query into one keyset-paginated SELECT statement.
+
+    Keyword arguments:
+    view -- Results view describing the queried table and its fields.
+    query -- Run, filters, projection, ordering and cursor of the requested page.
+
+    Return value:
+    Statement returning at most ``limit + 1`` rows; the extra row only signals
+    that another page follows. Rows are ordered by the sort field and the
+    primary key, and the cursor resumes after the last returned pair, so the
+    database seeks through the run indexes instead of skipping an offset.
+    """
+    table = Base.metadata.tables[view.table_name]
+    processed = AdsorptionProcessedData.__table__
+
+    def column(name: str) -> sqlalchemy.ColumnElement:
+        return table.c[name] if name in table.c else processed.c[name]
+
+    joined = table.join(
+        processed,
+        sqlalchemy.and_(
+            processed.c.run_id == table.c.run_id,
+            processed.c.experiment == table.c.experiment,
+        ),
+        isouter=True,
+    )
+    sort_column = column(query.sort)
+    fields = query.columns or view.default_fields
+    selected = [column(name).label(name) for name in fields]
+    statement = (
+        sqlalchemy.select(
+            *selected,
+            sort_column.label(SORT_KEY),
+            table.c.id.label(ROW_KEY),
+        )
+        .select_from(joined)
+        .where(table.c.run_id == query.run_id)
+    )
+    if query.experiment_prefix:
+        prefix = query.experiment_prefix
+        # The range lets the (run_id, experiment) indexes narrow the scan, while
+        # the LIKE clause keeps the match exact
+        statement = statement.where(
+            table.c.experiment >= prefix,
+            table.c.experiment < prefix + PREFIX_UPPER_BOUND,
+            table.c.experiment.startswith(prefix, autoescape=True),
+        )
+    temperature = column("temperature [K]")
+    if query.min_temperature is not None:
+        statement = statement.where(temperature >= query.min_temperature)
+    if query.max_temperature is not None:
+        statement = statement.where(temperature <= query.max_temperature)
+    if query.model:
+        statement = statement.where(column(view.model_field) == query.model)
+    if query.max_lss is not None:
+        statement = statement.where(column(view.lss_field) <= query.max_lss)
+    if query.sort != "experiment":
+        # Keyset comparisons cannot step over NULL, unscored rows are left out
+        statement = statement.where(sort_column.is_not(None))
+
+    if query.cursor:
+        sort_value, row_id = decode_cursor(query)
+        if query.descending:
+            after = sort_column < sort_value
+            tie = table.c.id < row_id
+        else:
+            after = sort_column > sort_value
+            tie = table.c.id > row_id
+        statement = statement.where(
+            sqlalchemy.or_(after, sqlalchemy.and_(sort_column == sort_value, tie))
+        )
+    if query.descending:
+        order = (sort_column.desc(), table.c.id.desc())
+    else:
+        order = (sort_column.asc(), table.c.id.asc())
+    return statement.order_by(*order).limit(query.limit + 1)
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from sqlalchemy import BigInteger, Column, Float, Integer, String, UniqueConstraint
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Float,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    UniqueConstraint,
+)
 from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
@@ -10,10 +19,11 @@ Base = declarative_base()
 class AdsorptionBestFit(Base):
     __tablename__ = "ADSORPTION_BEST_FIT"
     id = Column(Integer, primary_key=True)
+    run_id = Column(String)
     experiment = Column(String)
     temperature_K = Column("temperature [K]", BigInteger)
-    pressure_Pa = Column("pressure [Pa]", String)
-    uptake_mol_g = Column("uptake [mol/g]", String)
+    pressure_Pa = Column("pressure [Pa]", LargeBinary)
+    uptake_mol_g = Column("uptake [mol/g]", LargeBinary)
     measurement_count = Column(BigInteger)
     min_pressure = Column(Float)
     max_pressure = Column(Float)
@@ -43,28 +53,70 @@ class AdsorptionBestFit(Base):
     temkin_beta_error = Column("Temkin beta error", Float)
     best_model = Column("best model", String)
     worst_model = Column("worst model", String)
-    __table_args__ = (UniqueConstraint("id"),)
+    __table_args__ = (
+        UniqueConstraint("id"),
+        Index("ix_best_fit_run_experiment", "run_id", "experiment"),
+    )
+
+
+###############################################################################
+class AdsorptionBestModel(Base):
+    __tablename__ = "ADSORPTION_BEST_MODELS"
+    id = Column(Integer, primary_key=True)
+    run_id = Column(String)
+    experiment = Column(String)
+    best_model = Column("best model", String)
+    best_lss = Column("best LSS", Float)
+    worst_model = Column("worst model", String)
+    worst_lss = Column("worst LSS", Float)
+    __table_args__ = (
+        UniqueConstraint("id"),
+        Index("ix_best_models_run_experiment", "run_id", "experiment"),
+        Index("ix_best_models_run_best_model", "run_id", "best model", "experiment"),
+        Index("ix_best_models_run_best_lss", "run_id", "best LSS"),
+    )
 
 
 ###############################################################################
 class AdsorptionData(Base):
     __tablename__ = "ADSORPTION_DATA"
     id = Column(Integer, primary_key=True)
+    run_id = Column(String)
     experiment = Column(String)
     temperature_K = Column("temperature [K]", BigInteger)
     pressure_Pa = Column("pressure [Pa]", Float)
     uptake_mol_g = Column("uptake [mol/g]", Float)
-    __table_args__ = (UniqueConstraint("id"),)
+    __table_args__ = (
+        UniqueConstraint("id"),
+        Index("ix_data_run_experiment", "run_id", "experiment"),
+    )
+
+
+###############################################################################
+class AdsorptionFitCache(Base):
+    __tablename__ = "ADSORPTION_FIT_CACHE"
+    id = Column(Integer, primary_key=True)
+    cache_key = Column(String, nullable=False)
+    model = Column(String)
+    result = Column(String)
+    payload_size = Column(BigInteger)
+    created_at = Column(Float)
+    last_accessed = Column(Float)
+    __table_args__ = (
+        UniqueConstraint("cache_key"),
+        Index("ix_fit_cache_last_accessed", "last_accessed"),
+    )
 
 
 ###############################################################################
 class AdsorptionFittingResults(Base):
     __tablename__ = "ADSORPTION_FITTING_RESULTS"
     id = Column(Integer, primary_key=True)
+    run_id = Column(String)
     experiment = Column(String)
     temperature_K = Column("temperature [K]", BigInteger)
-    pressure_Pa = Column("pressure [Pa]", String)
-    uptake_mol_g = Column("uptake [mol/g]", String)
+    pressure_Pa = Column("pressure [Pa]", LargeBinary)
+    uptake_mol_g = Column("uptake [mol/g]", LargeBinary)
     measurement_count = Column(BigInteger)
     min_pressure = Column(Float)
     max_pressure = Column(Float)
@@ -92,20 +144,86 @@ class AdsorptionFittingResults(Base):
     temkin_k_error = Column("Temkin k error", Float)
     temkin_beta = Column("Temkin beta", Float)
     temkin_beta_error = Column("Temkin beta error", Float)
-    __table_args__ = (UniqueConstraint("id"),)
+    __table_args__ = (
+        UniqueConstraint("id"),
+        Index("ix_fitting_results_run_experiment", "run_id", "experiment"),
+    )
+
+
+###############################################################################
+class AdsorptionModelFit(Base):
+    __tablename__ = "ADSORPTION_MODEL_FITS"
+    id = Column(Integer, primary_key=True)
+    run_id = Column(String)
+    experiment = Column(String)
+    model = Column(String)
+    lss = Column(Float)
+    parameter_names = Column(String)
+    parameters = Column(LargeBinary)
+    errors = Column(LargeBinary)
+    __table_args__ = (
+        UniqueConstraint("id"),
+        Index("ix_model_fits_run_experiment_model", "run_id", "experiment", "model"),
+        Index("ix_model_fits_run_model", "run_id", "model"),
+        Index("ix_model_fits_run_lss", "run_id", "lss"),
+    )
 
 
 ###############################################################################
 class AdsorptionProcessedData(Base):
     __tablename__ = "ADSORPTION_PROCESSED_DATA"
     id = Column(Integer, primary_key=True)
+    run_id = Column(String)
     experiment = Column(String)
     temperature_K = Column("temperature [K]", BigInteger)
-    pressure_Pa = Column("pressure [Pa]", String)
-    uptake_mol_g = Column("uptake [mol/g]", String)
+    pressure_Pa = Column("pressure [Pa]", LargeBinary)
+    uptake_mol_g = Column("uptake [mol/g]", LargeBinary)
     measurement_count = Column(BigInteger)
     min_pressure = Column(Float)
     max_pressure = Column(Float)
     min_uptake = Column(Float)
     max_uptake = Column(Float)
-    __table_args__ = (UniqueConstraint("id"),)
+    __table_args__ = (
+        UniqueConstraint("id"),
+        Index("ix_processed_data_run_experiment", "run_id", "experiment"),
+        Index("ix_processed_data_run_temperature", "run_id", "temperature [K]"),
+    )
+
+
+###############################################################################
+class FittingRun(Base):
+    __tablename__ = "FITTING_RUNS"
+    id = Column(Integer, primary_key=True)
+    run_id = Column(String, nullable=False)
+    status = Column(String)
+    best_saved = Column(Integer)
+    created_at = Column(Float)
+    finished_at = Column(Float)
+    # Runs fitted from stored measurements reference the run owning them
+    source_run_id = Column(String)
+    # Fingerprint of the models, bounds, guesses and settings the run fitted with
+    configuration_hash = Column(String)
+    __table_args__ = (
+        UniqueConstraint("run_id"),
+        Index("ix_fitting_runs_status_finished", "status", "finished_at"),
+    )
+
+
+###############################################################################
+class FittingJob(Base):
+    __tablename__ = "FITTING_JOBS"
+    id = Column(Integer, primary_key=True)
+    job_id = Column(String, nullable=False)
+    status = Column(String)
+    completed = Column(BigInteger)
+    total = Column(BigInteger)
+    cancel_requested = Column(Integer)
+    submitted_at = Column(Float)
+    started_at = Column(Float)
+    finished_at = Column(Float)
+    updated_at = Column(Float)
+    error = Column(String)
+    result = Column(String)
+    persisted = Column(Integer)
+    persist_error = Column(String)
+    __table_args__ = (UniqueConstraint("job_id"),)
@@ -1,98 +1,530 @@
 from __future__ import annotations
 
+import json
+import math
+import time
+import uuid
+from collections.abc import Iterator, Sequence
+from dataclasses import replace
 from typing import Any
 
+import numpy as np
 import pandas as pd
+import sqlalchemy
 
+from ADSORFIT.src.packages.logger import logger
 from ADSORFIT.src.packages.utils.repository.database import database
+from ADSORFIT.src.packages.utils.repository.queries import (
+    RESULT_VIEWS,
+    ROW_KEY,
+    SORT_KEY,
+    ResultsPage,
+    ResultsQuery,
+    build_page_statement,
+    encode_cursor,
+    validate_query,
+)
+from ADSORFIT.src.packages.utils.repository.schema import (
+    AdsorptionFitCache,
+    AdsorptionModelFit,
+    FittingRun,
+)
+from ADSORFIT.src.packages.utils.repository.vectors import (
+    MODEL_FIT_VECTOR_COLUMNS,
+    VECTOR_COLUMNS,
+    decode_vector,
+    encode_vector,
+)
+
+BEST_MODEL_COLUMNS = [
+    "experiment",
+    "best model",
+    "best LSS",
+    "worst model",
+    "worst LSS",
+]
 
 
 ###############################################################################
 class DataSerializer:
     
     # -------------------------------------------------------------------------
-    def save_raw_dataset(self, dataset: pd.DataFrame) -> None:
-        database.save_into_database(dataset, "ADSORPTION_DATA")
+    def create_run(
+        self,
+        save_best: bool,
+        source_run_id: str | None = None,
+        configuration_hash: str | None = None,
+    ) -> str:
+        # Rows of a run stay hidden from the latest view until it completes
+        run_id = uuid.uuid4().hex
+        database.upsert_into_database(
+            pd.DataFrame(
+                [
+                    {
+                        "run_id": run_id,
+                        "status": "running",
+                        "best_saved": int(save_best),
+                        "created_at": time.time(),
+                        "source_run_id": source_run_id,
+                        "configuration_hash": configuration_hash,
+                    }
+                ]
+            ),
+            "FITTING_RUNS",
+        )
+        return run_id
+
+    # -------------------------------------------------------------------------
+    def finish_run(self, run_id: str, status: str = "completed") -> None:
+        # Best models are stored before the run becomes visible as completed
+        if status == "completed":
+            self.materialize_best_models(run_id)
+        database.upsert_into_database(
+            pd.DataFrame(
+                [{"run_id": run_id, "status": status, "finished_at": time.time()}]
+            ),
+            "FITTING_RUNS",
+        )
+
+    # -------------------------------------------------------------------------
+    def latest_run_id(self, with_best: bool = False) -> str | None:
+        """Identify the most recently completed fitting run.
+
+        Keyword arguments:
+        with_best -- Only consider runs that stored a best model selection.
+
+        Return value:
+        Run identifier, or None when no run has completed yet.
+        """
+        # Resolved by the database through the status index, one row is read back
+        table = FittingRun.__table__
+        statement = sqlalchemy.select(table.c.run_id).where(
+            table.c.status == "completed"
+        )
+        if with_best:
+            statement = statement.where(table.c.best_saved == 1)
+        statement = statement.order_by(
+            table.c.finished_at.desc(), table.c.id.desc()
+        ).limit(1)
+        latest = database.read_query(statement)
+        if latest.empty:
+            return None
+        return str(latest["run_id"].iloc[0])
+
+    # -------------------------------------------------------------------------
+    def tag_run(self, dataset: pd.DataFrame, run_id: str) -> pd.DataFrame:
+        tagged = dataset.copy(deep=False)
+        tagged["run_id"] = run_id
+        return tagged
+
+    # -------------------------------------------------------------------------
+    def load_run_rows(
+        self, table_name: str, run_id: str | None, columns: list[str] | None = None
+    ) -> pd.DataFrame:
+        if run_id is None:
+            return pd.DataFrame(columns=columns)
+        return database.load_rows(table_name, "run_id", [run_id], columns)
+
+    # -------------------------------------------------------------------------
+    def save_raw_dataset(self, dataset: pd.DataFrame, run_id: str) -> None:
+        database.append_into_database(self.tag_run(dataset, run_id), "ADSORPTION_DATA")
+
+    # -------------------------------------------------------------------------
+    def raw_run_id(self, run_id: str | None) -> str | None:
+        """Resolve the run whose rows in ``ADSORPTION_DATA`` hold a run's input.
+
+        Keyword arguments:
+        run_id -- Fitting run identifier.
+
+        Return value:
+        The source run for runs fitted from stored measurements, which do not copy
+        them, otherwise ``run_id`` itself.
+        """
+        if run_id is None:
+            return None
+        record = self.load_run(run_id)
+        if record is None or not record.get("source_run_id"):
+            return run_id
+        return str(record["source_run_id"])
+
+    # -------------------------------------------------------------------------
+    def load_run(self, run_id: str) -> dict[str, Any] | None:
+        stored = database.load_rows("FITTING_RUNS", "run_id", [run_id])
+        if stored.empty:
+            return None
+        record: dict[str, Any] = {}
+        for key, value in stored.iloc[0].to_dict().items():
+            value = value.item() if hasattr(value, "item") else value
+            record[key] = (
+                None if isinstance(value, float) and math.isnan(value) else value
+            )
+        return record
 
     # -------------------------------------------------------------------------
-    def load_raw_dataset(self) -> pd.DataFrame:
-        return database.load_from_database("ADSORPTION_DATA")
+    def load_raw_dataset(self, run_id: str | None = None) -> pd.DataFrame:
+        return self.load_run_rows(
+            "ADSORPTION_DATA", self.raw_run_id(run_id or self.latest_run_id())
+        )
 
     # -------------------------------------------------------------------------
-    def save_processed_dataset(self, dataset: pd.DataFrame) -> None:
-        database.save_into_database(dataset, "ADSORPTION_PROCESSED_DATA")
+    def save_processed_dataset(self, dataset: pd.DataFrame, run_id: str) -> None:
+        database.append_into_database(
+            self.tag_run(dataset, run_id), "ADSORPTION_PROCESSED_DATA"
+        )
 
     # -------------------------------------------------------------------------
-    def load_processed_dataset(self) -> pd.DataFrame:
-        encoded = database.load_from_database("ADSORPTION_PROCESSED_DATA")
+    def load_processed_dataset(self, run_id: str | None = None) -> pd.DataFrame:
+        encoded = self.load_run_rows(
+            "ADSORPTION_PROCESSED_DATA", run_id or self.latest_run_id()
+        )
+        # Drivers may return BLOBs as memoryviews, which cannot be hashed
+        for column in VECTOR_COLUMNS:
+            if column in encoded.columns:
+                encoded[column] = [
+                    bytes(value) if isinstance(value, memoryview) else value
+                    for value in encoded[column]
+                ]
         return encoded
 
     # -------------------------------------------------------------------------
-    def save_fitting_results(self, dataset: pd.DataFrame) -> None:
-        encoded = self.convert_lists_to_strings(dataset)
-        database.save_into_database(encoded, "ADSORPTION_FITTING_RESULTS")
+    def save_model_fits(self, dataset: pd.DataFrame, run_id: str) -> None:
+        encoded = self.tag_run(self.encode_vector_columns(dataset), run_id)
+        database.append_into_database(encoded, "ADSORPTION_MODEL_FITS")
 
     # -------------------------------------------------------------------------
-    def load_fitting_results(self) -> pd.DataFrame:
-        encoded = database.load_from_database("ADSORPTION_FITTING_RESULTS")
+    def load_model_fits(self, run_id: str | None = None) -> pd.DataFrame:
+        encoded = self.load_run_rows(
+            "ADSORPTION_MODEL_FITS", run_id or self.latest_run_id()
+        )
         if encoded.empty:
             return encoded
-        return self.convert_strings_to_lists(encoded)
+        return self.decode_vector_columns(encoded, MODEL_FIT_VECTOR_COLUMNS)
 
     # -------------------------------------------------------------------------
-    def save_best_fit(self, dataset: pd.DataFrame) -> None:
-        encoded = self.convert_lists_to_strings(dataset)
-        database.save_into_database(encoded, "ADSORPTION_BEST_FIT")
+    def best_models_statement(self, run_id: str) -> sqlalchemy.Select:
+        """Build the query selecting the best and worst model of every experiment.
+
+        Keyword arguments:
+        run_id -- Run whose model fits are ranked.
+
+        Return value:
+        Statement returning ``BEST_MODEL_COLUMNS``, one row per experiment. Models
+        are ranked with window functions over ``ADSORPTION_MODEL_FITS``, ties
+        resolve by model name.
+        """
+        fits = AdsorptionModelFit.__table__
+        ranked = (
+            sqlalchemy.select(
+                fits.c.experiment,
+                fits.c.model,
+                fits.c.lss,
+                sqlalchemy.func.row_number()
+                .over(
+                    partition_by=fits.c.experiment,
+                    order_by=(fits.c.lss.asc(), fits.c.model),
+                )
+                .label("best_rank"),
+                sqlalchemy.func.row_number()
+                .over(
+                    partition_by=fits.c.experiment,
+                    order_by=(fits.c.lss.desc(), fits.c.model),
+                )
+                .label("worst_rank"),
+            )
+            .where(fits.c.run_id == run_id, fits.c.lss.is_not(None))
+            .subquery()
+        )
+        selected = [
+            sqlalchemy.func.max(
+                sqlalchemy.case((ranked.c[rank] == 1, ranked.c[source]))
+            ).label(label)
+            for label, rank, source in (
+                ("best model", "best_rank", "model"),
+                ("best LSS", "best_rank", "lss"),
+                ("worst model", "worst_rank", "model"),
+                ("worst LSS", "worst_rank", "lss"),
+            )
+        ]
+        return sqlalchemy.select(ranked.c.experiment, *selected).group_by(
+            ranked.c.experiment
+        )
 
     # -------------------------------------------------------------------------
-    def load_best_fit(self) -> pd.DataFrame:
-        encoded = database.load_from_database("ADSORPTION_BEST_FIT")
-        if encoded.empty:
-            return encoded
-        return self.convert_strings_to_lists(encoded)
-
-    # -------------------------------------------------------------------------
-    def convert_list_to_string(self, value: Any) -> Any:
-        if isinstance(value, (list, tuple)):
-            parts: list[str] = []
-            for element in value:
-                if element is None:
-                    continue
-                text = str(element)
-                if text:
-                    parts.append(text)
-            return ",".join(parts)
-        return value
-
-    # -------------------------------------------------------------------------
-    def convert_string_to_list(self, value: Any) -> Any:
-        if isinstance(value, str):
-            stripped = value.strip()
-            if not stripped:
-                return []
-            parts = [segment.strip() for segment in stripped.split(",")]
-            converted: list[float] = []
-            for part in parts:
-                if not part:
-                    continue
-                try:
-                    converted.append(float(part))
-                except ValueError:
-                    return value
-            return converted
-        return value
-
-    # -------------------------------------------------------------------------
-    def convert_lists_to_strings(self, dataset: pd.DataFrame) -> pd.DataFrame:
-        converted = dataset.copy()
-        for column in converted.columns:
-            converted[column] = converted[column].apply(self.convert_list_to_string)
-        return converted
+    def load_best_models(self, run_id: str | None = None) -> pd.DataFrame:
+        run_id = run_id or self.latest_run_id()
+        if run_id is None:
+            return pd.DataFrame(columns=BEST_MODEL_COLUMNS)
+        return database.read_query(self.best_models_statement(run_id))
+
+    # -------------------------------------------------------------------------
+    def materialize_best_models(self, run_id: str) -> None:
+        # Paginated best-fit queries read these rows through their indexes
+        # instead of ranking every model fit of the run on each request.
+        ranked = self.best_models_statement(run_id).subquery()
+        database.insert_from_select(
+            "ADSORPTION_BEST_MODELS",
+            ["run_id", *BEST_MODEL_COLUMNS],
+            sqlalchemy.select(
+                sqlalchemy.literal(run_id).label("run_id"),
+                *[ranked.c[name] for name in BEST_MODEL_COLUMNS],
+            ),
+        )
+
+    # -------------------------------------------------------------------------
+    def load_results_page(self, view_name: str, query: ResultsQuery) -> ResultsPage:
+        """Fetch one page of stored results with filters evaluated in SQL.
+
+        Keyword arguments:
+        view_name -- Either ``fits`` for one row per experiment and model, or
+        ``best`` for the best and worst model of every experiment.
+        query -- Run, filters, projection, ordering and cursor of the page.
+
+        Return value:
+        Page holding the resolved run, its rows with only the returned vectors
+        decoded, and the cursor of the next page when more rows match.
+        """
+        view = RESULT_VIEWS[view_name]
+        validate_query(view, query)
+        if query.run_id is None:
+            query = replace(
+                query, run_id=self.latest_run_id(with_best=view_name == "best")
+            )
+        if query.run_id is None:
+            columns = list(query.columns or view.default_fields)
+            return ResultsPage(None, pd.DataFrame(columns=columns), None)
+        rows = database.read_query(build_page_statement(view, query))
+        next_cursor = None
+        if rows.shape[0] > query.limit:
+            rows = rows.iloc[: query.limit]
+            last = rows.iloc[-1]
+            next_cursor = encode_cursor(query, last[SORT_KEY], last[ROW_KEY])
+        rows = rows.drop(columns=[SORT_KEY, ROW_KEY])
+        rows = self.decode_vector_columns(
+            rows, (*VECTOR_COLUMNS, *MODEL_FIT_VECTOR_COLUMNS)
+        )
+        return ResultsPage(query.run_id, rows, next_cursor)
+
+    # -------------------------------------------------------------------------
+    def has_model_fits(self, run_id: str) -> bool:
+        # Runs stored before the long-format table only hold the wide tables
+        filters = {"run_id": run_id}
+        return database.count_distinct("ADSORPTION_MODEL_FITS", "model", filters) > 0
+
+    # -------------------------------------------------------------------------
+    def load_fitting_results(self, run_id: str | None = None) -> pd.DataFrame:
+        # The wide layout is an export rebuilt on demand from the long table
+        run_id = run_id or self.latest_run_id()
+        if run_id is None or not self.has_model_fits(run_id):
+            encoded = self.load_run_rows("ADSORPTION_FITTING_RESULTS", run_id)
+            return encoded if encoded.empty else self.decode_vector_columns(encoded)
+        processed = self.decode_vector_columns(self.load_processed_dataset(run_id))
+        return self.pivot_model_fits(processed, self.load_model_fits(run_id))
+
+    # -------------------------------------------------------------------------
+    def load_best_fit(self, run_id: str | None = None) -> pd.DataFrame:
+        # Runs that skipped the best model selection leave the previous one visible
+        run_id = run_id or self.latest_run_id(with_best=True)
+        if run_id is None or not self.has_model_fits(run_id):
+            encoded = self.load_run_rows("ADSORPTION_BEST_FIT", run_id)
+            return encoded if encoded.empty else self.decode_vector_columns(encoded)
+        best = self.load_best_models(run_id)
+        return self.load_fitting_results(run_id).merge(
+            best[["experiment", "best model", "worst model"]],
+            on="experiment",
+            how="left",
+        )
 
     # -------------------------------------------------------------------------
-    def convert_strings_to_lists(self, dataset: pd.DataFrame) -> pd.DataFrame:
-        converted = dataset.copy()
+    def pivot_model_fits(
+        self, processed: pd.DataFrame, fits: pd.DataFrame
+    ) -> pd.DataFrame:
+        """Expand long-format model fits into the wide results layout.
+
+        Keyword arguments:
+        processed -- Processed rows of the run, one per experiment.
+        fits -- Rows of ``ADSORPTION_MODEL_FITS`` for the same run.
+
+        Return value:
+        Processed rows extended with ``<model> LSS``, ``<model> <parameter>`` and
+        ``<model> <parameter> error`` columns, as produced during fitting.
+        """
+        wide = processed.drop(columns=["id", "run_id"], errors="ignore")
+        positions = pd.Index(wide["experiment"])
+        for model, group in fits.groupby("model", sort=False):
+            rows = positions.get_indexer(group["experiment"])
+            group = group[rows >= 0]
+            rows = rows[rows >= 0]
+            if group.empty:
+                continue
+            columns = {f"{model} LSS": group["lss"].to_numpy(dtype=np.float64)}
+            names = str(group["parameter_names"].iloc[0]).split(",")
+            parameters = np.vstack(group["parameters"].to_list())
+            errors = np.vstack(group["errors"].to_list())
+            for index, name in enumerate(name for name in names if name):
+                columns[f"{model} {name}"] = parameters[:, index]
+                columns[f"{model} {name} error"] = errors[:, index]
+            # Experiments without a fit of this model keep NaN scores
+            for column, values in columns.items():
+                expanded = np.full(wide.shape[0], np.nan)
+                expanded[rows] = values
+                wide[column] = expanded
+        return wide
+
+    # -------------------------------------------------------------------------
+    def iterate_raw_dataset(
+        self, chunk_rows: int, run_id: str
+    ) -> Iterator[pd.DataFrame]:
+        # Measurements are read grouped by experiment and in insertion order
+        return database.load_in_chunks(
+            "ADSORPTION_DATA", chunk_rows, ["experiment", "id"], {"run_id": run_id}
+        )
+
+    # -------------------------------------------------------------------------
+    def count_raw_experiments(self, run_id: str) -> int:
+        return database.count_distinct(
+            "ADSORPTION_DATA", "experiment", {"run_id": run_id}
+        )
+
+    # -------------------------------------------------------------------------
+    def load_fitted_experiments(self, run_id: str | None = None) -> set[str]:
+        stored = self.load_run_rows(
+            "ADSORPTION_MODEL_FITS",
+            run_id or self.latest_run_id(),
+            ["experiment"],
+        )
+        if stored.empty:
+            return set()
+        return set(stored["experiment"].tolist())
+
+    # -------------------------------------------------------------------------
+    def carry_over_experiments(
+        self,
+        source_run: str,
+        target_run: str,
+        experiments: list[str],
+    ) -> None:
+        """Copy the stored model fits of unchanged experiments into a new run.
+
+        Keyword arguments:
+        source_run -- Run holding the results to reuse.
+        target_run -- Run receiving the copied rows.
+        experiments -- Names of the experiments whose results are reused.
+
+        Return value:
+        None. Rows are copied inside the database, the source run is untouched.
+        """
+        database.copy_rows(
+            "ADSORPTION_MODEL_FITS",
+            "experiment",
+            experiments,
+            {"run_id": source_run},
+            {"run_id": target_run},
+        )
+        logger.info(
+            "Reused stored results of %s experiments from run %s",
+            len(experiments),
+            source_run,
+        )
+
+    # -------------------------------------------------------------------------
+    def save_job(self, record: dict[str, Any]) -> None:
+        database.upsert_into_database(pd.DataFrame([record]), "FITTING_JOBS")
+
+    # -------------------------------------------------------------------------
+    def load_job(self, job_id: str) -> dict[str, Any] | None:
+        stored = database.load_rows("FITTING_JOBS", "job_id", [job_id])
+        if stored.empty:
+            return None
+        record: dict[str, Any] = {}
+        for key, value in stored.iloc[0].to_dict().items():
+            # NumPy scalars are unwrapped so the record serializes like plain JSON
+            value = value.item() if hasattr(value, "item") else value
+            record[key] = (
+                None if isinstance(value, float) and math.isnan(value) else value
+            )
+        return record
+
+    # -------------------------------------------------------------------------
+    def load_cached_fits(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        stored = database.load_rows("ADSORPTION_FIT_CACHE", "cache_key", keys)
+        if stored.empty:
+            return {}
+        return {
+            key: json.loads(result)
+            for key, result in zip(stored["cache_key"], stored["result"], strict=False)
+        }
+
+    # -------------------------------------------------------------------------
+    def save_cached_fits(self, records: list[dict[str, Any]]) -> None:
+        database.upsert_into_database(
+            pd.DataFrame.from_records(records), "ADSORPTION_FIT_CACHE"
+        )
+
+    # -------------------------------------------------------------------------
+    def touch_cached_fits(self, keys: list[str], accessed_at: float) -> None:
+        database.update_rows(
+            "ADSORPTION_FIT_CACHE", "cache_key", keys, {"last_accessed": accessed_at}
+        )
+
+    # -------------------------------------------------------------------------
+    def load_cache_size(self) -> int:
+        table = AdsorptionFitCache.__table__
+        statement = sqlalchemy.select(
+            sqlalchemy.func.coalesce(sqlalchemy.func.sum(table.c.payload_size), 0)
+            .label("size")
+        )
+        return int(database.read_query(statement)["size"].iloc[0])
+
+    # -------------------------------------------------------------------------
+    def load_least_recent_fits(self, limit: int) -> pd.DataFrame:
+        # Served by the recency index, only the oldest entries leave the database
+        table = AdsorptionFitCache.__table__
+        statement = (
+            sqlalchemy.select(table.c.cache_key, table.c.payload_size)
+            .order_by(table.c.last_accessed, table.c.id)
+            .limit(limit)
+        )
+        return database.read_query(statement)
+
+    # -------------------------------------------------------------------------
+    def delete_cached_fits(self, keys: list[str]) -> None:
+        database.delete_rows("ADSORPTION_FIT_CACHE", "cache_key", keys)
+
+    # -------------------------------------------------------------------------
+    def clear_fit_cache(self) -> None:
+        database.clear_table("ADSORPTION_FIT_CACHE")
+
+    # -------------------------------------------------------------------------
+    def encode_vector(self, values: np.ndarray) -> bytes:
+        # Processed, fitting and best-fit tables store vectors as float64 BLOBs
+        return encode_vector(values)
+
+    # -------------------------------------------------------------------------
+    def encode_vector_columns(self, dataset: pd.DataFrame) -> pd.DataFrame:
+        # Only columns actually holding sequences are rebuilt; the others are
+        # shared with the input frame through a shallow copy.
+        converted = dataset.copy(deep=False)
         for column in converted.columns:
-            if converted[column].dtype == object:
-                converted[column] = converted[column].apply(self.convert_string_to_list)
+            series = converted[column]
+            if series.dtype != object or not any(
+                isinstance(value, (list, tuple, np.ndarray)) for value in series
+            ):
+                continue
+            converted[column] = [
+                encode_vector(value)
+                if isinstance(value, (list, tuple, np.ndarray))
+                else value
+                for value in series
+            ]
         return converted
+
+    # -------------------------------------------------------------------------
+    def decode_vector_columns(
+        self, dataset: pd.DataFrame, columns: Sequence[str] = VECTOR_COLUMNS
+    ) -> pd.DataFrame:
+        # Decoded vectors are read-only arrays sharing the fetched buffers
+        decoded = dataset.copy(deep=False)
+        for column in columns:
+            if column in decoded.columns:
+                decoded[column] = [decode_vector(value) for value in decoded[column]]
+        return decoded
@@ -1,33 +1,104 @@
 from __future__ import annotations
 
 import os
+from collections.abc import Iterator
 from typing import Any
 
 import pandas as pd
 import sqlalchemy
-from sqlalchemy import UniqueConstraint, inspect
-from sqlalchemy.dialects.sqlite import insert
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import UniqueConstraint, event, inspect
+from sqlalchemy.engine import Connection, Engine
 
 from ADSORFIT.src.packages.configurations import DatabaseSettings
 from ADSORFIT.src.packages.constants import DATA_PATH, DATABASE_FILENAME
 from ADSORFIT.src.packages.logger import logger
+from ADSORFIT.src.packages.utils.repository.bulk import (
+    build_insert_statement,
+    insert_rows,
+)
+from ADSORFIT.src.packages.utils.repository.migrations import apply_migrations
 from ADSORFIT.src.packages.utils.repository.schema import Base
 
+# executemany reuses one prepared statement without bind-parameter limits, so
+# batches only bound the row tuples held in memory at once.
+SQLITE_BULK_BATCH_FACTOR = 20
+# Writers queue for the single writer connection instead of failing fast
+WRITER_WAIT_SECONDS = 600.0
+
 
 ###############################################################################
 class SQLiteRepository:
-    def __init__(self, settings: DatabaseSettings) -> None:  
-        self.db_path: str | None = os.path.join(DATA_PATH, DATABASE_FILENAME)
+    def __init__(self, settings: DatabaseSettings, db_path: str | None = None) -> None:
+        self.db_path: str | None = db_path or os.path.join(DATA_PATH, DATABASE_FILENAME)
         os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self.settings = settings
+        connect_args = {
+            "check_same_thread": False,
+            "timeout": settings.sqlite_busy_timeout_ms / 1000,
+        }
+        # Writes are serialized through one connection, while reads use a pool of
+        # read-only connections that, in WAL mode, never wait for the writer.
         self.engine: Engine = sqlalchemy.create_engine(
-            f"sqlite:///{self.db_path}", echo=False, future=True
+            f"sqlite:///{self.db_path}",
+            echo=False,
+            future=True,
+            connect_args=connect_args,
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=WRITER_WAIT_SECONDS,
+        )
+        self.reader_engine: Engine = sqlalchemy.create_engine(
+            f"sqlite:///{self.db_path}",
+            echo=False,
+            future=True,
+            connect_args=connect_args,
+            pool_size=settings.sqlite_reader_pool_size,
+            max_overflow=0,
         )
-        self.Session = sessionmaker(bind=self.engine, future=True)
+        event.listen(self.engine, "connect", self.configure_writer)
+        event.listen(self.reader_engine, "connect", self.configure_reader)
         self.insert_batch_size = settings.insert_batch_size
-        if self.db_path is not None and not os.path.exists(self.db_path):
-            Base.metadata.create_all(self.engine)  
+        self.bulk_batch_size = settings.insert_batch_size * SQLITE_BULK_BATCH_FACTOR
+        # ``create_all`` skips existing tables, so tables added in later versions are
+        # created on databases built before them.
+        Base.metadata.create_all(self.engine)
+        apply_migrations(self.engine)
+
+    # -------------------------------------------------------------------------
+    def apply_pragmas(self, dbapi_connection: Any) -> None:
+        settings = self.settings
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA busy_timeout = {settings.sqlite_busy_timeout_ms}")
+            cursor.execute(f"PRAGMA synchronous = {settings.sqlite_synchronous}")
+            # A negative cache size is expressed in KiB rather than pages
+            cache_kib = settings.sqlite_cache_size_mb * 1024
+            cursor.execute(f"PRAGMA cache_size = {-cache_kib}")
+            cursor.execute(
+                f"PRAGMA mmap_size = {settings.sqlite_mmap_size_mb * 1024 * 1024}"
+            )
+        finally:
+            cursor.close()
+
+    # -------------------------------------------------------------------------
+    def configure_writer(self, dbapi_connection: Any, _: Any) -> None:
+        # The journal mode is stored in the database file, so setting it from the
+        # writer also covers connections opened by the readers.
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute(f"PRAGMA journal_mode = {self.settings.sqlite_journal_mode}")
+        finally:
+            cursor.close()
+        self.apply_pragmas(dbapi_connection)
+
+    # -------------------------------------------------------------------------
+    def configure_reader(self, dbapi_connection: Any, _: Any) -> None:
+        self.apply_pragmas(dbapi_connection)
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute("PRAGMA query_only = ON")
+        finally:
+            cursor.close()
 
     # -------------------------------------------------------------------------
     def get_table_class(self, table_name: str) -> Any:
@@ -39,51 +110,168 @@ class SQLiteRepository:
     # -------------------------------------------------------------------------
     def upsert_dataframe(self, df: pd.DataFrame, table_cls) -> None:
         table = table_cls.__table__
-        session = self.Session()
-        try:
-            unique_cols = []
-            for uc in table.constraints:
-                if isinstance(uc, UniqueConstraint):
-                    unique_cols = uc.columns.keys()
-                    break
-            if not unique_cols:
-                raise ValueError(f"No unique constraint found for {table_cls.__name__}")
-            records = df.to_dict(orient="records")
-            for i in range(0, len(records), self.insert_batch_size):
-                batch = records[i : i + self.insert_batch_size]
-                if not batch:
-                    continue
-                stmt = insert(table).values(batch)
-                update_cols = {
-                    col: getattr(stmt.excluded, col)  # type: ignore[attr-defined]
-                    for col in batch[0]
-                    if col not in unique_cols
-                }
-                stmt = stmt.on_conflict_do_update(
-                    index_elements=unique_cols, set_=update_cols
-                )
-                session.execute(stmt)
-                session.commit()
-        finally:
-            session.close()
+        unique_cols = []
+        for uc in table.constraints:
+            if isinstance(uc, UniqueConstraint):
+                unique_cols = uc.columns.keys()
+                break
+        if not unique_cols:
+            raise ValueError(f"No unique constraint found for {table_cls.__name__}")
+        statement = build_insert_statement(
+            self.engine, table.name, list(df.columns), unique_cols
+        )
+        with self.engine.begin() as conn:
+            insert_rows(conn, statement, df, self.bulk_batch_size)
 
     # -------------------------------------------------------------------------
-    def load_from_database(self, table_name: str) -> pd.DataFrame:
-        with self.engine.connect() as conn:
+    def load_from_database(
+        self, table_name: str, columns: list[str] | None = None
+    ) -> pd.DataFrame:
+        with self.reader_engine.connect() as conn:
             inspector = inspect(conn)
             if not inspector.has_table(table_name):
                 logger.warning("Table %s does not exist", table_name)
                 return pd.DataFrame()
-            data = pd.read_sql_table(table_name, conn)
+            data = pd.read_sql_table(table_name, conn, columns=columns)
         return data
 
+    # -------------------------------------------------------------------------
+    def load_rows(
+        self,
+        table_name: str,
+        column: str,
+        values: list[Any],
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
+        table = self.get_table_class(table_name).__table__
+        selected = [table.c[name] for name in columns] if columns else [table]
+        frames: list[pd.DataFrame] = []
+        with self.reader_engine.connect() as conn:
+            for i in range(0, len(values), self.insert_batch_size):
+                batch = values[i : i + self.insert_batch_size]
+                stmt = sqlalchemy.select(*selected).where(table.c[column].in_(batch))
+                frames.append(pd.read_sql(stmt, conn))
+        if not frames:
+            return pd.DataFrame(columns=columns or list(table.columns.keys()))
+        return pd.concat(frames, ignore_index=True)
+
+    # -------------------------------------------------------------------------
+    def load_in_chunks(
+        self,
+        table_name: str,
+        chunk_size: int,
+        order_by: list[str],
+        filters: dict[str, Any] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        # Keyset pagination runs one short query per chunk, so no cursor stays
+        # open while the caller writes the processed chunk back.
+        table = self.get_table_class(table_name).__table__
+        keys = [table.c[column] for column in order_by]
+        last: list[Any] | None = None
+        while True:
+            stmt = sqlalchemy.select(table).order_by(*keys).limit(chunk_size)
+            for name, value in (filters or {}).items():
+                stmt = stmt.where(table.c[name] == value)
+            if last is not None:
+                stmt = stmt.where(sqlalchemy.tuple_(*keys) > sqlalchemy.tuple_(*last))
+            with self.reader_engine.connect() as conn:
+                chunk = pd.read_sql(stmt, conn)
+            if chunk.empty:
+                return
+            yield chunk
+            if chunk.shape[0] < chunk_size:
+                return
+            last = [chunk[column].iloc[-1:].tolist()[0] for column in order_by]
+
+    # -------------------------------------------------------------------------
+    def delete_rows(self, table_name: str, column: str, values: list[Any]) -> None:
+        table = self.get_table_class(table_name).__table__
+        with self.engine.begin() as conn:
+            for i in range(0, len(values), self.insert_batch_size):
+                batch = values[i : i + self.insert_batch_size]
+                conn.execute(sqlalchemy.delete(table).where(table.c[column].in_(batch)))
+
+    # -------------------------------------------------------------------------
+    def update_rows(
+        self,
+        table_name: str,
+        column: str,
+        values: list[Any],
+        assignments: dict[str, Any],
+    ) -> None:
+        table = self.get_table_class(table_name).__table__
+        with self.engine.begin() as conn:
+            for i in range(0, len(values), self.insert_batch_size):
+                batch = values[i : i + self.insert_batch_size]
+                conn.execute(
+                    sqlalchemy.update(table)
+                    .where(table.c[column].in_(batch))
+                    .values(**assignments)
+                )
+
+    # -------------------------------------------------------------------------
+    def copy_rows(
+        self,
+        table_name: str,
+        column: str,
+        values: list[Any],
+        filters: dict[str, Any],
+        overrides: dict[str, Any],
+    ) -> None:
+        # Rows are duplicated with INSERT ... SELECT, so they never leave the
+        # database; the primary key is assigned anew.
+        table = self.get_table_class(table_name).__table__
+        copied = [item for item in table.columns if not item.primary_key]
+        selected = [
+            sqlalchemy.literal(overrides[item.name]).label(item.name)
+            if item.name in overrides
+            else item
+            for item in copied
+        ]
+        with self.engine.begin() as conn:
+            for i in range(0, len(values), self.insert_batch_size):
+                batch = values[i : i + self.insert_batch_size]
+                stmt = sqlalchemy.select(*selected).where(table.c[column].in_(batch))
+                for name, value in filters.items():
+                    stmt = stmt.where(table.c[name] == value)
+                conn.execute(
+                    sqlalchemy.insert(table).from_select(
+                        [item.name for item in copied], stmt
+                    )
+                )
+
+    # -------------------------------------------------------------------------
+    def insert_from_select(
+        self, table_name: str, columns: list[str], statement: sqlalchemy.Select
+    ) -> None:
+        table = self.get_table_class(table_name).__table__
+        with self.engine.begin() as conn:
+            conn.execute(sqlalchemy.insert(table).from_select(columns, statement))
+
+    # -------------------------------------------------------------------------
+    def clear_table(self, table_name: str) -> None:
+        with self.engine.begin() as conn:
+            inspector = inspect(conn)
+            if inspector.has_table(table_name):
+                conn.execute(sqlalchemy.text(f'DELETE FROM "{table_name}"'))
+
     # -------------------------------------------------------------------------
     def save_into_database(self, df: pd.DataFrame, table_name: str) -> None:
         with self.engine.begin() as conn:
             inspector = inspect(conn)
             if inspector.has_table(table_name):
                 conn.execute(sqlalchemy.text(f'DELETE FROM "{table_name}"'))
-            df.to_sql(table_name, conn, if_exists="append", index=False)
+            self.bulk_insert(conn, df, table_name)
+
+    # -------------------------------------------------------------------------
+    def append_into_database(self, df: pd.DataFrame, table_name: str) -> None:
+        with self.engine.begin() as conn:
+            self.bulk_insert(conn, df, table_name)
+
+    # -------------------------------------------------------------------------
+    def bulk_insert(self, conn: Connection, df: pd.DataFrame, table_name: str) -> None:
+        statement = build_insert_statement(self.engine, table_name, list(df.columns))
+        insert_rows(conn, statement, df, self.bulk_batch_size)
 
     # -------------------------------------------------------------------------
     def upsert_into_database(self, df: pd.DataFrame, table_name: str) -> None:
@@ -92,9 +280,33 @@ class SQLiteRepository:
 
     # -----------------------------------------------------------------------------
     def count_rows(self, table_name: str) -> int:
-        with self.engine.connect() as conn:
+        with self.reader_engine.connect() as conn:
             result = conn.execute(
                 sqlalchemy.text(f'SELECT COUNT(*) FROM "{table_name}"')
             )
             value = result.scalar() or 0
         return int(value)
+
+    # -------------------------------------------------------------------------
+    def read_query(self, statement: sqlalchemy.Select) -> pd.DataFrame:
+        with self.reader_engine.connect() as conn:
+            return pd.read_sql(statement, conn)
+
+    # -------------------------------------------------------------------------
+    def count_distinct(
+        self,
+        table_name: str,
+        column: str,
+        filters: dict[str, Any] | None = None,
+    ) -> int:
+        table = self.get_table_class(table_name).__table__
+        stmt = sqlalchemy.select(
+            sqlalchemy.func.count(sqlalchemy.distinct(table.c[column]))
+        )
+        for name, value in (filters or {}).items():
+            stmt = stmt.where(table.c[name] == value)
+        with self.reader_engine.connect() as conn:
+            if not inspect(conn).has_table(table_name):
+                return 0
+            value = conn.execute(stmt).scalar() or 0
+        return int(value)
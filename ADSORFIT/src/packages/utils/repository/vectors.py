@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+# Measurement vectors are stored as little-endian float64 BLOBs
+VECTOR_DTYPE = np.dtype("<f8")
+VECTOR_TABLES = (
+    "ADSORPTION_PROCESSED_DATA",
+    "ADSORPTION_FITTING_RESULTS",
+    "ADSORPTION_BEST_FIT",
+)
+VECTOR_COLUMNS = ("pressure [Pa]", "uptake [mol/g]")
+MODEL_FIT_VECTOR_COLUMNS = ("parameters", "errors")
+
+
+# -----------------------------------------------------------------------------
+def encode_vector(values: Any) -> bytes:
+    return np.ascontiguousarray(values, dtype=VECTOR_DTYPE).tobytes()
+
+
+# -----------------------------------------------------------------------------
+def decode_vector(value: Any) -> Any:
+    # The returned array is a read-only view over the stored buffer
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return np.frombuffer(value, dtype=VECTOR_DTYPE)
+    return value
+
+
+# -----------------------------------------------------------------------------
+def parse_legacy_vector(text: str) -> np.ndarray:
+    # Older databases stored JSON arrays in the processed table and
+    # comma-separated numbers in the fitting and best-fit tables.
+    parts = [part.strip() for part in text.strip().strip("[]").split(",")]
+    return np.asarray([float(part) for part in parts if part], dtype=VECTOR_DTYPE)
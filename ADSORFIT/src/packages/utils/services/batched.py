@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import numpy as np
+
+from ADSORFIT.src.packages.utils.services.models import ModelSpec
+
+
+###############################################################################
+@dataclass
+class BatchedFitResult:
+    parameters: np.ndarray
+    covariance: np.ndarray
+    lss: np.ndarray
+    converged: np.ndarray
+
+
+###############################################################################
+class BatchedLevenbergMarquardt:
+    def __init__(
+        self,
+        ftol: float = 1e-10,
+        xtol: float = 1e-10,
+        gtol: float = 1e-6,
+        initial_damping: float = 1e-3,
+        damping_factor: float = 10.0,
+        max_damping: float = 1e12,
+    ) -> None:
+        self.ftol = ftol
+        self.xtol = xtol
+        self.gtol = gtol
+        self.initial_damping = initial_damping
+        self.damping_factor = damping_factor
+        self.max_damping = max_damping
+        self.difference_step = float(np.sqrt(np.finfo(np.float64).eps))
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def stack_experiments(
+        pressures: list[np.ndarray], uptakes: list[np.ndarray]
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Pack ragged experiments into padded 2-D arrays with a validity mask.
+
+        Keyword arguments:
+        pressures -- Pressure vectors, one per experiment.
+        uptakes -- Uptake vectors aligned with ``pressures``.
+
+        Return value:
+        Tuple with the padded pressure matrix, padded uptake matrix, and boolean mask
+        flagging the real measurements.
+        """
+        lengths = np.fromiter(
+            (array.shape[0] for array in pressures), dtype=np.int64, count=len(pressures)
+        )
+        width = int(lengths.max()) if lengths.size else 0
+        mask = np.arange(width)[None, :] < lengths[:, None]
+        # Padding uses a unit pressure so logarithmic models stay finite on the
+        # masked cells, which are then zeroed out of every residual.
+        pressure_matrix = np.ones((len(pressures), width), dtype=np.float64)
+        uptake_matrix = np.zeros((len(uptakes), width), dtype=np.float64)
+        if width:
+            pressure_matrix[mask] = np.concatenate(pressures)
+            uptake_matrix[mask] = np.concatenate(uptakes)
+        return pressure_matrix, uptake_matrix, mask
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def evaluate(
+        model: Callable[..., np.ndarray], pressure: np.ndarray, parameters: np.ndarray
+    ) -> np.ndarray:
+        columns = [parameters[:, index, None] for index in range(parameters.shape[1])]
+        with np.errstate(all="ignore"):
+            return np.asarray(model(pressure, *columns), dtype=np.float64)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def predict(
+        spec: ModelSpec, pressure: np.ndarray, parameters: np.ndarray
+    ) -> np.ndarray:
+        with np.errstate(all="ignore"):
+            return np.asarray(spec.evaluate(pressure, parameters), dtype=np.float64)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def pseudo_inverse(matrices: np.ndarray) -> np.ndarray:
+        # ``pinv`` fails for the whole stack as soon as one matrix is not finite, so
+        # degenerate experiments are masked out and reported as NaN instead.
+        inverse = np.full_like(matrices, np.nan)
+        finite = np.isfinite(matrices).all(axis=(1, 2))
+        if finite.any():
+            inverse[finite] = np.linalg.pinv(matrices[finite])
+        return inverse
+
+    # -------------------------------------------------------------------------
+    def jacobian(
+        self,
+        spec: ModelSpec,
+        pressure: np.ndarray,
+        parameters: np.ndarray,
+        predicted: np.ndarray,
+        upper: np.ndarray,
+    ) -> np.ndarray:
+        """Compute the model Jacobian for every experiment in the batch.
+
+        Keyword arguments:
+        spec -- Specification of the model evaluated on the padded pressure matrix.
+        pressure -- Padded pressure matrix.
+        parameters -- Current parameter estimates with shape (experiments, parameters).
+        predicted -- Model predictions for ``parameters``.
+        upper -- Per-experiment upper bounds, used to flip the difference step.
+
+        Return value:
+        Array with shape (experiments, measurements, parameters), computed in closed
+        form when the specification provides a Jacobian and with forward differences
+        otherwise.
+        """
+        if spec.jacobian is not None:
+            return self.evaluate(spec.jacobian, pressure, parameters)
+
+        jacobian = np.empty(pressure.shape + (parameters.shape[1],), dtype=np.float64)
+        for index in range(parameters.shape[1]):
+            step = self.difference_step * np.maximum(np.abs(parameters[:, index]), 1.0)
+            # Step backwards when a forward step would leave the feasible region
+            step = np.where(parameters[:, index] + step > upper[:, index], -step, step)
+            shifted = parameters.copy()
+            shifted[:, index] += step
+            jacobian[..., index] = (
+                self.predict(spec, pressure, shifted) - predicted
+            ) / step[:, None]
+        return jacobian
+
+    # -------------------------------------------------------------------------
+    def is_stationary(
+        self,
+        derivatives: np.ndarray,
+        residuals: np.ndarray,
+        parameters: np.ndarray,
+        lower: np.ndarray,
+        upper: np.ndarray,
+    ) -> np.ndarray:
+        """Check the first-order optimality conditions of the bounded problem.
+
+        Keyword arguments:
+        derivatives -- Masked Jacobians with shape (experiments, measurements,
+        parameters).
+        residuals -- Masked residuals at ``parameters``.
+        parameters -- Current parameter estimates.
+        lower -- Per-experiment lower bounds.
+        upper -- Per-experiment upper bounds.
+
+        Return value:
+        Boolean array flagging the experiments whose projected gradient vanishes.
+        Descent components pointing out of an active bound satisfy the KKT
+        conditions and are dropped, and the rest are compared with ``gtol`` as the
+        cosine between each Jacobian column and the residual vector, like the
+        ``gtol`` test of MINPACK.
+        """
+        descent = np.einsum("blp,bl->bp", derivatives, residuals)
+        blocked = ((parameters <= lower) & (descent < 0.0)) | (
+            (parameters >= upper) & (descent > 0.0)
+        )
+        projected = np.where(blocked, 0.0, descent)
+        column_norms = np.sqrt(np.einsum("blp,blp->bp", derivatives, derivatives))
+        residual_norm = np.linalg.norm(residuals, axis=1)
+        limit = self.gtol * column_norms * residual_norm[:, None]
+        return np.all(np.abs(projected) <= limit, axis=1)
+
+    # -------------------------------------------------------------------------
+    def fit(
+        self,
+        spec: ModelSpec,
+        pressures: list[np.ndarray],
+        uptakes: list[np.ndarray],
+        max_iterations: int,
+        initial: np.ndarray | None = None,
+        lower: np.ndarray | None = None,
+        upper: np.ndarray | None = None,
+    ) -> BatchedFitResult:
+        """Run bound-constrained Levenberg-Marquardt iterations over a batch of experiments.
+
+        Keyword arguments:
+        spec -- Specification of the model shared by every experiment in the batch.
+        pressures -- Pressure vectors, one per experiment.
+        uptakes -- Uptake vectors aligned with ``pressures``.
+        max_iterations -- Function evaluation budget, matching ``curve_fit``'s maxfev.
+        initial -- Optional per-experiment initial guesses, one row per experiment.
+        lower -- Optional per-experiment lower bounds.
+        upper -- Optional per-experiment upper bounds.
+
+        Return value:
+        Batched parameters, covariance matrices, least squares scores and a
+        convergence flag for every experiment.
+        """
+        pressure, uptake, mask = self.stack_experiments(pressures, uptakes)
+        batch_size = pressure.shape[0]
+        parameter_count = spec.parameter_count
+        # Missing per-experiment arrays default to the shared specification values
+        initial = np.tile(spec.initial, (batch_size, 1)) if initial is None else initial
+        lower = np.tile(spec.lower, (batch_size, 1)) if lower is None else lower
+        upper = np.tile(spec.upper, (batch_size, 1)) if upper is None else upper
+
+        parameters = np.clip(initial, lower, upper)
+        predicted = self.predict(spec, pressure, parameters)
+        residuals = np.where(mask, uptake - predicted, 0.0)
+        cost = np.sum(residuals**2, axis=1)
+        damping = np.full(batch_size, self.initial_damping)
+        active = np.isfinite(cost)
+        converged = np.zeros(batch_size, dtype=bool)
+        settled = np.zeros(batch_size, dtype=bool)
+        identity = np.eye(parameter_count)
+
+        # Each iteration costs one evaluation plus one per parameter for the
+        # finite-difference Jacobian, mirroring the ``maxfev`` budget of curve_fit.
+        evaluations_per_iteration = (
+            1 if spec.jacobian is not None else parameter_count + 1
+        )
+        iterations = max(1, int(max_iterations) // evaluations_per_iteration)
+        for _ in range(iterations):
+            if not active.any():
+                break
+            rows = np.flatnonzero(active)
+            derivatives = self.jacobian(
+                spec, pressure[rows], parameters[rows], predicted[rows], upper[rows]
+            )
+            derivatives = np.where(mask[rows, :, None], derivatives, 0.0)
+            # Only a vanishing projected gradient counts as convergence. Rows that
+            # settled on the previous step without reaching it are stuck against
+            # a bound or a flat direction and are left to the fallback solver.
+            stationary = self.is_stationary(
+                derivatives, residuals[rows], parameters[rows], lower[rows], upper[rows]
+            )
+            converged[rows[stationary]] = True
+            active[rows[stationary | settled[rows]]] = False
+            keep = ~stationary & ~settled[rows]
+            if not keep.any():
+                break
+            rows = rows[keep]
+            derivatives = derivatives[keep]
+            normal = np.einsum("blp,blq->bpq", derivatives, derivatives)
+            gradient = np.einsum("blp,bl->bp", derivatives, residuals[rows])
+            diagonal = np.diagonal(normal, axis1=1, axis2=2)
+            scaling = np.maximum(diagonal, np.finfo(np.float64).tiny)
+            damped = normal + (damping[rows, None] * scaling)[:, :, None] * identity
+            step = np.einsum("bpq,bq->bp", self.pseudo_inverse(damped), gradient)
+            degenerate = ~np.isfinite(step).all(axis=1)
+            active[rows[degenerate]] = False
+
+            candidate = np.clip(parameters[rows] + step, lower[rows], upper[rows])
+            candidate_predicted = self.predict(spec, pressure[rows], candidate)
+            candidate_residuals = np.where(
+                mask[rows], uptake[rows] - candidate_predicted, 0.0
+            )
+            candidate_cost = np.sum(candidate_residuals**2, axis=1)
+
+            improved = (
+                ~degenerate
+                & np.isfinite(candidate_cost)
+                & (candidate_cost < cost[rows])
+            )
+            accepted = rows[improved]
+            actual_step = candidate[improved] - parameters[accepted]
+            reduction = cost[accepted] - candidate_cost[improved]
+
+            parameters[accepted] = candidate[improved]
+            predicted[accepted] = candidate_predicted[improved]
+            residuals[accepted] = candidate_residuals[improved]
+            cost[accepted] = candidate_cost[improved]
+            damping[accepted] = np.maximum(
+                damping[accepted] / self.damping_factor, 1e-12
+            )
+            rejected = rows[~improved & ~degenerate]
+            damping[rejected] *= self.damping_factor
+
+            step_norm = np.linalg.norm(actual_step, axis=1)
+            parameter_norm = np.linalg.norm(parameters[accepted], axis=1)
+            # Negligible progress is confirmed by the stationarity test of the
+            # next iteration before the row is considered converged.
+            settled[accepted] = (reduction <= self.ftol * cost[accepted]) | (
+                step_norm <= self.xtol * (parameter_norm + self.xtol)
+            )
+            # Saturated damping means no step improves the estimate although the
+            # gradient has not vanished, so the row goes to the fallback.
+            active[rejected[damping[rejected] > self.max_damping]] = False
+
+        # Rows still iterating when the budget ran out get a last stationarity test
+        rows = np.flatnonzero(active)
+        if rows.size:
+            derivatives = self.jacobian(
+                spec, pressure[rows], parameters[rows], predicted[rows], upper[rows]
+            )
+            derivatives = np.where(mask[rows, :, None], derivatives, 0.0)
+            converged[rows] = self.is_stationary(
+                derivatives, residuals[rows], parameters[rows], lower[rows], upper[rows]
+            )
+
+        covariance = self.estimate_covariance(
+            spec, pressure, parameters, predicted, cost, mask, upper
+        )
+        converged &= np.isfinite(cost)
+        return BatchedFitResult(
+            parameters=parameters, covariance=covariance, lss=cost, converged=converged
+        )
+
+    # -------------------------------------------------------------------------
+    def estimate_covariance(
+        self,
+        spec: ModelSpec,
+        pressure: np.ndarray,
+        parameters: np.ndarray,
+        predicted: np.ndarray,
+        cost: np.ndarray,
+        mask: np.ndarray,
+        upper: np.ndarray,
+    ) -> np.ndarray:
+        derivatives = self.jacobian(spec, pressure, parameters, predicted, upper)
+        derivatives = np.where(mask[:, :, None], derivatives, 0.0)
+        normal = np.einsum("blp,blq->bpq", derivatives, derivatives)
+        # Same scaling as ``curve_fit`` with ``absolute_sigma=False``: the inverse
+        # normal matrix is multiplied by the residual variance.
+        dof = mask.sum(axis=1) - parameters.shape[1]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            variance = np.where(dof > 0, cost / np.maximum(dof, 1), np.inf)
+        return self.pseudo_inverse(normal) * variance[:, None, None]
@@ -0,0 +1,244 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+import numpy as np
+
+from ADSORFIT.src.packages.configurations import configurations
+from ADSORFIT.src.packages.logger import logger
+from ADSORFIT.src.packages.utils.repository.serializer import DataSerializer
+from ADSORFIT.src.packages.utils.services.models import ModelSpec
+
+# Bumped whenever a solver change alters fitted results, so entries produced by an
+# older solver are never served again.
+SOLVER_VERSION = "1"
+# Eviction releases space down to this fraction of the budget, so a full cache
+# is not trimmed again on every store
+EVICTION_TARGET = 0.9
+EVICTION_BATCH = 1000
+
+
+###############################################################################
+class FitCache:
+    def __init__(
+        self,
+        memory_entries: int,
+        max_bytes: int,
+        serializer: DataSerializer | None = None,
+    ) -> None:
+        self.memory_entries = max(0, int(memory_entries))
+        self.max_bytes = max(0, int(max_bytes))
+        self.serializer = serializer or DataSerializer()
+        self.memory: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self.lock = threading.Lock()
+        # Running estimate of the stored payload bytes, read from the database on
+        # first use and after every eviction
+        self.stored_bytes: int | None = None
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def hash_experiment(pressure: np.ndarray, uptake: np.ndarray) -> str:
+        digest = hashlib.sha256()
+        for values in (pressure, uptake):
+            array = np.ascontiguousarray(values, dtype=np.float64)
+            digest.update(np.int64(array.shape[0]).tobytes())
+            digest.update(array.tobytes())
+        return digest.hexdigest()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def build_key(experiment_hash: str, spec: ModelSpec, max_iterations: int) -> str:
+        """Build the content-addressed key identifying one experiment/model fit.
+
+        Keyword arguments:
+        experiment_hash -- Digest of the experiment data from :meth:`hash_experiment`.
+        spec -- Specification of the fitted model, including guess and bounds.
+        max_iterations -- Maximum number of solver evaluations per model fit.
+
+        Return value:
+        Hexadecimal SHA-256 key that changes whenever the data, model, bounds, initial
+        guess, iteration budget, solver version or result-affecting settings change.
+        """
+        fitting_settings = configurations.server.fitting
+        digest = hashlib.sha256()
+        digest.update(SOLVER_VERSION.encode("utf-8"))
+        digest.update(experiment_hash.encode("utf-8"))
+        digest.update(spec.name.upper().encode("utf-8"))
+        digest.update(",".join(spec.parameters).encode("utf-8"))
+        for values in (spec.initial, spec.lower, spec.upper):
+            digest.update(np.ascontiguousarray(values, dtype=np.float64).tobytes())
+        if spec.estimable is not None:
+            digest.update(np.packbits(spec.estimable).tobytes())
+        settings = (
+            int(max_iterations),
+            fitting_settings.solver_backend,
+            fitting_settings.analytic_jacobian,
+            fitting_settings.data_driven_initial_guess,
+            fitting_settings.tighten_bounds,
+            fitting_settings.bound_tightening_factor,
+            fitting_settings.separable_fast_paths,
+        )
+        digest.update(repr(settings).encode("utf-8"))
+        return digest.hexdigest()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def hash_configuration(specs: dict[str, ModelSpec], max_iterations: int) -> str:
+        """Fingerprint the fitting configuration independently of the data.
+
+        Keyword arguments:
+        specs -- Compiled model specifications of the run.
+        max_iterations -- Maximum number of solver evaluations per model fit.
+
+        Return value:
+        Hexadecimal SHA-256 digest covering the same inputs as :meth:`build_key`
+        for every model, so results share a fingerprint exactly when they could
+        share cache entries.
+        """
+        digest = hashlib.sha256()
+        for name in sorted(specs):
+            digest.update(FitCache.build_key("", specs[name], max_iterations).encode())
+        return digest.hexdigest()
+
+    # -------------------------------------------------------------------------
+    def remember(self, key: str, result: dict[str, Any]) -> None:
+        if self.memory_entries == 0:
+            return
+        self.memory[key] = result
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    # -------------------------------------------------------------------------
+    def lookup(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        """Resolve cached fitting results, first in memory and then in the database.
+
+        Keyword arguments:
+        keys -- Cache keys produced by :meth:`build_key`.
+
+        Return value:
+        Dictionary mapping the keys found in either tier to their fitting results.
+        """
+        found: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        with self.lock:
+            for key in dict.fromkeys(keys):
+                if key in self.memory:
+                    self.memory.move_to_end(key)
+                    found[key] = self.memory[key]
+                else:
+                    missing.append(key)
+
+        if missing:
+            stored = self.serializer.load_cached_fits(missing)
+            with self.lock:
+                for key, result in stored.items():
+                    found[key] = result
+                    self.remember(key, result)
+        if found:
+            # Hits from either tier refresh the recency used for eviction, with
+            # one update per lookup rather than one per entry
+            self.serializer.touch_cached_fits(list(found), time.time())
+        return found
+
+    # -------------------------------------------------------------------------
+    def store(self, entries: dict[str, tuple[str, dict[str, Any]]]) -> None:
+        """Persist new fitting results and enforce the configured size limit.
+
+        Keyword arguments:
+        entries -- Dictionary mapping cache keys to ``(model name, result)`` pairs.
+        Failed fits, which carry an ``exception`` entry, are never cached.
+
+        Return value:
+        None
+        """
+        records: list[dict[str, Any]] = []
+        created_at = time.time()
+        with self.lock:
+            for key, (model_name, result) in entries.items():
+                if "exception" in result:
+                    continue
+                payload = json.dumps(result)
+                records.append(
+                    {
+                        "cache_key": key,
+                        "model": model_name,
+                        "result": payload,
+                        "payload_size": len(payload),
+                        "created_at": created_at,
+                        "last_accessed": created_at,
+                    }
+                )
+                self.remember(key, result)
+        if not records:
+            return
+        self.serializer.save_cached_fits(records)
+        if self.max_bytes == 0:
+            return
+        if self.stored_bytes is None:
+            self.stored_bytes = self.serializer.load_cache_size()
+        else:
+            # Overwritten keys are counted twice, which only brings the next
+            # eviction, and the exact total it reads, slightly forward
+            self.stored_bytes += sum(record["payload_size"] for record in records)
+        if self.stored_bytes > self.max_bytes:
+            self.evict()
+
+    # -------------------------------------------------------------------------
+    def evict(self) -> None:
+        # The exact total is read again, other processes may share the table
+        total = self.serializer.load_cache_size()
+        target = int(self.max_bytes * EVICTION_TARGET)
+        evicted = 0
+        # Least recently used entries go first until the table is below the target
+        while total > target:
+            candidates = self.serializer.load_least_recent_fits(EVICTION_BATCH)
+            if candidates.empty:
+                break
+            released = candidates["payload_size"].cumsum().to_numpy()
+            count = int(np.searchsorted(released, total - target)) + 1
+            keys = candidates["cache_key"].iloc[:count].tolist()
+            self.serializer.delete_cached_fits(keys)
+            with self.lock:
+                for key in keys:
+                    self.memory.pop(key, None)
+            total -= int(released[min(count, released.shape[0]) - 1])
+            evicted += len(keys)
+        self.stored_bytes = total
+        if evicted:
+            logger.info(
+                "Evicted %s fit cache entries to honour the size limit", evicted
+            )
+
+    # -------------------------------------------------------------------------
+    def purge(self) -> None:
+        with self.lock:
+            self.memory.clear()
+        self.serializer.clear_fit_cache()
+        self.stored_bytes = 0
+        logger.info("Fit cache purged")
+
+
+###############################################################################
+class FitCacheSession:
+    def __init__(self, cache: FitCache) -> None:
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+
+    # -------------------------------------------------------------------------
+    def lookup(self, keys: list[str]) -> dict[str, dict[str, Any]]:
+        return self.cache.lookup(keys)
+
+    # -------------------------------------------------------------------------
+    def store(self, entries: dict[str, tuple[str, dict[str, Any]]]) -> None:
+        self.cache.store(entries)
+
+    # -------------------------------------------------------------------------
+    def statistics(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses}
@@ -1,13 +1,39 @@
 from __future__ import annotations
 
+import csv
+import importlib.util
 import io
 import os
+import re
+from collections import Counter
+from collections.abc import Sequence
+from dataclasses import dataclass
 from typing import Any
 
 import pandas as pd
 
 from ADSORFIT.src.packages.configurations import configurations
-from ADSORFIT.src.packages.constants import DATASET_FALLBACK_DELIMITERS
+from ADSORFIT.src.packages.constants import (
+    DATASET_FALLBACK_DELIMITERS,
+    DEFAULT_DATASET_COLUMN_MAPPING,
+)
+from ADSORFIT.src.packages.logger import logger
+from ADSORFIT.src.packages.utils.services.registry import DatasetRegistry
+
+# The multithreaded Arrow CSV reader is used when pyarrow happens to be installed
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+DECIMAL_COMMA_PATTERN = re.compile(r"^[+-]?\d*,\d+([eE][+-]?\d+)?$")
+DECIMAL_POINT_PATTERN = re.compile(r"^[+-]?\d*\.\d+([eE][+-]?\d+)?$")
+EXCEL_CHUNK_ROWS = 50_000
+
+
+###############################################################################
+@dataclass(frozen=True)
+class CSVFormat:
+    delimiter: str
+    decimal: str
+    header: bool
+    columns: tuple[str, ...]
 
 
 ###############################################################################
@@ -16,41 +42,85 @@ class DatasetService:
         self.allowed_extensions = set(
             configurations.server.datasets.allowed_extensions
         )
+        self.preview_rows = configurations.server.datasets.preview_rows
+        self.sniff_bytes = configurations.server.datasets.sniff_bytes
+        self.registry = DatasetRegistry()
 
     # -------------------------------------------------------------------------------
     def load_from_bytes(
-        self, payload: bytes, filename: str | None
+        self,
+        payload: bytes,
+        filename: str | None,
+        sheets: Sequence[str] | None = None,
     ) -> tuple[dict[str, Any], str]:
-        """Load an uploaded dataset payload and provide a serialized representation.
+        """Load an uploaded dataset payload and register it server-side.
 
         Keyword arguments:
         payload -- Raw file bytes obtained from the upload endpoint.
         filename -- Original filename that hints at the file extension, if available.
+        sheets -- Workbook sheets to load, every sheet when omitted.
 
         Return value:
-        Tuple containing a JSON-serializable dataset description and a human-readable
-        summary.
+        Tuple containing a JSON-serializable dataset description, holding the
+        registry identifier and a short preview instead of every record, and a
+        human-readable summary.
         """
-        if not payload:
-            raise ValueError("Uploaded dataset is empty.")
-
-        dataframe = self.read_dataframe(payload, filename)
-        serializable = dataframe.where(pd.notna(dataframe), None)
+        dataset_id, dataframe = self.register_upload(payload, filename, sheets)
+        preview = dataframe.head(self.preview_rows)
+        preview = preview.astype(object).where(pd.notna(preview), None)
         dataset_payload: dict[str, Any] = {
-            "columns": list(serializable.columns),
-            "records": serializable.to_dict(orient="records"),
-            "row_count": int(serializable.shape[0]),
+            "dataset_id": dataset_id,
+            "columns": list(dataframe.columns),
+            "preview": preview.to_dict(orient="records"),
+            "row_count": int(dataframe.shape[0]),
         }
         summary = self.format_dataset_summary(dataframe)
         return dataset_payload, summary
 
     # -------------------------------------------------------------------------------
-    def read_dataframe(self, payload: bytes, filename: str | None) -> pd.DataFrame:
+    def register_upload(
+        self,
+        payload: bytes,
+        filename: str | None,
+        sheets: Sequence[str] | None = None,
+    ) -> tuple[str, pd.DataFrame]:
+        """Parse an uploaded file once and keep it in the dataset registry.
+
+        Keyword arguments:
+        payload -- Raw file bytes obtained from the upload endpoint.
+        filename -- Original filename that hints at the file extension, if available.
+        sheets -- Workbook sheets to load, every sheet when omitted.
+
+        Return value:
+        Tuple with the registry identifier and the parsed DataFrame.
+        """
+        if not payload:
+            raise ValueError("Uploaded dataset is empty.")
+
+        sheets = sorted(set(sheets or ()))
+        dataset_id = self.registry.compute_dataset_id(payload, filename, sheets)
+        dataframe = self.registry.get(dataset_id)
+        if dataframe is None:
+            dataframe = self.read_dataframe(payload, filename, sheets)
+            self.registry.register(dataset_id, dataframe)
+        else:
+            # Identical uploads share the same content hash and skip parsing
+            logger.info("Reusing registered dataset %s", dataset_id)
+        return dataset_id, dataframe
+
+    # -------------------------------------------------------------------------------
+    def read_dataframe(
+        self,
+        payload: bytes,
+        filename: str | None,
+        sheets: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
         """Decode the uploaded file into a Pandas DataFrame, handling CSV and Excel inputs.
 
         Keyword arguments:
         payload -- Raw bytes representing the uploaded file contents.
         filename -- Provided filename used to infer the file format.
+        sheets -- Workbook sheets to load, every sheet when omitted.
 
         Return value:
         DataFrame containing the parsed dataset ready for further processing.
@@ -62,36 +132,296 @@ class DatasetService:
         if extension and extension not in self.allowed_extensions:
             raise ValueError(f"Unsupported file type: {extension}")
 
-        buffer = io.BytesIO(payload)
-
-        if extension in {".xls", ".xlsx"}:
-            buffer.seek(0)
-            dataframe = pd.read_excel(buffer, sheet_name=0)
+        if extension == ".xlsx":
+            dataframe = self.read_workbook(payload, sheets)
+        elif extension == ".xls":
+            dataframe = self.read_legacy_workbook(payload, sheets)
         else:
-            buffer.seek(0)
-            dataframe = pd.read_csv(buffer)
-
-            if dataframe.shape[1] == 1:
-                column_name = dataframe.columns[0]
-                first_value = None
-                if not dataframe.empty:
-                    first_value = dataframe.iloc[0, 0]
-
-                # When the parser reports a single column we attempt alternative
-                # delimiters to handle semi-colon, tab, or pipe separated files.
-                for delimiter in DATASET_FALLBACK_DELIMITERS:
-                    if (isinstance(column_name, str) and delimiter in column_name) or (
-                        isinstance(first_value, str) and delimiter in first_value
-                    ):
-                        buffer.seek(0)
-                        dataframe = pd.read_csv(buffer, sep=delimiter)
-                        break
+            dataframe = self.read_csv_payload(payload, self.sniff_csv_format(payload))
 
         if dataframe.empty:
             raise ValueError("Uploaded dataset is empty.")
 
         return dataframe
 
+    # -------------------------------------------------------------------------------
+    @staticmethod
+    def select_sheets(
+        available: Sequence[str], sheets: Sequence[str] | None
+    ) -> list[str]:
+        if not sheets:
+            return list(available)
+        missing = [sheet for sheet in sheets if sheet not in available]
+        if missing:
+            raise ValueError(f"Unknown worksheets: {', '.join(missing)}")
+        # Workbook order is kept so the concatenated rows are deterministic
+        return [sheet for sheet in available if sheet in sheets]
+
+    # -------------------------------------------------------------------------------
+    def read_workbook(
+        self, payload: bytes, sheets: Sequence[str] | None = None
+    ) -> pd.DataFrame:
+        """Stream the selected worksheets of an xlsx workbook one after another.
+
+        Keyword arguments:
+        payload -- Raw bytes representing the uploaded workbook.
+        sheets -- Worksheets to load, every sheet when omitted.
+
+        Return value:
+        DataFrame concatenating the rows of every selected worksheet.
+        """
+        from openpyxl import load_workbook
+
+        # A single read-only handle serves every sheet: openpyxl parsing holds the
+        # GIL, so separate handles per thread would only parse the archive again.
+        workbook = load_workbook(io.BytesIO(payload), read_only=True, data_only=True)
+        try:
+            selected = self.select_sheets(workbook.sheetnames, sheets)
+            frames = [self.read_worksheet(workbook[sheet]) for sheet in selected]
+        finally:
+            workbook.close()
+        return self.combine_sheets(selected, frames)
+
+    # -------------------------------------------------------------------------------
+    @staticmethod
+    def read_worksheet(worksheet: Any) -> pd.DataFrame:
+        """Iterate the rows of a single worksheet without loading the workbook model.
+
+        Keyword arguments:
+        worksheet -- Read-only openpyxl worksheet to read.
+
+        Return value:
+        DataFrame built from the worksheet, using its first non-empty row as header.
+        """
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(
+            (row for row in rows if any(value is not None for value in row)), None
+        )
+        if header is None:
+            return pd.DataFrame()
+        columns = [
+            str(value) if value is not None else f"column_{index}"
+            for index, value in enumerate(header)
+        ]
+        width = len(columns)
+        chunks: list[pd.DataFrame] = []
+        buffer: list[tuple[Any, ...]] = []
+        for row in rows:
+            if all(value is None for value in row):
+                continue
+            buffer.append(tuple(row[:width]) + (None,) * (width - len(row)))
+            # Rows are converted in chunks so at most one chunk of Python tuples
+            # is alive next to the columnar frames.
+            if len(buffer) >= EXCEL_CHUNK_ROWS:
+                chunks.append(pd.DataFrame.from_records(buffer, columns=columns))
+                buffer = []
+        if buffer or not chunks:
+            chunks.append(pd.DataFrame.from_records(buffer, columns=columns))
+        return pd.concat(chunks, ignore_index=True).infer_objects()
+
+    # -------------------------------------------------------------------------------
+    def read_legacy_workbook(
+        self, payload: bytes, sheets: Sequence[str] | None = None
+    ) -> pd.DataFrame:
+        # The binary xls format cannot be streamed, so its sheets are loaded by
+        # pandas in one go.
+        workbook = pd.ExcelFile(io.BytesIO(payload))
+        selected = self.select_sheets(workbook.sheet_names, sheets)
+        frames = workbook.parse(sheet_name=selected)
+        return self.combine_sheets(selected, [frames[sheet] for sheet in selected])
+
+    # -------------------------------------------------------------------------------
+    def combine_sheets(
+        self, sheets: list[str], frames: list[pd.DataFrame]
+    ) -> pd.DataFrame:
+        """Concatenate worksheets into the canonical long format.
+
+        Keyword arguments:
+        sheets -- Names of the parsed worksheets.
+        frames -- Parsed worksheets, in the same order as ``sheets``.
+
+        Return value:
+        DataFrame with every worksheet stacked. When several sheets are combined,
+        experiment names are prefixed with their sheet name so batches reusing the
+        same names stay distinct; sheets without an experiment column use the
+        sheet name as experiment.
+        """
+        if len(frames) == 1:
+            combined = frames[0]
+        else:
+            prefixed: list[pd.DataFrame] = []
+            for sheet, frame in zip(sheets, frames):
+                if frame.empty:
+                    continue
+                experiment = self.match_canonical_columns(
+                    tuple(frame.columns)
+                ).get("experiment")
+                frame = frame.copy()
+                if experiment is None:
+                    frame.insert(0, DEFAULT_DATASET_COLUMN_MAPPING["experiment"], sheet)
+                else:
+                    names = frame[experiment]
+                    frame[experiment] = (sheet + "/" + names.astype(str)).where(
+                        names.notna()
+                    )
+                prefixed.append(frame)
+            combined = (
+                pd.concat(prefixed, ignore_index=True) if prefixed else pd.DataFrame()
+            )
+
+        combined = self.apply_canonical_dtypes(combined)
+        combined.attrs["sheets"] = list(sheets)
+        return combined
+
+    # -------------------------------------------------------------------------------
+    def apply_canonical_dtypes(self, dataframe: pd.DataFrame) -> pd.DataFrame:
+        dtypes = self.canonical_dtypes(tuple(str(c) for c in dataframe.columns))
+        if not dtypes:
+            return dataframe
+        try:
+            return dataframe.astype(dtypes)
+        except (TypeError, ValueError) as exc:
+            logger.warning("Typed Excel conversion failed, keeping inferred: %s", exc)
+            return dataframe
+
+    # -------------------------------------------------------------------------------
+    @staticmethod
+    def is_number(value: str, decimal: str) -> bool:
+        value = value.strip()
+        if decimal == ",":
+            value = value.replace(",", ".")
+        try:
+            float(value)
+        except ValueError:
+            return False
+        return bool(value)
+
+    # -------------------------------------------------------------------------------
+    @staticmethod
+    def detect_delimiter(lines: list[str]) -> str:
+        # A delimiter is scored by how many lines share its most common count.
+        # Fallback delimiters win ties against the comma, which otherwise doubles
+        # as the decimal separator of semicolon-separated files.
+        best_delimiter, best_score = ",", 0
+        for delimiter in (*DATASET_FALLBACK_DELIMITERS, ","):
+            counts = Counter(line.count(delimiter) for line in lines)
+            modal_count, frequency = counts.most_common(1)[0]
+            if modal_count > 0 and frequency > best_score:
+                best_delimiter, best_score = delimiter, frequency
+        return best_delimiter
+
+    # -------------------------------------------------------------------------------
+    def sniff_csv_format(self, payload: bytes) -> CSVFormat:
+        """Detect the CSV dialect from a head sample before parsing the full upload.
+
+        Keyword arguments:
+        payload -- Raw bytes representing the uploaded CSV file.
+
+        Return value:
+        Detected delimiter, decimal separator, header presence and column names.
+        Files without a header receive the canonical names when they hold exactly
+        the four expected fields.
+        """
+        sample = payload[: self.sniff_bytes].decode("utf-8-sig", errors="ignore")
+        lines = [line for line in sample.splitlines() if line.strip()]
+        if len(payload) > self.sniff_bytes and len(lines) > 1:
+            # The last sampled line is most likely cut in the middle
+            lines = lines[:-1]
+        if not lines:
+            raise ValueError("Uploaded dataset is empty.")
+
+        delimiter = self.detect_delimiter(lines)
+        rows = list(csv.reader(lines, delimiter=delimiter))
+        first, body = rows[0], rows[1:]
+
+        decimal = "."
+        if delimiter != ",":
+            values = [value.strip() for row in body for value in row]
+            comma_numbers = sum(bool(DECIMAL_COMMA_PATTERN.match(v)) for v in values)
+            point_numbers = sum(bool(DECIMAL_POINT_PATTERN.match(v)) for v in values)
+            if comma_numbers > point_numbers:
+                decimal = ","
+
+        # The first row is a header unless it holds numbers in columns that are
+        # numeric throughout the rest of the sample.
+        numeric_columns = [
+            index
+            for index in range(len(first))
+            if body
+            and sum(
+                self.is_number(row[index], decimal) for row in body if index < len(row)
+            )
+            > len(body) / 2
+        ]
+        header = not any(self.is_number(first[i], decimal) for i in numeric_columns)
+
+        if header:
+            columns = tuple(first)
+        elif len(first) == len(DEFAULT_DATASET_COLUMN_MAPPING):
+            columns = tuple(DEFAULT_DATASET_COLUMN_MAPPING.values())
+        else:
+            columns = tuple(f"column_{index}" for index in range(len(first)))
+        return CSVFormat(delimiter, decimal, header, columns)
+
+    # -------------------------------------------------------------------------------
+    @staticmethod
+    def match_canonical_columns(columns: tuple[str, ...]) -> dict[str, str]:
+        # Mirrors the first-token matching of column detection so the canonical
+        # fields are typed while parsing rather than converted afterwards.
+        matches: dict[str, str] = {}
+        for attr, pattern in DEFAULT_DATASET_COLUMN_MAPPING.items():
+            for column in columns:
+                if column in matches.values():
+                    continue
+                if re.search(pattern.split()[0], str(column), re.IGNORECASE):
+                    matches[attr] = column
+                    break
+        return matches
+
+    # -------------------------------------------------------------------------------
+    def canonical_dtypes(self, columns: tuple[str, ...]) -> dict[str, str]:
+        return {
+            column: "category" if attr == "experiment" else "float64"
+            for attr, column in self.match_canonical_columns(columns).items()
+        }
+
+    # -------------------------------------------------------------------------------
+    def read_csv_payload(self, payload: bytes, csv_format: CSVFormat) -> pd.DataFrame:
+        """Parse the whole CSV upload once using the sniffed dialect.
+
+        Keyword arguments:
+        payload -- Raw bytes representing the uploaded CSV file.
+        csv_format -- Dialect detected by :meth:`sniff_csv_format`.
+
+        Return value:
+        DataFrame with float64 measurements and a categorical experiment column
+        whenever the canonical fields could be recognized.
+        """
+        options: dict[str, Any] = {"sep": csv_format.delimiter}
+        if csv_format.header:
+            options["header"] = 0
+        else:
+            options["header"] = None
+            options["names"] = list(csv_format.columns)
+        # The Arrow reader does not support decimal commas
+        engine = "c"
+        if csv_format.decimal != ".":
+            options["decimal"] = csv_format.decimal
+        elif PYARROW_AVAILABLE:
+            engine = "pyarrow"
+
+        dtypes = self.canonical_dtypes(csv_format.columns)
+        if dtypes:
+            try:
+                return pd.read_csv(
+                    io.BytesIO(payload), engine=engine, dtype=dtypes, **options
+                )
+            except (TypeError, ValueError) as exc:
+                # Malformed measurements are filtered later by the processor, so a
+                # failed typed parse falls back to inferred dtypes.
+                logger.warning("Typed CSV parsing failed, inferring dtypes: %s", exc)
+        return pd.read_csv(io.BytesIO(payload), engine=engine, **options)
+
     # -------------------------------------------------------------------------------
     def format_dataset_summary(self, dataframe: pd.DataFrame) -> str:
         """Produce a textual overview of the dataset dimensions and missing values.
@@ -115,7 +445,8 @@ class DatasetService:
             f"Rows: {rows}",
             f"Columns: {columns}",
             f"NaN cells: {total_nans}",
-            "Column details:",
-            *column_summaries,
         ]
+        if "sheets" in dataframe.attrs:
+            summary_lines.append(f"Sheets: {', '.join(dataframe.attrs['sheets'])}")
+        summary_lines.extend(["Column details:", *column_summaries])
         return "\n".join(summary_lines)
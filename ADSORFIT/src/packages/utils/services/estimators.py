@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from dataclasses import replace
+
+import numpy as np
+
+from ADSORFIT.src.packages.utils.services.models import ModelSpec
+
+
+###############################################################################
+class InitialGuessEstimator:
+    def __init__(
+        self, tighten_bounds: bool = False, tightening_factor: float = 100.0
+    ) -> None:
+        self.tighten_bounds = tighten_bounds
+        self.tightening_factor = max(1.0, float(tightening_factor))
+        self.estimators: dict[
+            str, Callable[[np.ndarray, np.ndarray], dict[str, float]]
+        ] = {
+            "LANGMUIR": self.estimate_langmuir,
+            "SIPS": self.estimate_sips,
+            "FREUNDLICH": self.estimate_freundlich,
+            "TEMKIN": self.estimate_temkin,
+        }
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def linear_regression(
+        x: np.ndarray, y: np.ndarray
+    ) -> tuple[float, float] | None:
+        valid = np.isfinite(x) & np.isfinite(y)
+        if np.count_nonzero(valid) < 2:
+            return None
+        x, y = x[valid], y[valid]
+        x_centered = x - x.mean()
+        denominator = float(np.dot(x_centered, x_centered))
+        if denominator <= 0.0:
+            return None
+        slope = float(np.dot(x_centered, y - y.mean()) / denominator)
+        intercept = float(y.mean() - slope * x.mean())
+        return slope, intercept
+
+    # -------------------------------------------------------------------------
+    def estimate_langmuir(
+        self, pressure: np.ndarray, uptake: np.ndarray
+    ) -> dict[str, float]:
+        positive = (pressure > 0) & (uptake > 0)
+        max_uptake = float(uptake.max()) if uptake.size else 0.0
+        # Scatchard linearization: q/p = k*qsat - k*q
+        fit = self.linear_regression(
+            uptake[positive], uptake[positive] / pressure[positive]
+        )
+        if fit is not None and fit[0] < 0 and fit[1] > 0:
+            k = -fit[0]
+            return {"k": k, "qsat": fit[1] / k}
+        # Without a usable linear trend, saturation is taken from the largest uptake
+        # and the affinity from the inverse median pressure.
+        guess: dict[str, float] = {"qsat": max_uptake}
+        if positive.any():
+            guess["k"] = 1.0 / float(np.median(pressure[positive]))
+        return guess
+
+    # -------------------------------------------------------------------------
+    def estimate_sips(
+        self, pressure: np.ndarray, uptake: np.ndarray
+    ) -> dict[str, float]:
+        guess = self.estimate_langmuir(pressure, uptake)
+        guess["exponent"] = 1.0
+        return guess
+
+    # -------------------------------------------------------------------------
+    def estimate_freundlich(
+        self, pressure: np.ndarray, uptake: np.ndarray
+    ) -> dict[str, float]:
+        positive = (pressure > 0) & (uptake > 0)
+        # log-log regression: ln q = (1/n) ln p + (1/n) ln k
+        fit = self.linear_regression(
+            np.log(pressure[positive]), np.log(uptake[positive])
+        )
+        if fit is None or fit[0] <= 0:
+            return {}
+        exponent = 1.0 / fit[0]
+        return {"k": float(np.exp(fit[1] * exponent)), "exponent": exponent}
+
+    # -------------------------------------------------------------------------
+    def estimate_temkin(
+        self, pressure: np.ndarray, uptake: np.ndarray
+    ) -> dict[str, float]:
+        positive = pressure > 0
+        # Semi-log regression: q = beta ln k + beta ln p
+        fit = self.linear_regression(np.log(pressure[positive]), uptake[positive])
+        if fit is None or fit[0] <= 0:
+            return {}
+        beta = fit[0]
+        return {"k": float(np.exp(fit[1] / beta)), "beta": beta}
+
+    # -------------------------------------------------------------------------
+    def estimate(
+        self, spec: ModelSpec, pressure: np.ndarray, uptake: np.ndarray
+    ) -> ModelSpec:
+        """Derive an experiment-specific initial guess, and optionally tighter bounds.
+
+        Keyword arguments:
+        spec -- Model specification carrying the static guess and bounds.
+        pressure -- Pressure observations of the experiment.
+        uptake -- Measured uptakes corresponding to the pressure values.
+
+        Return value:
+        Copy of ``spec`` whose initial guess, and bounds when tightening is enabled,
+        are adapted to the experiment. Only parameters flagged in
+        ``spec.estimable`` are estimated. The original specification is returned
+        when no estimator applies.
+        """
+        estimator = self.estimators.get(spec.name.upper())
+        if estimator is None or (
+            spec.estimable is not None and not spec.estimable.any()
+        ):
+            return spec
+        with np.errstate(all="ignore"):
+            guess = estimator(pressure, uptake)
+        if not guess:
+            return spec
+
+        initial = spec.initial.copy()
+        for index, name in enumerate(spec.parameters):
+            if spec.estimable is not None and not spec.estimable[index]:
+                continue
+            value = guess.get(name)
+            if value is not None and np.isfinite(value):
+                initial[index] = value
+        initial = np.clip(initial, spec.lower, spec.upper)
+        if not self.tighten_bounds:
+            return replace(spec, initial=initial)
+
+        # Bounds shrink to a multiplicative window around positive estimates, never
+        # leaving the user-provided range.
+        lower = spec.lower.copy()
+        upper = spec.upper.copy()
+        positive = initial > 0
+        if spec.estimable is not None:
+            positive &= spec.estimable
+        lower[positive] = np.maximum(
+            spec.lower[positive], initial[positive] / self.tightening_factor
+        )
+        upper[positive] = np.minimum(
+            spec.upper[positive], initial[positive] * self.tightening_factor
+        )
+        collapsed = lower >= upper
+        lower[collapsed] = spec.lower[collapsed]
+        upper[collapsed] = spec.upper[collapsed]
+        return replace(spec, initial=initial, lower=lower, upper=upper)
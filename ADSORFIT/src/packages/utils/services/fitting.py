@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import inspect
-import json
 from collections.abc import Callable
+from dataclasses import replace
 from typing import Any
 
 import numpy as np
@@ -12,17 +12,206 @@ from scipy.optimize import curve_fit
 from ADSORFIT.src.packages.configurations import configurations
 from ADSORFIT.src.packages.logger import logger
 from ADSORFIT.src.packages.utils.repository.serializer import DataSerializer
-from ADSORFIT.src.packages.utils.services.models import AdsorptionModels
+from ADSORFIT.src.packages.utils.services.batched import BatchedLevenbergMarquardt
+from ADSORFIT.src.packages.utils.services.cache import FitCache, FitCacheSession
+from ADSORFIT.src.packages.utils.services.estimators import InitialGuessEstimator
+from ADSORFIT.src.packages.utils.services.models import AdsorptionModels, ModelSpec
+from ADSORFIT.src.packages.utils.services.parallel import ParallelFittingExecutor
+from ADSORFIT.src.packages.utils.services.persistence import (
+    PersistenceError,
+    ResultBatchPersistence,
+    WriteBehindWriter,
+)
 from ADSORFIT.src.packages.utils.services.processing import (
     AdsorptionDataProcessor,
     DatasetAdapter,
+    DatasetColumns,
+    ExperimentChunker,
+    ExperimentStore,
 )
+from ADSORFIT.src.packages.utils.services.registry import DatasetRegistry
+from ADSORFIT.src.packages.utils.services.separable import SeparableSolver
+
+ResultCallback = Callable[[str, dict[str, dict[str, Any]]], None]
+# Memory held per measurement by the derived structures of a streaming chunk
+# (typed columns, experiment store, encoded vectors and solver buffers), on top of
+# the raw row itself. Rows read back from the database are assumed to be small.
+STREAMING_BYTES_PER_MEASUREMENT = 256
+DATABASE_ROW_BYTES = 128
+MIN_STREAMING_CHUNK_ROWS = 1000
 
 
 ###############################################################################
 class ModelSolver:
     def __init__(self) -> None:
         self.collection = AdsorptionModels()
+        self.batched_engine = BatchedLevenbergMarquardt()
+        self.separable_solver = SeparableSolver()
+        self.estimator = InitialGuessEstimator(
+            tighten_bounds=configurations.server.fitting.tighten_bounds,
+            tightening_factor=configurations.server.fitting.bound_tightening_factor,
+        )
+
+    # -------------------------------------------------------------------------
+    def build_model_specs(
+        self, configuration: dict[str, dict[str, dict[str, float]]]
+    ) -> dict[str, ModelSpec]:
+        """Compile the per-model configuration into reusable solver specifications.
+
+        Keyword arguments:
+        configuration -- Normalized per-model fitting configuration, including bounds
+        and initial guesses.
+
+        Return value:
+        Dictionary keyed by model names holding ordered parameter names, bound and
+        initial guess arrays, and the model and Jacobian callables.
+        """
+        fitting_settings = configurations.server.fitting
+        specs: dict[str, ModelSpec] = {}
+        for model_name, model_config in configuration.items():
+            model = self.collection.get_model(model_name)
+            signature = inspect.signature(model)
+            param_names = tuple(signature.parameters.keys())[1:]
+            # ``curve_fit`` expects ordered arrays for initial guess and bounds, so we
+            # align configuration dictionaries with the model signature parameters.
+            initial_values = model_config.get("initial", {})
+            min_values = model_config.get("min", {})
+            max_values = model_config.get("max", {})
+            specs[model_name] = ModelSpec(
+                name=model_name,
+                parameters=param_names,
+                initial=np.array(
+                    [
+                        initial_values.get(
+                            param, fitting_settings.parameter_initial_default
+                        )
+                        for param in param_names
+                    ],
+                    dtype=np.float64,
+                ),
+                lower=np.array(
+                    [
+                        min_values.get(param, fitting_settings.parameter_min_default)
+                        for param in param_names
+                    ],
+                    dtype=np.float64,
+                ),
+                upper=np.array(
+                    [
+                        max_values.get(param, fitting_settings.parameter_max_default)
+                        for param in param_names
+                    ],
+                    dtype=np.float64,
+                ),
+                function=model,
+                jacobian=self.resolve_jacobian(model_name),
+                # Initial values sent by the client always take precedence over
+                # the data-driven estimates
+                estimable=np.array(
+                    [param not in initial_values for param in param_names],
+                    dtype=bool,
+                ),
+            )
+        return specs
+
+    # -------------------------------------------------------------------------
+    def resolve_jacobian(self, model_name: str) -> Callable[..., np.ndarray] | None:
+        # Disabling analytic Jacobians falls back to finite differences, which is
+        # kept as a switch to compare both approaches on the same dataset.
+        if not configurations.server.fitting.analytic_jacobian:
+            return None
+        return self.collection.get_jacobian(model_name)
+
+    # -------------------------------------------------------------------------
+    def prepare_spec(
+        self, spec: ModelSpec, pressure: np.ndarray, uptake: np.ndarray
+    ) -> ModelSpec:
+        if not configurations.server.fitting.data_driven_initial_guess:
+            return spec
+        return self.estimator.estimate(spec, pressure, uptake)
+
+    # -------------------------------------------------------------------------
+    def fit_model(
+        self,
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        experiment_name: str,
+        spec: ModelSpec,
+        max_iterations: int,
+    ) -> dict[str, Any]:
+        """Fit a single model against one experiment.
+
+        Models with a linear structure are solved through the separable fast paths
+        when enabled; every other case, including fast-path solutions rejected by the
+        bounds, goes through ``curve_fit``.
+
+        Keyword arguments:
+        pressure -- Pressure observations expressed as a NumPy array.
+        uptake -- Measured uptakes corresponding to the pressure values.
+        experiment_name -- Identifier of the current experiment, used for logging.
+        spec -- Precompiled specification of the model to fit.
+        max_iterations -- Maximum number of solver evaluations allowed by ``curve_fit``.
+
+        Return value:
+        Dictionary containing optimal parameters, errors, and diagnostics.
+        """
+        if configurations.server.fitting.separable_fast_paths:
+            separable = self.separable_solver.solve(
+                spec, pressure, uptake, max_iterations
+            )
+            if separable is not None:
+                return separable
+
+        evaluations = max(1, int(max_iterations))
+        param_names = list(spec.parameters)
+        try:
+            optimal_params, covariance, infodict, _, _ = curve_fit(
+                spec.function,
+                pressure,
+                uptake,
+                p0=spec.initial,
+                bounds=(spec.lower, spec.upper),
+                jac=spec.jacobian,
+                maxfev=evaluations,
+                check_finite=True,
+                absolute_sigma=False,
+                full_output=True,
+            )
+            optimal_list = optimal_params.tolist()
+            predicted = spec.evaluate(pressure, optimal_params)
+            # Least squares score is kept for ranking models within the pipeline.
+            lss = float(np.sum((uptake - predicted) ** 2, dtype=np.float64))
+            errors = (
+                np.sqrt(np.diag(covariance)).tolist()
+                if covariance is not None
+                else None
+            )
+            return {
+                "optimal_params": optimal_list,
+                "covariance": covariance.tolist()
+                if covariance is not None
+                else None,
+                "errors": errors
+                if errors is not None
+                else [np.nan] * len(param_names),
+                "LSS": lss,
+                "arguments": param_names,
+                "evaluations": int(infodict.get("nfev", 0)),
+            }
+        except Exception as exc:  # noqa: BLE001
+            logger.exception(
+                "Failed to fit experiment %s with model %s",
+                experiment_name,
+                spec.name,
+            )
+            return {
+                "optimal_params": [np.nan] * len(param_names),
+                "covariance": None,
+                "errors": [np.nan] * len(param_names),
+                "LSS": np.nan,
+                "arguments": param_names,
+                "exception": exc,
+            }
 
     # -------------------------------------------------------------------------
     def single_experiment_fit(
@@ -30,7 +219,7 @@ class ModelSolver:
         pressure: np.ndarray,
         uptake: np.ndarray,
         experiment_name: str,
-        configuration: dict[str, Any],
+        specs: dict[str, ModelSpec],
         max_iterations: int,
     ) -> dict[str, dict[str, Any]]:
         """Fit every configured model against a single experiment dataset.
@@ -39,8 +228,8 @@ class ModelSolver:
         pressure -- Pressure observations expressed as a NumPy array.
         uptake -- Measured uptakes corresponding to the pressure values.
         experiment_name -- Identifier of the current experiment, used for logging.
-        configuration -- Per-model fitting configuration, including bounds and initial
-        guesses.
+        specs -- Precompiled model specifications built by
+        :meth:`build_model_specs`.
         max_iterations -- Maximum number of solver evaluations allowed by ``curve_fit``.
 
         Return value:
@@ -48,112 +237,325 @@ class ModelSolver:
         diagnostics.
         """
         results: dict[str, dict[str, Any]] = {}
-        evaluations = max(1, int(max_iterations))
-        fitting_settings = configurations.server.fitting
-        for model_name, model_config in configuration.items():
-            model = self.collection.get_model(model_name)
-            signature = inspect.signature(model)
-            param_names = list(signature.parameters.keys())[1:]
-            # ``curve_fit`` expects ordered arrays for initial guess and bounds, so we
-            # align configuration dictionaries with the model signature parameters.
-            initial = [
-                model_config.get("initial", {}).get(
-                    param, fitting_settings.parameter_initial_default
-                )
-                for param in param_names
-            ]
-            lower = [
-                model_config.get("min", {}).get(
-                    param, fitting_settings.parameter_min_default
-                )
-                for param in param_names
+        for model_name, spec in specs.items():
+            results[model_name] = self.fit_model(
+                pressure,
+                uptake,
+                experiment_name,
+                self.prepare_spec(spec, pressure, uptake),
+                max_iterations,
+            )
+        return results
+
+    # -------------------------------------------------------------------------
+    def batched_experiment_fit(
+        self,
+        pressures: list[np.ndarray],
+        uptakes: list[np.ndarray],
+        experiment_names: list[str],
+        specs: dict[str, ModelSpec],
+        max_iterations: int,
+    ) -> list[dict[str, dict[str, Any]]]:
+        """Fit a batch of experiments model by model with the vectorized LM engine.
+
+        Keyword arguments:
+        pressures -- Pressure vectors, one per experiment.
+        uptakes -- Uptake vectors aligned with ``pressures``.
+        experiment_names -- Experiment identifiers used for logging.
+        specs -- Precompiled model specifications built by
+        :meth:`build_model_specs`.
+        max_iterations -- Maximum number of solver evaluations per model fit.
+
+        Return value:
+        List of per-experiment results with the same layout produced by
+        :meth:`single_experiment_fit`.
+        """
+        entries: list[dict[str, dict[str, Any]]] = [{} for _ in pressures]
+        for model_name, spec in specs.items():
+            param_names = list(spec.parameters)
+            experiment_specs = [
+                self.prepare_spec(spec, pressure, uptake)
+                for pressure, uptake in zip(pressures, uptakes, strict=False)
             ]
-            upper = [
-                model_config.get("max", {}).get(
-                    param, fitting_settings.parameter_max_default
+            batch = self.batched_engine.fit(
+                spec,
+                pressures,
+                uptakes,
+                max_iterations,
+                initial=np.stack([item.initial for item in experiment_specs]),
+                lower=np.stack([item.lower for item in experiment_specs]),
+                upper=np.stack([item.upper for item in experiment_specs]),
+            )
+            fallback_count = 0
+            for index, entry in enumerate(entries):
+                if not batch.converged[index]:
+                    # Experiments the batched engine cannot settle are refitted with
+                    # the reference ``curve_fit`` path.
+                    fallback_count += 1
+                    entry[model_name] = self.fit_model(
+                        pressures[index],
+                        uptakes[index],
+                        experiment_names[index],
+                        experiment_specs[index],
+                        max_iterations,
+                    )
+                    continue
+                covariance = batch.covariance[index]
+                entry[model_name] = {
+                    "optimal_params": batch.parameters[index].tolist(),
+                    "covariance": covariance.tolist(),
+                    "errors": np.sqrt(np.diag(covariance)).tolist(),
+                    "LSS": float(batch.lss[index]),
+                    "arguments": param_names,
+                }
+            if fallback_count:
+                logger.debug(
+                    "Model %s: %s of %s experiments fell back to curve_fit",
+                    model_name,
+                    fallback_count,
+                    len(entries),
                 )
-                for param in param_names
-            ]
+        return entries
 
-            try:
-                optimal_params, covariance = curve_fit(
-                    model,
+    # -------------------------------------------------------------------------
+    def initial_guess_report(
+        self,
+        store: ExperimentStore,
+        configuration: dict[str, Any],
+        max_iterations: int,
+    ) -> dict[str, dict[str, float]]:
+        """Compare function evaluations of data-driven and static initial guesses.
+
+        Keyword arguments:
+        store -- Sample of experiments used for the comparison.
+        configuration -- Collection of model-specific fitting parameters and bounds.
+        max_iterations -- Maximum number of solver evaluations per model fit.
+
+        Return value:
+        Dictionary keyed by model names with the total evaluations spent from the
+        static guess, from the data-driven guess, and the relative reduction.
+        """
+        specs = self.build_model_specs(configuration)
+        pressures, uptakes = store.pressures(), store.uptakes()
+        experiment_names = store.experiments.tolist()
+        report: dict[str, dict[str, float]] = {}
+        for model_name, spec in specs.items():
+            static_total = 0
+            estimated_total = 0
+            for pressure, uptake, name in zip(
+                pressures, uptakes, experiment_names, strict=False
+            ):
+                static = self.fit_model(pressure, uptake, name, spec, max_iterations)
+                estimated = self.fit_model(
                     pressure,
                     uptake,
-                    p0=initial,
-                    bounds=(lower, upper),
-                    maxfev=evaluations,
-                    check_finite=True,
-                    absolute_sigma=False,
+                    name,
+                    self.estimator.estimate(
+                        replace(spec, estimable=None), pressure, uptake
+                    ),
+                    max_iterations,
                 )
-                optimal_list = optimal_params.tolist()
-                predicted = model(pressure, *optimal_params)
-                # Least squares score is kept for ranking models within the pipeline.
-                lss = float(np.sum((uptake - predicted) ** 2, dtype=np.float64))
-                errors = (
-                    np.sqrt(np.diag(covariance)).tolist()
-                    if covariance is not None
-                    else None
+                static_total += static.get("evaluations", 0)
+                estimated_total += estimated.get("evaluations", 0)
+            reduction = 1.0 - estimated_total / static_total if static_total else 0.0
+            report[model_name] = {
+                "static_evaluations": float(static_total),
+                "data_driven_evaluations": float(estimated_total),
+                "reduction": float(reduction),
+            }
+            logger.info(
+                "Model %s: %s evaluations with data-driven guesses, %s with static "
+                "guesses (%.1f%% reduction)",
+                model_name,
+                estimated_total,
+                static_total,
+                reduction * 100.0,
+            )
+        return report
+
+    # -------------------------------------------------------------------------
+    def fit_experiments(
+        self,
+        store: ExperimentStore,
+        specs: dict[str, ModelSpec],
+        max_iterations: int,
+        progress_callback: Callable[[int, int], None] | None = None,
+        result_callback: ResultCallback | None = None,
+    ) -> list[dict[str, dict[str, Any]]]:
+        """Fit experiments with the solver backend selected in the configuration.
+
+        Keyword arguments:
+        store -- Experiment store providing zero-copy measurement slices.
+        specs -- Precompiled model specifications built by
+        :meth:`build_model_specs`.
+        max_iterations -- Maximum number of solver evaluations per model fit.
+        progress_callback -- Optional callable receiving the processed experiment count
+        and total experiments.
+        result_callback -- Optional callable receiving the name and results of every
+        experiment as soon as they are available.
+
+        Return value:
+        List of per-experiment results with the layout produced by
+        :meth:`single_experiment_fit`, ordered as the input experiments.
+        """
+        total_experiments = store.experiment_count
+        pressures, uptakes = store.pressures(), store.uptakes()
+        experiment_names = store.experiments.tolist()
+        fitting_settings = configurations.server.fitting
+        workers = ParallelFittingExecutor.resolve_worker_count(
+            fitting_settings.parallel_workers, total_experiments
+        )
+        if fitting_settings.solver_backend == "batched":
+            experiment_entries = []
+            batch_size = fitting_settings.batch_size
+            for start in range(0, total_experiments, batch_size):
+                stop = min(start + batch_size, total_experiments)
+                batch_entries = self.batched_experiment_fit(
+                    pressures[start:stop],
+                    uptakes[start:stop],
+                    experiment_names[start:stop],
+                    specs,
+                    max_iterations,
                 )
-                results[model_name] = {
-                    "optimal_params": optimal_list,
-                    "covariance": covariance.tolist()
-                    if covariance is not None
-                    else None,
-                    "errors": errors
-                    if errors is not None
-                    else [np.nan] * len(param_names),
-                    "LSS": lss,
-                    "arguments": param_names,
-                }
-            except Exception as exc:  # noqa: BLE001
-                logger.exception(
-                    "Failed to fit experiment %s with model %s",
-                    experiment_name,
-                    model_name,
+                experiment_entries.extend(batch_entries)
+                if result_callback is not None:
+                    for name, entry in zip(
+                        experiment_names[start:stop], batch_entries, strict=True
+                    ):
+                        result_callback(name, entry)
+                if progress_callback is not None:
+                    progress_callback(stop, total_experiments)
+        elif workers > 1:
+            executor = ParallelFittingExecutor(
+                workers, fitting_settings.parallel_chunk_size
+            )
+            experiment_entries = executor.run(
+                store,
+                specs,
+                max_iterations,
+                progress_callback=progress_callback,
+                result_callback=result_callback,
+            )
+        else:
+            experiment_entries = []
+            for index in range(total_experiments):
+                entry = self.single_experiment_fit(
+                    pressures[index],
+                    uptakes[index],
+                    experiment_names[index],
+                    specs,
+                    max_iterations,
                 )
-                results[model_name] = {
-                    "optimal_params": [np.nan] * len(param_names),
-                    "covariance": None,
-                    "errors": [np.nan] * len(param_names),
-                    "LSS": np.nan,
-                    "arguments": param_names,
-                    "exception": exc,
-                }
-        return results
+                experiment_entries.append(entry)
+                if result_callback is not None:
+                    result_callback(experiment_names[index], entry)
+                if progress_callback is not None:
+                    progress_callback(index + 1, total_experiments)
+        return experiment_entries
 
     # -------------------------------------------------------------------------
     def bulk_data_fitting(
         self,
-        dataset: pd.DataFrame,
+        store: ExperimentStore,
         configuration: dict[str, Any],
-        pressure_col: str,
-        uptake_col: str,
         max_iterations: int,
         progress_callback: Callable[[int, int], None] | None = None,
+        cache: FitCacheSession | None = None,
+        result_callback: ResultCallback | None = None,
     ) -> dict[str, list[dict[str, Any]]]:
-        """Iterate over the dataset and fit every experiment with the configured models."""
+        """Iterate over the stored experiments and fit them with the configured models.
+
+        Experiments whose results are all available in ``cache`` are reused as they
+        are; the remaining ones are fitted and their results stored back.
+        """
         results: dict[str, list[dict[str, Any]]] = {
             model: [] for model in configuration.keys()
         }
-        total_experiments = dataset.shape[0]
-        for index, row in dataset.iterrows():
-            pressure = np.asarray(row[pressure_col], dtype=np.float64)
-            uptake = np.asarray(row[uptake_col], dtype=np.float64)
-            experiment_name = row.get("experiment", f"experiment_{index}")
-            experiment_results = self.single_experiment_fit(
-                pressure,
-                uptake,
-                experiment_name,
-                configuration,
+        total_experiments = store.experiment_count
+
+        # Specifications are compiled once per job so the hot loop only indexes into
+        # precomputed arrays instead of re-inspecting every model per experiment.
+        specs = self.build_model_specs(configuration)
+        experiment_entries: list[dict[str, dict[str, Any]] | None] = [
+            None
+        ] * total_experiments
+        experiment_keys: list[dict[str, str]] = []
+        pending = list(range(total_experiments))
+        if cache is not None:
+            for index in range(total_experiments):
+                experiment_hash = FitCache.hash_experiment(*store.experiment(index))
+                experiment_keys.append(
+                    {
+                        name: FitCache.build_key(experiment_hash, spec, max_iterations)
+                        for name, spec in specs.items()
+                    }
+                )
+            cached = cache.lookup(
+                [key for keys in experiment_keys for key in keys.values()]
+            )
+            pending = []
+            for index, keys in enumerate(experiment_keys):
+                if all(key in cached for key in keys.values()):
+                    experiment_entries[index] = {
+                        name: cached[key] for name, key in keys.items()
+                    }
+                else:
+                    pending.append(index)
+            cache.hits += (total_experiments - len(pending)) * len(specs)
+            cache.misses += len(pending) * len(specs)
+            logger.info(
+                "Fit cache: %s experiments reused, %s to fit",
+                total_experiments - len(pending),
+                len(pending),
+            )
+
+        reused = total_experiments - len(pending)
+        if result_callback is not None and reused:
+            for index, entry in enumerate(experiment_entries):
+                if entry is not None:
+                    result_callback(str(store.experiments[index]), entry)
+        if progress_callback is not None and reused:
+            progress_callback(reused, total_experiments)
+        offset_callback = None
+        if progress_callback is not None:
+            # Cached experiments are already complete, so fitted ones count on top
+            def offset_callback(completed: int, _: int) -> None:
+                progress_callback(reused + completed, total_experiments)
+
+        if pending:
+            # Without cache hits every experiment is pending and the store is used
+            # as is, avoiding a gather of the measurement arrays.
+            pending_store = (
+                store if reused == 0 else store.take(np.asarray(pending, np.int64))
+            )
+            fitted = self.fit_experiments(
+                pending_store,
+                specs,
                 max_iterations,
+                progress_callback=offset_callback,
+                result_callback=result_callback,
             )
+            for index, entry in zip(pending, fitted, strict=True):
+                experiment_entries[index] = entry
+            if cache is not None:
+                cache.store(
+                    {
+                        experiment_keys[index][name]: (name, entry[name])
+                        for index, entry in zip(pending, fitted, strict=True)
+                        for name in entry
+                    }
+                )
+
+        for index, experiment_results in enumerate(experiment_entries):
+            # Results are aligned with the processed rows by position, a gap would
+            # shift every later experiment onto the wrong row
+            if experiment_results is None:
+                raise RuntimeError(
+                    f"Experiment {store.experiments[index]} has no fitting result."
+                )
             for model_name, data in experiment_results.items():
                 results[model_name].append(data)
 
-            if progress_callback is not None:
-                progress_callback(index + 1, total_experiments)
-
         return results
 
 
@@ -163,6 +565,17 @@ class FittingPipeline:
         self.serializer = DataSerializer()
         self.solver = ModelSolver()
         self.adapter = DatasetAdapter()
+        self.registry = DatasetRegistry()
+        fitting_settings = configurations.server.fitting
+        self.cache = (
+            FitCache(
+                fitting_settings.fit_cache_memory_entries,
+                fitting_settings.fit_cache_max_mb * 1024 * 1024,
+                self.serializer,
+            )
+            if fitting_settings.fit_cache_enabled
+            else None
+        )
 
     # -------------------------------------------------------------------------
     def run(
@@ -172,51 +585,223 @@ class FittingPipeline:
         max_iterations: int,
         save_best: bool,
         progress_callback: Callable[[int, int], None] | None = None,
+        use_cache: bool = True,
+        incremental: bool = False,
+        result_callback: ResultCallback | None = None,
+        streaming: bool = False,
+        writer: WriteBehindWriter | None = None,
     ) -> dict[str, Any]:
+        """Preprocess the uploaded dataset, fit every model and persist the results.
+
+        Each call stores its rows under a new run identifier, which becomes the
+        latest stored run once every write completed. In incremental mode only
+        experiments that are new or whose content changed since the latest run are
+        fitted; results of unchanged experiments are copied from it. Results are
+        only reused when the latest run fitted with the same configuration, any
+        change of models, bounds, guesses or iteration budget refits everything.
+        Streaming runs, and runs over the stored raw measurements, are delegated to
+        :meth:`run_streaming`.
+
+        With write-behind persistence, table writes go through ``writer`` and
+        overlap with fitting. A writer supplied by the caller is left open so the
+        caller decides when to wait for it; otherwise one is created and drained
+        before returning, raising PersistenceError when a write failed.
+        """
+        settings = configurations.server.fitting
+        if writer is None and settings.write_behind:
+            writer = WriteBehindWriter(settings.write_queue_size)
+            try:
+                response = self.run(
+                    dataset_payload,
+                    configuration,
+                    max_iterations,
+                    save_best,
+                    progress_callback=progress_callback,
+                    use_cache=use_cache,
+                    incremental=incremental,
+                    result_callback=result_callback,
+                    streaming=streaming,
+                    writer=writer,
+                )
+            finally:
+                errors = writer.close()
+            if errors:
+                raise PersistenceError("; ".join(errors))
+            return response
+
+        from_database = dataset_payload.get("source") == "database"
+        if streaming or from_database:
+            if incremental:
+                raise ValueError(
+                    "Incremental runs are not supported in streaming mode."
+                )
+            return self.run_streaming(
+                dataset_payload,
+                configuration,
+                max_iterations,
+                save_best,
+                progress_callback=progress_callback,
+                use_cache=use_cache,
+                result_callback=result_callback,
+                writer=writer,
+            )
+
         dataframe = self.build_dataframe(dataset_payload)
         if dataframe.empty:
             raise ValueError("Uploaded dataset is empty.")
 
-        logger.info("Saving raw dataset with %s rows", dataframe.shape[0])
-        self.serializer.save_raw_dataset(dataframe)
+        model_configuration = self.normalize_configuration(configuration)
+        configuration_hash = FitCache.hash_configuration(
+            self.solver.build_model_specs(model_configuration), max_iterations
+        )
+        # Every run appends its own rows; they become the latest stored results
+        # only once the run is marked completed after the last write.
+        run_id = self.serializer.create_run(
+            save_best, configuration_hash=configuration_hash
+        )
+        logger.info(
+            "Saving raw dataset with %s rows for run %s", dataframe.shape[0], run_id
+        )
+        self.persist(
+            writer, "raw dataset", self.serializer.save_raw_dataset, dataframe, run_id
+        )
 
         processor = AdsorptionDataProcessor(dataframe)
-        processed, detected_columns, stats = processor.preprocess(detect_columns=True)
+        store, detected_columns, stats = processor.preprocess(detect_columns=True)
 
-        logger.info("Processed dataset contains %s experiments", processed.shape[0])
-        serializable_processed = self.stringify_sequences(processed)
-        self.serializer.save_processed_dataset(serializable_processed)
+        logger.info("Processed dataset contains %s experiments", store.experiment_count)
+        # The store is expanded into the tabular layout only for persistence, with
+        # vectors encoded directly in the format of the target table.
+        serializable_processed = store.to_dataframe(
+            detected_columns, encoder=self.serializer.encode_vector
+        )
+        diff = None
+        source_run = self.serializer.latest_run_id() if incremental else None
+        if incremental:
+            # Stored results fitted under another configuration are never reused,
+            # their experiments are reported as modified and refitted.
+            fitted_experiments: set[str] = set()
+            source_record = (
+                self.serializer.load_run(source_run) if source_run is not None else None
+            )
+            if (
+                source_record is not None
+                and source_record.get("configuration_hash") == configuration_hash
+            ):
+                fitted_experiments = self.serializer.load_fitted_experiments(source_run)
+            elif source_record is not None:
+                logger.info(
+                    "Fitting configuration differs from run %s, refitting every "
+                    "experiment",
+                    source_run,
+                )
+            diff = self.adapter.diff_experiments(
+                serializable_processed,
+                self.serializer.load_processed_dataset(source_run),
+                fitted_experiments,
+                detected_columns,
+            )
+            logger.info(
+                "Incremental run: %s added, %s modified, %s unchanged, %s deleted",
+                len(diff.added),
+                len(diff.modified),
+                len(diff.unchanged),
+                len(diff.deleted),
+            )
+        self.persist(
+            writer,
+            "processed dataset",
+            self.serializer.save_processed_dataset,
+            serializable_processed,
+            run_id,
+        )
 
         logger.debug("Detected dataset statistics:\n%s", stats)
 
-        if processed.empty:
+        if store.empty:
             raise ValueError(
                 "No valid experiments found after preprocessing the dataset."
             )
 
-        model_configuration = self.normalize_configuration(configuration)
         logger.debug("Running solver with configuration: %s", model_configuration)
 
+        cache_session = (
+            FitCacheSession(self.cache)
+            if self.cache is not None and use_cache
+            else None
+        )
+        fitting_store = store if diff is None else store.select(diff.refit)
+        if diff is not None and source_run is not None and diff.unchanged:
+            self.persist(
+                writer,
+                "reused fitting results",
+                self.serializer.carry_over_experiments,
+                source_run,
+                run_id,
+                diff.unchanged,
+            )
+        batches = None
+        if writer is not None:
+            # Results are written in batches while the remaining experiments are
+            # still being fitted.
+            batches = ResultBatchPersistence(
+                writer,
+                self.serializer,
+                self.adapter,
+                fitting_store,
+                run_id,
+                settings.result_batch_size,
+                save_best,
+                settings.preview_row_limit,
+                downstream=result_callback,
+            )
         results = self.solver.bulk_data_fitting(
-            processed,
+            fitting_store,
             model_configuration,
-            detected_columns.pressure,
-            detected_columns.uptake,
             max_iterations,
             progress_callback=progress_callback,
+            cache=cache_session,
+            result_callback=batches if batches is not None else result_callback,
         )
+        if batches is not None:
+            batches.flush()
 
-        combined = self.adapter.combine_results(results, processed)
-        self.serializer.save_fitting_results(combined)
+        report_sample = configurations.server.fitting.initial_guess_report_sample
+        evaluation_report = None
+        if report_sample > 0:
+            evaluation_report = self.solver.initial_guess_report(
+                store.head(report_sample),
+                model_configuration,
+                max_iterations,
+            )
 
         best_frame = None
+        if batches is not None:
+            preview_indices, preview_results = batches.preview_results()
+        else:
+            self.serializer.save_model_fits(
+                self.adapter.build_model_fits(results, fitting_store.experiments),
+                run_id,
+            )
+            preview_indices = np.arange(
+                min(settings.preview_row_limit, fitting_store.experiment_count)
+            )
+            preview_results = {
+                model: entries[: preview_indices.size]
+                for model, entries in results.items()
+            }
         if save_best:
-            best_frame = self.adapter.compute_best_models(combined)
-            self.serializer.save_best_fit(best_frame)
+            best_frame = self.preview_best_models(
+                fitting_store.take(preview_indices),
+                preview_results,
+                detected_columns,
+            )
+        self.persist(writer, "run completion", self.serializer.finish_run, run_id)
 
-        experiment_count = int(processed.shape[0])
+        experiment_count = store.experiment_count
         response: dict[str, Any] = {
             "status": "success",
+            "run_id": run_id,
             "processed_rows": experiment_count,
             "models": sorted(model_configuration.keys()),
             "best_model_saved": bool(save_best),
@@ -224,19 +809,270 @@ class FittingPipeline:
 
         if best_frame is not None:
             response["best_model_preview"] = self.build_preview(best_frame)
+        if evaluation_report is not None:
+            response["evaluation_report"] = evaluation_report
+        if cache_session is not None:
+            response["cache_statistics"] = cache_session.statistics()
+        if diff is not None:
+            response["incremental_summary"] = diff.as_summary()
 
         summary_lines = [
             "[INFO] ADSORFIT fitting completed.",
             f"Experiments processed: {experiment_count}",
         ]
+        if diff is not None:
+            summary_lines.append(
+                f"Experiments reused: {len(diff.unchanged)}, refit: "
+                f"{len(diff.refit)}, deleted: {len(diff.deleted)}"
+            )
+        if save_best:
+            summary_lines.append("Best model selection stored in database.")
+        response["summary"] = "\n".join(summary_lines)
+
+        return response
+
+    # -------------------------------------------------------------------------
+    def preview_best_models(
+        self,
+        store: ExperimentStore,
+        results: dict[str, list[dict[str, Any]]],
+        columns: DatasetColumns,
+    ) -> pd.DataFrame:
+        # Stored runs select best models in SQL, the wide layout is only rebuilt
+        # here for the handful of experiments shown in the response.
+        combined = self.adapter.combine_results(
+            results, store.to_dataframe(columns, encoder=self.serializer.encode_vector)
+        )
+        return self.adapter.compute_best_models(combined)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def persist(
+        writer: WriteBehindWriter | None,
+        label: str,
+        function: Callable[..., Any],
+        *args: Any,
+    ) -> None:
+        if writer is None:
+            function(*args)
+        else:
+            writer.submit(label, function, *args)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def estimate_chunk_rows(row_bytes: float) -> int:
+        budget = configurations.server.fitting.streaming_memory_mb * 1024 * 1024
+        per_measurement = max(1.0, row_bytes) + STREAMING_BYTES_PER_MEASUREMENT
+        return max(MIN_STREAMING_CHUNK_ROWS, int(budget // per_measurement))
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def offset_progress(
+        progress_callback: Callable[[int, int], None] | None, offset: int, total: int
+    ) -> Callable[[int, int], None] | None:
+        # Chunk-level progress is shifted by the experiments of previous chunks
+        if progress_callback is None:
+            return None
+
+        def report(completed: int, _: int) -> None:
+            progress_callback(offset + completed, max(total, offset + completed))
+
+        return report
+
+    # -------------------------------------------------------------------------
+    def run_streaming(
+        self,
+        dataset_payload: dict[str, Any],
+        configuration: dict[str, dict[str, dict[str, float]]],
+        max_iterations: int,
+        save_best: bool,
+        progress_callback: Callable[[int, int], None] | None = None,
+        use_cache: bool = True,
+        result_callback: ResultCallback | None = None,
+        writer: WriteBehindWriter | None = None,
+    ) -> dict[str, Any]:
+        """Fit the dataset in experiment-aligned chunks bounded by the memory budget.
+
+        Keyword arguments:
+        dataset_payload -- Registered or inline dataset, or ``{"source": "database"}``
+        to stream the measurements of the latest run stored in ``ADSORPTION_DATA``.
+        configuration -- Per-model fitting configuration.
+        max_iterations -- Maximum number of solver evaluations per experiment.
+        save_best -- Whether to persist the best model selection.
+        progress_callback -- Optional callable receiving completed and total counts.
+        use_cache -- Whether fits may be served from the fit cache.
+        result_callback -- Optional callable receiving every fitted experiment.
+        writer -- Optional write-behind writer receiving the table appends.
+
+        Return value:
+        Response dictionary shaped like the one of :meth:`run`. Each chunk is
+        preprocessed, fitted and appended to the stored tables before the next one
+        is read, so only one chunk of derived data is alive at a time.
+        """
+        from_database = dataset_payload.get("source") == "database"
+        source_run: str | None = None
+        if from_database:
+            source_run = self.serializer.raw_run_id(self.serializer.latest_run_id())
+            if source_run is None:
+                raise ValueError("No stored measurements are available for fitting.")
+            # The raw table always uses the canonical column names
+            chunk_rows = self.estimate_chunk_rows(DATABASE_ROW_BYTES)
+            chunker = ExperimentChunker(DatasetColumns().experiment, chunk_rows)
+            chunks = chunker.align(
+                self.serializer.iterate_raw_dataset(chunk_rows, source_run)
+            )
+            total = self.serializer.count_raw_experiments(source_run)
+        else:
+            dataframe = self.build_dataframe(dataset_payload)
+            if dataframe.empty:
+                raise ValueError("Uploaded dataset is empty.")
+            probe = AdsorptionDataProcessor(dataframe)
+            probe.identify_columns()
+            experiment_column = probe.columns.experiment
+            if experiment_column not in dataframe.columns:
+                raise ValueError(f"Missing dataset columns: {experiment_column}")
+            row_bytes = dataframe.memory_usage(deep=True).sum() / dataframe.shape[0]
+            chunk_rows = self.estimate_chunk_rows(row_bytes)
+            chunker = ExperimentChunker(experiment_column, chunk_rows)
+            chunks = chunker.split_dataframe(dataframe)
+            total = int(dataframe[experiment_column].nunique())
+
+        model_configuration = self.normalize_configuration(configuration)
+        cache_session = (
+            FitCacheSession(self.cache)
+            if self.cache is not None and use_cache
+            else None
+        )
+        report_sample = configurations.server.fitting.initial_guess_report_sample
+        preview_limit = configurations.server.fitting.preview_row_limit
+        logger.info(
+            "Streaming fitting run with chunks of %s measurements from %s",
+            chunk_rows,
+            "the stored raw dataset" if from_database else "the uploaded dataset",
+        )
+
+        # Measurements read from the database are referenced through the source
+        # run rather than copied, so the run does not duplicate the raw archive
+        configuration_hash = FitCache.hash_configuration(
+            self.solver.build_model_specs(model_configuration), max_iterations
+        )
+        run_id = self.serializer.create_run(save_best, source_run, configuration_hash)
+        completed = 0
+        chunk_count = 0
+        rejected = 0
+        preview: list[dict[str, Any]] = []
+        evaluation_report = None
+        for chunk in chunks:
+            chunk_count += 1
+            if not from_database:
+                self.persist(
+                    writer,
+                    "raw dataset",
+                    self.serializer.save_raw_dataset,
+                    chunk.drop(columns=["id", "run_id"], errors="ignore"),
+                    run_id,
+                )
+            processor = AdsorptionDataProcessor(chunk)
+            store, detected_columns, _ = processor.preprocess(detect_columns=True)
+            rejected += processor.rejections.get("total", 0)
+            if store.empty:
+                continue
+
+            self.persist(
+                writer,
+                "processed dataset",
+                self.serializer.save_processed_dataset,
+                store.to_dataframe(
+                    detected_columns, encoder=self.serializer.encode_vector
+                ),
+                run_id,
+            )
+            results = self.solver.bulk_data_fitting(
+                store,
+                model_configuration,
+                max_iterations,
+                progress_callback=self.offset_progress(
+                    progress_callback, completed, total
+                ),
+                cache=cache_session,
+                result_callback=result_callback,
+            )
+            if evaluation_report is None and report_sample > 0:
+                evaluation_report = self.solver.initial_guess_report(
+                    store.head(report_sample), model_configuration, max_iterations
+                )
+
+            self.persist(
+                writer,
+                "model fits",
+                self.serializer.save_model_fits,
+                self.adapter.build_model_fits(results, store.experiments),
+                run_id,
+            )
+            if save_best and len(preview) < preview_limit:
+                head = min(preview_limit - len(preview), store.experiment_count)
+                best_frame = self.preview_best_models(
+                    store.head(head),
+                    {model: entries[:head] for model, entries in results.items()},
+                    detected_columns,
+                )
+                preview.extend(self.build_preview(best_frame))
+            completed += store.experiment_count
+            logger.info(
+                "Chunk %s fitted: %s experiments, %s in total",
+                chunk_count,
+                store.experiment_count,
+                completed,
+            )
+
+        if completed == 0:
+            raise ValueError(
+                "No valid experiments found after preprocessing the dataset."
+            )
+        self.persist(writer, "run completion", self.serializer.finish_run, run_id)
+
+        response: dict[str, Any] = {
+            "status": "success",
+            "run_id": run_id,
+            "processed_rows": completed,
+            "models": sorted(model_configuration.keys()),
+            "best_model_saved": bool(save_best),
+        }
+        if save_best:
+            response["best_model_preview"] = preview[:preview_limit]
+        if evaluation_report is not None:
+            response["evaluation_report"] = evaluation_report
+        if cache_session is not None:
+            response["cache_statistics"] = cache_session.statistics()
+
+        summary_lines = [
+            "[INFO] ADSORFIT fitting completed.",
+            f"Experiments processed: {completed}",
+            f"Chunks processed: {chunk_count} of up to {chunk_rows} measurements",
+            f"Rows removed during validation: {rejected}",
+        ]
         if save_best:
             summary_lines.append("Best model selection stored in database.")
         response["summary"] = "\n".join(summary_lines)
 
         return response
 
+    # -------------------------------------------------------------------------
+    def purge_cache(self) -> None:
+        if self.cache is None:
+            raise ValueError("The fit cache is disabled in the server configuration.")
+        self.cache.purge()
+
     # -------------------------------------------------------------------------
     def build_dataframe(self, payload: dict[str, Any]) -> pd.DataFrame:
+        dataset_id = payload.get("dataset_id")
+        if dataset_id:
+            dataframe = self.registry.get(dataset_id)
+            if dataframe is None:
+                raise ValueError(
+                    f"Unknown dataset {dataset_id}, please upload it again."
+                )
+            return dataframe
         records = payload.get("records")
         columns = payload.get("columns")
         if isinstance(records, list):
@@ -268,22 +1104,6 @@ class FittingPipeline:
             normalized[model_name] = normalized_entry
         return normalized
 
-    # -------------------------------------------------------------------------
-    def stringify_sequences(self, dataset: pd.DataFrame) -> pd.DataFrame:
-        converted = dataset.copy()
-        for column in converted.columns:
-            if (
-                converted[column]
-                .apply(lambda value: isinstance(value, (list, tuple)))
-                .any()
-            ):
-                converted[column] = converted[column].apply(
-                    lambda value: json.dumps(value)
-                    if isinstance(value, (list, tuple))
-                    else value
-                )
-        return converted
-
     # -------------------------------------------------------------------------
     def build_preview(self, dataset: pd.DataFrame) -> list[dict[str, Any]]:
         preview_columns = [
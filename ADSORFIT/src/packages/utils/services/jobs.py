@@ -0,0 +1,420 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from ADSORFIT.src.packages.configurations import JobSettings, configurations
+from ADSORFIT.src.packages.logger import logger
+from ADSORFIT.src.packages.utils.repository.serializer import DataSerializer
+from ADSORFIT.src.packages.utils.services.fitting import FittingPipeline
+from ADSORFIT.src.packages.utils.services.persistence import (
+    PersistenceError,
+    WriteBehindWriter,
+)
+from ADSORFIT.src.packages.utils.services.processing import DatasetAdapter
+
+ACTIVE_JOB_STATES = ("queued", "running")
+TERMINAL_JOB_STATES = ("completed", "failed", "cancelled", "interrupted")
+
+
+###############################################################################
+class JobCancelledError(RuntimeError):
+    pass
+
+
+###############################################################################
+class JobQueueFullError(RuntimeError):
+    pass
+
+
+###############################################################################
+class JobEventStream:
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.status = "queued"
+        self.completed = 0
+        self.total = 0
+        self.started_at: float | None = None
+        self.rows: list[dict[str, Any]] = []
+
+    # -------------------------------------------------------------------------
+    def set_status(self, status: str) -> None:
+        with self.lock:
+            self.status = status
+            if status == "running":
+                self.started_at = time.time()
+
+    # -------------------------------------------------------------------------
+    def update_progress(self, completed: int, total: int) -> None:
+        with self.lock:
+            self.completed = completed
+            self.total = total
+
+    # -------------------------------------------------------------------------
+    def add_row(self, row: dict[str, Any]) -> None:
+        with self.lock:
+            self.rows.append(row)
+
+    # -------------------------------------------------------------------------
+    def snapshot(self, cursor: int) -> dict[str, Any]:
+        """Describe the job progress and the best-model rows added since ``cursor``.
+
+        Keyword arguments:
+        cursor -- Number of rows already delivered to the consumer.
+
+        Return value:
+        Dictionary with status, progress counters, throughput in experiments per
+        second, estimated seconds to completion and the new best-model rows.
+        """
+        with self.lock:
+            completed, total = self.completed, self.total
+            rows = self.rows[cursor:]
+            status, started_at = self.status, self.started_at
+        elapsed = time.time() - started_at if started_at is not None else 0.0
+        throughput = completed / elapsed if elapsed > 0 else 0.0
+        eta = (total - completed) / throughput if throughput > 0 else None
+        return {
+            "status": status,
+            "completed": completed,
+            "total": total,
+            "throughput": throughput,
+            "eta": eta,
+            "rows": rows,
+        }
+
+
+###############################################################################
+class JobProgressReporter:
+    def __init__(
+        self,
+        job_id: str,
+        cancel_event: threading.Event,
+        serializer: DataSerializer,
+        interval: float,
+        stream: JobEventStream | None = None,
+    ) -> None:
+        self.job_id = job_id
+        self.cancel_event = cancel_event
+        self.serializer = serializer
+        self.interval = interval
+        self.stream = stream
+        self.last_update = 0.0
+
+    # -------------------------------------------------------------------------
+    def record_result(self, experiment: str, entry: dict[str, dict[str, Any]]) -> None:
+        # Rows are only buffered here; streaming consumers drain them at their own
+        # pace so the solver loop never waits on a client.
+        if self.stream is not None:
+            self.stream.add_row(DatasetAdapter.build_best_row(experiment, entry))
+
+    # -------------------------------------------------------------------------
+    def cancellation_requested(self) -> bool:
+        if self.cancel_event.is_set():
+            return True
+        # Cancellation issued through another server process is only visible in
+        # the database, which is polled at the progress interval.
+        stored = self.serializer.load_job(self.job_id)
+        if stored is not None and stored.get("cancel_requested"):
+            self.cancel_event.set()
+            return True
+        return False
+
+    # -------------------------------------------------------------------------
+    def __call__(self, completed: int, total: int) -> None:
+        if self.cancel_event.is_set():
+            raise JobCancelledError(f"Job {self.job_id} was cancelled")
+        if self.stream is not None:
+            self.stream.update_progress(completed, total)
+        now = time.time()
+        if now - self.last_update < self.interval and completed < total:
+            return
+        self.last_update = now
+        if self.cancellation_requested():
+            raise JobCancelledError(f"Job {self.job_id} was cancelled")
+        self.serializer.save_job(
+            {
+                "job_id": self.job_id,
+                "completed": int(completed),
+                "total": int(total),
+                "updated_at": now,
+            }
+        )
+
+
+###############################################################################
+class FittingJobManager:
+    def __init__(
+        self,
+        pipeline: FittingPipeline,
+        settings: JobSettings,
+        serializer: DataSerializer | None = None,
+    ) -> None:
+        self.pipeline = pipeline
+        self.settings = settings
+        self.serializer = serializer or DataSerializer()
+        self.executor = ThreadPoolExecutor(
+            max_workers=settings.workers, thread_name_prefix="adsorfit-job"
+        )
+        self.lock = threading.Lock()
+        self.cancel_events: dict[str, threading.Event] = {}
+        self.futures: dict[str, Future] = {}
+        # Streams outlive their jobs for a while so late consumers still receive
+        # the final rows and status.
+        self.streams: OrderedDict[str, JobEventStream] = OrderedDict()
+        self.stream_history = 4 * (settings.workers + settings.queue_size)
+
+    # -------------------------------------------------------------------------
+    def submit(self, arguments: dict[str, Any]) -> tuple[str, Future]:
+        """Queue a fitting job on the bounded worker pool.
+
+        Keyword arguments:
+        arguments -- Keyword arguments forwarded to ``FittingPipeline.run``.
+
+        Return value:
+        Tuple with the job identifier and the future resolving to the job response.
+        Raises JobQueueFullError when the running and queued jobs exceed the
+        configured capacity.
+        """
+        capacity = self.settings.workers + self.settings.queue_size
+        job_id = uuid.uuid4().hex
+        cancel_event = threading.Event()
+        with self.lock:
+            if len(self.cancel_events) >= capacity:
+                raise JobQueueFullError(
+                    "The fitting queue is full, please retry later."
+                )
+            self.cancel_events[job_id] = cancel_event
+            self.streams[job_id] = JobEventStream()
+            while len(self.streams) > max(capacity, self.stream_history):
+                oldest = next(iter(self.streams))
+                if oldest in self.cancel_events:
+                    break
+                self.streams.pop(oldest)
+
+        now = time.time()
+        self.serializer.save_job(
+            {
+                "job_id": job_id,
+                "status": "queued",
+                "completed": 0,
+                "total": 0,
+                "cancel_requested": 0,
+                "persisted": 0,
+                "submitted_at": now,
+                "updated_at": now,
+            }
+        )
+        future = self.executor.submit(self.execute, job_id, arguments, cancel_event)
+        with self.lock:
+            if not future.done():
+                self.futures[job_id] = future
+        logger.info("Queued fitting job %s", job_id)
+        return job_id, future
+
+    # -------------------------------------------------------------------------
+    def execute(
+        self,
+        job_id: str,
+        arguments: dict[str, Any],
+        cancel_event: threading.Event,
+    ) -> dict[str, Any]:
+        stream = self.streams.get(job_id)
+        reporter = JobProgressReporter(
+            job_id,
+            cancel_event,
+            self.serializer,
+            self.settings.progress_interval,
+            stream,
+        )
+        fitting_settings = configurations.server.fitting
+        writer = (
+            WriteBehindWriter(fitting_settings.write_queue_size)
+            if fitting_settings.write_behind
+            else None
+        )
+        try:
+            if reporter.cancellation_requested():
+                raise JobCancelledError(f"Job {job_id} was cancelled")
+            now = time.time()
+            self.serializer.save_job(
+                {
+                    "job_id": job_id,
+                    "status": "running",
+                    "started_at": now,
+                    "updated_at": now,
+                }
+            )
+            if stream is not None:
+                stream.set_status("running")
+            response = self.pipeline.run(
+                **arguments,
+                progress_callback=reporter,
+                result_callback=reporter.record_result,
+                writer=writer,
+            )
+            # Queued writes are drained before the job is reported as completed,
+            # so a completed job always has its results in the database.
+            if writer is not None:
+                self.await_persistence(job_id, writer)
+            self.finish(
+                job_id, "completed", result=json.dumps(response), persisted=True
+            )
+            return response
+        except JobCancelledError:
+            logger.info("Fitting job %s cancelled", job_id)
+            self.finish(job_id, "cancelled")
+            raise
+        except PersistenceError as exc:
+            logger.error("Fitting job %s results were not persisted: %s", job_id, exc)
+            self.finish(
+                job_id,
+                "failed",
+                error="Failed to persist the fitting results.",
+                persist_error=str(exc),
+            )
+            raise
+        except ValueError as exc:
+            logger.warning("Invalid fitting job %s: %s", job_id, exc)
+            self.finish(job_id, "failed", error=str(exc))
+            raise
+        except Exception:
+            logger.exception("ADSORFIT fitting job %s failed", job_id)
+            self.finish(job_id, "failed", error="Failed to complete the fitting job.")
+            raise
+        finally:
+            if writer is not None:
+                writer.close()
+            with self.lock:
+                self.cancel_events.pop(job_id, None)
+                self.futures.pop(job_id, None)
+
+    # -------------------------------------------------------------------------
+    def await_persistence(self, job_id: str, writer: WriteBehindWriter) -> None:
+        errors = writer.close()
+        if errors:
+            raise PersistenceError("; ".join(errors))
+        logger.debug("Fitting job %s results were persisted", job_id)
+
+    # -------------------------------------------------------------------------
+    def finish(
+        self,
+        job_id: str,
+        status: str,
+        result: str | None = None,
+        error: str | None = None,
+        persisted: bool = False,
+        persist_error: str | None = None,
+    ) -> None:
+        stream = self.streams.get(job_id)
+        if stream is not None:
+            stream.set_status(status)
+        now = time.time()
+        self.serializer.save_job(
+            {
+                "job_id": job_id,
+                "status": status,
+                "finished_at": now,
+                "updated_at": now,
+                "result": result,
+                "error": error,
+                "persisted": int(persisted),
+                "persist_error": persist_error,
+            }
+        )
+
+    # -------------------------------------------------------------------------
+    def get_status(self, job_id: str) -> dict[str, Any] | None:
+        """Read the job state persisted in the database.
+
+        Keyword arguments:
+        job_id -- Identifier returned on submission.
+
+        Return value:
+        Dictionary describing the job, or None when the job is unknown. Active jobs
+        owned by no live worker that stopped reporting progress are reported as
+        interrupted, which happens after a server restart.
+        """
+        record = self.serializer.load_job(job_id)
+        if record is None:
+            return None
+        with self.lock:
+            owned = job_id in self.cancel_events
+        updated_at = record.get("updated_at") or 0.0
+        if (
+            record.get("status") in ACTIVE_JOB_STATES
+            and not owned
+            and time.time() - updated_at > self.settings.stale_after
+        ):
+            record["status"] = "interrupted"
+        record["cancel_requested"] = bool(record.get("cancel_requested"))
+        record["persisted"] = bool(record.get("persisted"))
+        return record
+
+    # -------------------------------------------------------------------------
+    def get_events(self, job_id: str, cursor: int) -> dict[str, Any] | None:
+        """Collect the streaming update of a job since the given row cursor.
+
+        Keyword arguments:
+        job_id -- Identifier returned on submission.
+        cursor -- Number of best-model rows already delivered.
+
+        Return value:
+        Snapshot from the in-process event stream, falling back to the persisted
+        progress without rows for jobs owned by another server process, or None
+        when the job is unknown.
+        """
+        stream = self.streams.get(job_id)
+        if stream is not None:
+            return stream.snapshot(cursor)
+        record = self.get_status(job_id)
+        if record is None:
+            return None
+        return {
+            "status": record.get("status"),
+            "completed": record.get("completed") or 0,
+            "total": record.get("total") or 0,
+            "throughput": None,
+            "eta": None,
+            "rows": [],
+        }
+
+    # -------------------------------------------------------------------------
+    def get_result(self, job_id: str) -> dict[str, Any] | None:
+        record = self.get_status(job_id)
+        if record is None or record.get("status") != "completed":
+            return None
+        result = record.get("result")
+        return json.loads(result) if result else None
+
+    # -------------------------------------------------------------------------
+    def cancel(self, job_id: str) -> dict[str, Any] | None:
+        """Request the cancellation of a queued or running job.
+
+        Keyword arguments:
+        job_id -- Identifier returned on submission.
+
+        Return value:
+        Updated job description, or None when the job is unknown. Running jobs stop
+        at the next experiment boundary.
+        """
+        record = self.get_status(job_id)
+        if record is None or record.get("status") not in ACTIVE_JOB_STATES:
+            return record
+        self.serializer.save_job({"job_id": job_id, "cancel_requested": 1})
+        with self.lock:
+            cancel_event = self.cancel_events.get(job_id)
+            future = self.futures.get(job_id)
+        if cancel_event is not None:
+            cancel_event.set()
+        # Jobs still waiting for a worker never start, so their state is final now
+        if future is not None and future.cancel():
+            with self.lock:
+                self.cancel_events.pop(job_id, None)
+                self.futures.pop(job_id, None)
+            self.finish(job_id, "cancelled")
+        return self.get_status(job_id)
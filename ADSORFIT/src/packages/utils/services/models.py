@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
 import numpy as np
@@ -7,6 +9,42 @@ import numpy as np
 from ADSORFIT.src.packages.constants import FITTING_MODEL_NAMES
 
 
+###############################################################################
+@dataclass(frozen=True)
+class ModelSpec:
+    name: str
+    parameters: tuple[str, ...]
+    initial: np.ndarray
+    lower: np.ndarray
+    upper: np.ndarray
+    function: Callable[..., np.ndarray]
+    jacobian: Callable[..., np.ndarray] | None = None
+    # Parameters whose initial value may be replaced by a data-driven estimate,
+    # every parameter when None
+    estimable: np.ndarray | None = None
+
+    # -------------------------------------------------------------------------
+    @property
+    def parameter_count(self) -> int:
+        return len(self.parameters)
+
+    # -------------------------------------------------------------------------
+    def evaluate(self, pressure: np.ndarray, parameters: np.ndarray) -> np.ndarray:
+        """Evaluate the model for one parameter vector or a batch of them.
+
+        Keyword arguments:
+        pressure -- Pressure values, either 1-D or a padded (experiments, points) matrix.
+        parameters -- Parameter vector, or matrix with one row per experiment.
+
+        Return value:
+        Predicted uptakes broadcast against ``pressure``.
+        """
+        if parameters.ndim == 1:
+            return self.function(pressure, *parameters)
+        columns = [parameters[:, index, None] for index in range(parameters.shape[1])]
+        return self.function(pressure, *columns)
+
+
 ###############################################################################
 class AdsorptionModels:
     def __init__(self) -> None:
@@ -36,6 +74,49 @@ class AdsorptionModels:
     def temkin(pressure: np.ndarray, k: float, beta: float) -> np.ndarray:
         return beta * np.log(k * pressure)
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def langmuir_jacobian(pressure: np.ndarray, k: float, qsat: float) -> np.ndarray:
+        k_p = pressure * k
+        denominator = 1 + k_p
+        d_k = qsat * pressure / denominator**2
+        d_qsat = k_p / denominator
+        return np.stack(np.broadcast_arrays(d_k, d_qsat), axis=-1)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def sips_jacobian(
+        pressure: np.ndarray, k: float, qsat: float, exponent: float
+    ) -> np.ndarray:
+        p_n = pressure**exponent
+        k_p = k * p_n
+        denominator = (1 + k_p) ** 2
+        # p^n * ln(p) vanishes at zero pressure, so the log is evaluated at 1 there
+        log_p = np.log(np.where(pressure > 0, pressure, 1.0))
+        d_k = qsat * p_n / denominator
+        d_qsat = k_p / (1 + k_p)
+        d_exponent = qsat * k_p * log_p / denominator
+        return np.stack(np.broadcast_arrays(d_k, d_qsat, d_exponent), axis=-1)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def freundlich_jacobian(
+        pressure: np.ndarray, k: float, exponent: float
+    ) -> np.ndarray:
+        k_p = pressure * k
+        uptake = k_p ** (1 / exponent)
+        log_k_p = np.log(np.where(k_p > 0, k_p, 1.0))
+        d_k = uptake / (exponent * k)
+        d_exponent = -uptake * log_k_p / exponent**2
+        return np.stack(np.broadcast_arrays(d_k, d_exponent), axis=-1)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def temkin_jacobian(pressure: np.ndarray, k: float, beta: float) -> np.ndarray:
+        d_k = beta / k
+        d_beta = np.log(k * pressure)
+        return np.stack(np.broadcast_arrays(d_k, d_beta), axis=-1)
+
     # -------------------------------------------------------------------------
     def get_model(self, model_name: str) -> Any:
         models = {
@@ -48,3 +129,16 @@ class AdsorptionModels:
             return models[model_name.upper()]
         except KeyError as exc:
             raise ValueError(f"Model {model_name} is not supported") from exc
+
+    # -------------------------------------------------------------------------
+    def get_jacobian(self, model_name: str) -> Any:
+        jacobians = {
+            "LANGMUIR": self.langmuir_jacobian,
+            "SIPS": self.sips_jacobian,
+            "FREUNDLICH": self.freundlich_jacobian,
+            "TEMKIN": self.temkin_jacobian,
+        }
+        try:
+            return jacobians[model_name.upper()]
+        except KeyError as exc:
+            raise ValueError(f"Model {model_name} has no analytic Jacobian") from exc
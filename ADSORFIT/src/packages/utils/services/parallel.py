@@ -0,0 +1,289 @@
+from __future__ import annotations
+
+import math
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from multiprocessing import shared_memory
+from typing import Any
+
+import numpy as np
+
+from ADSORFIT.src.packages.logger import logger
+from ADSORFIT.src.packages.utils.services.models import ModelSpec
+from ADSORFIT.src.packages.utils.services.processing import ExperimentStore
+
+# Per-process state populated by ``initialize_worker`` so that tasks only carry the
+# boundaries of the experiments they should fit.
+WORKER_STATE: dict[str, Any] = {}
+
+
+# -----------------------------------------------------------------------------
+def initialize_worker(
+    block_name: str,
+    total_points: int,
+    offsets: np.ndarray,
+    experiment_names: list[str],
+    specs: dict[str, ModelSpec],
+    max_iterations: int,
+) -> None:
+    # Imported lazily to avoid a circular import between the solver and the pool
+    from ADSORFIT.src.packages.utils.services.fitting import ModelSolver
+
+    WORKER_STATE["block_name"] = block_name
+    WORKER_STATE["total_points"] = total_points
+    WORKER_STATE["offsets"] = offsets
+    WORKER_STATE["names"] = experiment_names
+    WORKER_STATE["specs"] = specs
+    WORKER_STATE["max_iterations"] = max_iterations
+    WORKER_STATE["solver"] = ModelSolver()
+
+
+# -----------------------------------------------------------------------------
+def fit_experiment_range(start: int, stop: int) -> tuple[int, list[dict[str, Any]]]:
+    offsets = WORKER_STATE["offsets"]
+    names = WORKER_STATE["names"]
+    solver = WORKER_STATE["solver"]
+    results: list[dict[str, Any]] = []
+    # The block is attached for the duration of a chunk only, so workers never
+    # leave a mapping open when the pool shuts down or a task fails.
+    block = shared_memory.SharedMemory(name=WORKER_STATE["block_name"])
+    values: np.ndarray | None = None
+    try:
+        values = np.ndarray(
+            (2, WORKER_STATE["total_points"]), dtype=np.float64, buffer=block.buf
+        )
+        for index in range(start, stop):
+            lower, upper = int(offsets[index]), int(offsets[index + 1])
+            results.append(
+                solver.single_experiment_fit(
+                    values[0, lower:upper].copy(),
+                    values[1, lower:upper].copy(),
+                    names[index],
+                    WORKER_STATE["specs"],
+                    WORKER_STATE["max_iterations"],
+                )
+            )
+    finally:
+        # The NumPy view must be released before the segment can be closed
+        values = None
+        block.close()
+    return start, results
+
+
+###############################################################################
+class ParallelFittingExecutor:
+    def __init__(self, workers: int, chunk_size: int = 0) -> None:
+        self.workers = max(1, int(workers))
+        self.chunk_size = max(0, int(chunk_size))
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def resolve_worker_count(requested: int, total_experiments: int) -> int:
+        """Translate the configured worker count into an effective pool size.
+
+        Keyword arguments:
+        requested -- Configured number of workers, where 0 selects every available core.
+        total_experiments -- Number of experiments scheduled for fitting.
+
+        Return value:
+        Number of worker processes to spawn, never larger than the experiment count.
+        """
+        workers = requested if requested > 0 else (os.cpu_count() or 1)
+        return max(1, min(workers, total_experiments))
+
+    # -------------------------------------------------------------------------
+    def build_chunks(self, offsets: np.ndarray) -> list[tuple[int, int]]:
+        """Split the experiments into contiguous index ranges for the worker pool.
+
+        Keyword arguments:
+        offsets -- Cumulative measurement offsets delimiting every experiment.
+
+        Return value:
+        List of ``(start, stop)`` experiment ranges covering the whole dataset.
+        """
+        total_experiments = offsets.shape[0] - 1
+        if self.chunk_size > 0:
+            return [
+                (start, min(start + self.chunk_size, total_experiments))
+                for start in range(0, total_experiments, self.chunk_size)
+            ]
+
+        # Adaptive chunks hold a similar number of measurements rather than a fixed
+        # number of experiments, so long isotherms do not stall a single worker.
+        target_chunks = self.workers * 4
+        total_points = int(offsets[-1])
+        points_per_chunk = max(1, math.ceil(total_points / target_chunks))
+        boundaries = np.searchsorted(
+            offsets, np.arange(points_per_chunk, total_points, points_per_chunk)
+        )
+        edges = np.unique(
+            np.concatenate(([0], boundaries, [total_experiments])).astype(np.int64)
+        )
+        return [
+            (int(start), int(stop))
+            for start, stop in zip(edges[:-1], edges[1:], strict=False)
+            if stop > start
+        ]
+
+    # -------------------------------------------------------------------------
+    def run(
+        self,
+        store: ExperimentStore,
+        specs: dict[str, ModelSpec],
+        max_iterations: int,
+        progress_callback: Callable[[int, int], None] | None = None,
+        result_callback: Callable[[str, dict[str, Any]], None] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fit every experiment across a process pool fed through shared memory.
+
+        Keyword arguments:
+        store -- Experiment store whose contiguous arrays are copied once into the
+        shared memory block.
+        specs -- Precompiled model specifications shared by every worker.
+        max_iterations -- Maximum number of solver evaluations per model fit.
+        progress_callback -- Optional callable receiving the completed experiment
+        count and total experiments after each chunk.
+        result_callback -- Optional callable receiving the name and results of every
+        experiment of a completed chunk.
+
+        Return value:
+        List of per-experiment results ordered as the input experiments.
+        """
+        total_experiments = store.experiment_count
+        offsets = store.offsets
+        total_points = int(offsets[-1])
+
+        block = shared_memory.SharedMemory(
+            create=True, size=max(1, 2 * total_points * np.float64().itemsize)
+        )
+        values: np.ndarray | None = None
+        try:
+            values = np.ndarray((2, total_points), dtype=np.float64, buffer=block.buf)
+            if total_points:
+                values[0] = store.pressure
+                values[1] = store.uptake
+
+            chunks = self.build_chunks(offsets)
+            logger.info(
+                "Fitting %s experiments on %s workers (%s chunks)",
+                total_experiments,
+                self.workers,
+                len(chunks),
+            )
+            ordered: list[dict[str, Any] | None] = [None] * total_experiments
+            completed = 0
+            # Workers are spawned rather than forked: the server process runs job
+            # and writer threads whose locks must not be copied mid-operation.
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=initialize_worker,
+                initargs=(
+                    block.name,
+                    total_points,
+                    offsets,
+                    store.experiments.tolist(),
+                    specs,
+                    max_iterations,
+                ),
+            ) as executor:
+                ranges = {
+                    executor.submit(fit_experiment_range, start, stop): (start, stop)
+                    for start, stop in chunks
+                }
+                pending = set(ranges)
+                try:
+                    while pending:
+                        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            start, chunk_results = future.result()
+                            first, last = ranges[future]
+                            if start != first or start + len(chunk_results) > last:
+                                raise RuntimeError(
+                                    f"Worker results for experiments {first}-{last} "
+                                    "do not match the submitted range."
+                                )
+                            # Results are placed by index so a short chunk leaves
+                            # gaps instead of shifting the following experiments
+                            for offset, entry in enumerate(chunk_results):
+                                ordered[start + offset] = entry
+                            completed += len(chunk_results)
+                            if result_callback is not None:
+                                for offset, entry in enumerate(chunk_results):
+                                    result_callback(
+                                        str(store.experiments[start + offset]), entry
+                                    )
+                            if progress_callback is not None:
+                                progress_callback(completed, total_experiments)
+                except BaseException:
+                    # Chunks not yet picked up are dropped so that a cancelled or
+                    # failed job does not wait for the whole dataset.
+                    for future in pending:
+                        future.cancel()
+                    raise
+        finally:
+            # The NumPy view must be released before the segment can be closed
+            values = None
+            block.close()
+            block.unlink()
+
+        missing = [index for index, entry in enumerate(ordered) if entry is None]
+        if missing:
+            # Dropping experiments would silently shift the results against the
+            # input order, so any gap left by the pool is refitted in-process.
+            logger.warning(
+                "Refitting %s experiments missing from the worker results",
+                len(missing),
+            )
+            self.refit_missing(
+                store, specs, max_iterations, ordered, missing, result_callback
+            )
+
+        missing = [index for index, entry in enumerate(ordered) if entry is None]
+        if missing:
+            raise RuntimeError(f"{len(missing)} experiments have no fitting result.")
+        return ordered
+
+    # -------------------------------------------------------------------------
+    def refit_missing(
+        self,
+        store: ExperimentStore,
+        specs: dict[str, ModelSpec],
+        max_iterations: int,
+        ordered: list[dict[str, Any] | None],
+        missing: list[int],
+        result_callback: Callable[[str, dict[str, Any]], None] | None = None,
+    ) -> None:
+        """Fit in the calling process the experiments the pool did not return.
+
+        Keyword arguments:
+        store -- Experiment store holding the contiguous measurement arrays.
+        specs -- Precompiled model specifications.
+        max_iterations -- Maximum number of solver evaluations per model fit.
+        ordered -- Per-experiment results, filled in place at the missing indices.
+        missing -- Indices of the experiments without a result.
+        result_callback -- Optional callable receiving the name and results of every
+        refitted experiment.
+
+        Return value:
+        None
+        """
+        from ADSORFIT.src.packages.utils.services.fitting import ModelSolver
+
+        solver = ModelSolver()
+        offsets = store.offsets
+        for index in missing:
+            lower, upper = int(offsets[index]), int(offsets[index + 1])
+            name = str(store.experiments[index])
+            entry = solver.single_experiment_fit(
+                store.pressure[lower:upper],
+                store.uptake[lower:upper],
+                name,
+                specs,
+                max_iterations,
+            )
+            ordered[index] = entry
+            if result_callback is not None:
+                result_callback(name, entry)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import queue
+import threading
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from ADSORFIT.src.packages.logger import logger
+from ADSORFIT.src.packages.utils.repository.serializer import DataSerializer
+from ADSORFIT.src.packages.utils.services.processing import (
+    DatasetAdapter,
+    ExperimentStore,
+)
+
+
+###############################################################################
+class PersistenceError(RuntimeError):
+    pass
+
+
+###############################################################################
+class WriteBehindWriter:
+    def __init__(self, queue_size: int) -> None:
+        self.tasks: queue.Queue[tuple[str, Callable[..., Any], tuple] | None] = (
+            queue.Queue(maxsize=max(1, queue_size))
+        )
+        self.errors: list[str] = []
+        self.closed = False
+        self.thread = threading.Thread(
+            target=self.work, name="adsorfit-writer", daemon=True
+        )
+        self.thread.start()
+
+    # -------------------------------------------------------------------------
+    def submit(self, label: str, function: Callable[..., Any], *args: Any) -> None:
+        # The bounded queue applies backpressure: producers wait when the
+        # database falls behind instead of piling up frames in memory.
+        if self.closed:
+            raise PersistenceError("The persistence writer is already closed.")
+        self.tasks.put((label, function, args))
+
+    # -------------------------------------------------------------------------
+    def work(self) -> None:
+        while True:
+            task = self.tasks.get()
+            try:
+                if task is None:
+                    return
+                label, function, args = task
+                # Writes after a failure are skipped so the tables are not left
+                # with rows that depend on a missing earlier write.
+                if self.errors:
+                    continue
+                try:
+                    function(*args)
+                except Exception as exc:  # noqa: BLE001
+                    logger.exception("Background write of %s failed", label)
+                    self.errors.append(f"Failed to persist {label}: {exc}")
+            finally:
+                self.tasks.task_done()
+
+    # -------------------------------------------------------------------------
+    def close(self) -> list[str]:
+        """Wait for every queued write and stop the writer thread.
+
+        Keyword arguments:
+        None.
+
+        Return value:
+        Messages describing the failed writes, empty when everything was persisted.
+        """
+        if not self.closed:
+            self.closed = True
+            self.tasks.put(None)
+            self.thread.join()
+        return list(self.errors)
+
+
+###############################################################################
+class ResultBatchPersistence:
+    def __init__(
+        self,
+        writer: WriteBehindWriter,
+        serializer: DataSerializer,
+        adapter: DatasetAdapter,
+        store: ExperimentStore,
+        run_id: str,
+        batch_size: int,
+        save_best: bool,
+        preview_limit: int,
+        downstream: Callable[[str, dict[str, dict[str, Any]]], None] | None = None,
+    ) -> None:
+        self.writer = writer
+        self.serializer = serializer
+        self.adapter = adapter
+        self.store = store
+        self.run_id = run_id
+        self.batch_size = max(1, batch_size)
+        self.save_best = save_best
+        self.preview_limit = preview_limit
+        self.downstream = downstream
+        self.positions = {
+            str(name): index for index, name in enumerate(store.experiments)
+        }
+        self.pending: list[tuple[str, dict[str, dict[str, Any]]]] = []
+        self.preview: list[tuple[str, dict[str, dict[str, Any]]]] = []
+
+    # -------------------------------------------------------------------------
+    def __call__(self, experiment: str, entry: dict[str, dict[str, Any]]) -> None:
+        if self.downstream is not None:
+            self.downstream(experiment, entry)
+        self.pending.append((experiment, entry))
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+    # -------------------------------------------------------------------------
+    def flush(self) -> None:
+        """Queue the model fits of the experiments completed since the last flush.
+
+        Keyword arguments:
+        None.
+
+        Return value:
+        None. Rows are built on the calling thread and written by the background
+        writer in completion order.
+        """
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        results = {
+            model: [entry[model] for _, entry in batch] for model in batch[0][1]
+        }
+        fits = self.adapter.build_model_fits(results, [name for name, _ in batch])
+        self.writer.submit(
+            "model fits",
+            self.serializer.save_model_fits,
+            fits,
+            self.run_id,
+        )
+        if self.save_best and len(self.preview) < self.preview_limit:
+            self.preview.extend(batch[: self.preview_limit - len(self.preview)])
+
+    # -------------------------------------------------------------------------
+    def preview_results(
+        self,
+    ) -> tuple[np.ndarray, dict[str, list[dict[str, Any]]]]:
+        """Return the first completed experiments kept for the response preview.
+
+        Keyword arguments:
+        None.
+
+        Return value:
+        Store positions of the kept experiments and their fitting diagnostics
+        grouped by model, in the same order.
+        """
+        indices = np.asarray(
+            [self.positions[str(name)] for name, _ in self.preview], dtype=np.int64
+        )
+        if not self.preview:
+            return indices, {}
+        results = {
+            model: [entry[model] for _, entry in self.preview]
+            for model in self.preview[0][1]
+        }
+        return indices, results
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Callable, Iterable, Iterator
 from dataclasses import dataclass
 from difflib import get_close_matches
 from typing import Any
@@ -31,23 +32,273 @@ class DatasetColumns:
         }
 
 
+###############################################################################
+@dataclass
+class ExperimentStore:
+    experiments: np.ndarray
+    temperatures: np.ndarray
+    pressure: np.ndarray
+    uptake: np.ndarray
+    offsets: np.ndarray
+
+    # -------------------------------------------------------------------------
+    @classmethod
+    def from_measurements(
+        cls,
+        experiments: np.ndarray,
+        temperatures: np.ndarray,
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+    ) -> ExperimentStore:
+        """Pack flat measurements into contiguous per-experiment segments.
+
+        Keyword arguments:
+        experiments -- Experiment name of every measurement.
+        temperatures -- Temperature of every measurement.
+        pressure -- Pressure of every measurement.
+        uptake -- Uptake of every measurement.
+
+        Return value:
+        Store with experiments sorted by name, as ``groupby`` would order them, and
+        measurements kept in their original order within each experiment.
+        """
+        # Only the distinct names are sorted, measurements are mapped through the
+        # integer codes of the categorical experiment column.
+        categorical = pd.Categorical(experiments).remove_unused_categories()
+        category_codes, names = pd.factorize(categorical.categories, sort=True)
+        codes = category_codes[categorical.codes]
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes, minlength=len(names))
+        offsets = np.zeros(len(names) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(
+            experiments=np.asarray(names, dtype=object),
+            temperatures=np.asarray(temperatures)[order][offsets[:-1]],
+            pressure=np.ascontiguousarray(pressure[order], dtype=np.float64),
+            uptake=np.ascontiguousarray(uptake[order], dtype=np.float64),
+            offsets=offsets,
+        )
+
+    # -------------------------------------------------------------------------
+    @property
+    def experiment_count(self) -> int:
+        return int(self.experiments.shape[0])
+
+    # -------------------------------------------------------------------------
+    @property
+    def empty(self) -> bool:
+        return self.experiment_count == 0
+
+    # -------------------------------------------------------------------------
+    @property
+    def measurement_counts(self) -> np.ndarray:
+        return np.diff(self.offsets)
+
+    # -------------------------------------------------------------------------
+    def experiment(self, index: int) -> tuple[np.ndarray, np.ndarray]:
+        # Slices are views on the contiguous arrays, so no measurement is copied
+        start, stop = int(self.offsets[index]), int(self.offsets[index + 1])
+        return self.pressure[start:stop], self.uptake[start:stop]
+
+    # -------------------------------------------------------------------------
+    def pressures(self) -> list[np.ndarray]:
+        return [self.experiment(index)[0] for index in range(self.experiment_count)]
+
+    # -------------------------------------------------------------------------
+    def uptakes(self) -> list[np.ndarray]:
+        return [self.experiment(index)[1] for index in range(self.experiment_count)]
+
+    # -------------------------------------------------------------------------
+    def summary(self) -> dict[str, np.ndarray]:
+        if self.empty:
+            empty = np.empty(0, dtype=np.float64)
+            return {
+                "min_pressure": empty,
+                "max_pressure": empty,
+                "min_uptake": empty,
+                "max_uptake": empty,
+            }
+        starts = self.offsets[:-1]
+        return {
+            "min_pressure": np.minimum.reduceat(self.pressure, starts),
+            "max_pressure": np.maximum.reduceat(self.pressure, starts),
+            "min_uptake": np.minimum.reduceat(self.uptake, starts),
+            "max_uptake": np.maximum.reduceat(self.uptake, starts),
+        }
+
+    # -------------------------------------------------------------------------
+    def take(self, indices: np.ndarray) -> ExperimentStore:
+        """Gather a subset of experiments into a new contiguous store.
+
+        Keyword arguments:
+        indices -- Positions of the experiments to keep, in the desired order.
+
+        Return value:
+        Store holding copies of the selected experiments.
+        """
+        indices = np.asarray(indices, dtype=np.int64)
+        lengths = self.measurement_counts[indices]
+        offsets = np.zeros(indices.shape[0] + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        positions = np.repeat(self.offsets[indices] - offsets[:-1], lengths)
+        positions += np.arange(int(offsets[-1]), dtype=np.int64)
+        return ExperimentStore(
+            experiments=self.experiments[indices],
+            temperatures=self.temperatures[indices],
+            pressure=self.pressure[positions],
+            uptake=self.uptake[positions],
+            offsets=offsets,
+        )
+
+    # -------------------------------------------------------------------------
+    def select(self, names: list[str] | set[str]) -> ExperimentStore:
+        return self.take(np.flatnonzero(np.isin(self.experiments, list(names))))
+
+    # -------------------------------------------------------------------------
+    def head(self, count: int) -> ExperimentStore:
+        return self.take(np.arange(min(max(0, count), self.experiment_count)))
+
+    # -------------------------------------------------------------------------
+    def to_dataframe(
+        self,
+        columns: DatasetColumns,
+        encoder: Callable[[np.ndarray], Any] | None = None,
+    ) -> pd.DataFrame:
+        """Expand the store into the one-row-per-experiment persistence layout.
+
+        Keyword arguments:
+        columns -- Resolved column mapping used to name the measurement columns.
+        encoder -- Optional callable turning each measurement vector into its stored
+        representation; vectors become Python lists when omitted.
+
+        Return value:
+        DataFrame with pressure and uptake vectors per experiment and summary stats.
+        """
+        encode = encoder or np.ndarray.tolist
+        pressures: list[Any] = []
+        uptakes: list[Any] = []
+        if not self.empty:
+            # Vectors are encoded straight from the contiguous arrays, so no
+            # intermediate list columns are built before serialization.
+            boundaries = self.offsets[1:-1]
+            pressures = [encode(item) for item in np.split(self.pressure, boundaries)]
+            uptakes = [encode(item) for item in np.split(self.uptake, boundaries)]
+        dataset = pd.DataFrame(
+            {
+                "experiment": self.experiments,
+                columns.temperature: self.temperatures,
+                columns.pressure: pressures,
+                columns.uptake: uptakes,
+                "measurement_count": self.measurement_counts,
+            }
+        )
+        for name, values in self.summary().items():
+            dataset[name] = values
+        return dataset
+
+
+###############################################################################
+@dataclass
+class ExperimentDiff:
+    added: list[str]
+    modified: list[str]
+    unchanged: list[str]
+    deleted: list[str]
+
+    # -------------------------------------------------------------------------
+    @property
+    def refit(self) -> list[str]:
+        return self.added + self.modified
+
+    # -------------------------------------------------------------------------
+    def as_summary(self) -> dict[str, int]:
+        return {
+            "reused": len(self.unchanged),
+            "refit": len(self.refit),
+            "deleted": len(self.deleted),
+        }
+
+
+###############################################################################
+class ExperimentChunker:
+    def __init__(self, experiment_column: str, chunk_rows: int) -> None:
+        self.experiment_column = experiment_column
+        self.chunk_rows = max(1, chunk_rows)
+
+    # -------------------------------------------------------------------------
+    def split_dataframe(self, dataset: pd.DataFrame) -> Iterator[pd.DataFrame]:
+        """Split an in-memory dataset into chunks made of whole experiments.
+
+        Keyword arguments:
+        dataset -- Raw measurements, in any row order.
+
+        Return value:
+        Iterator over chunks of about ``chunk_rows`` measurements, sorted by
+        experiment name and keeping the original order within each experiment.
+        Experiments larger than the chunk size form a chunk of their own.
+        """
+        codes, _ = pd.factorize(dataset[self.experiment_column], sort=True)
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        total = sorted_codes.shape[0]
+        boundaries = np.concatenate(
+            ([0], np.flatnonzero(np.diff(sorted_codes)) + 1, [total])
+        )
+        start = 0
+        while start < total:
+            index = np.searchsorted(boundaries, start + self.chunk_rows, side="right")
+            end = int(boundaries[index - 1])
+            if end <= start:
+                end = int(boundaries[np.searchsorted(boundaries, start, side="right")])
+            yield dataset.take(order[start:end])
+            start = end
+
+    # -------------------------------------------------------------------------
+    def align(self, chunks: Iterable[pd.DataFrame]) -> Iterator[pd.DataFrame]:
+        """Regroup chunks of experiment-sorted measurements along experiment edges.
+
+        Keyword arguments:
+        chunks -- Consecutive chunks of measurements sorted by experiment name.
+
+        Return value:
+        Iterator over chunks where no experiment is split across two chunks; the
+        trailing experiment of each chunk is carried over to the next one.
+        """
+        carry: pd.DataFrame | None = None
+        for chunk in chunks:
+            if carry is not None and not carry.empty:
+                chunk = pd.concat([carry, chunk], ignore_index=True)
+            names = chunk[self.experiment_column]
+            last = names.iloc[-1]
+            tail = names.isna() if pd.isna(last) else names == last
+            cut = int(np.argmax(tail.to_numpy()))
+            carry = chunk.iloc[cut:]
+            if cut > 0:
+                yield chunk.iloc[:cut]
+        if carry is not None and not carry.empty:
+            yield carry
+
+
 ###############################################################################
 class AdsorptionDataProcessor:
     def __init__(self, dataset: pd.DataFrame) -> None:
-        self.dataset = dataset.copy()
+        # The dataset is only read, cleaning builds new typed columns instead of
+        # copying the whole upload up front.
+        self.dataset = dataset
         self.columns = DatasetColumns()
+        self.rejections: dict[str, int] = {}
 
     # -------------------------------------------------------------------------
     def preprocess(
         self, detect_columns: bool = True
-    ) -> tuple[pd.DataFrame, DatasetColumns, str]:
+    ) -> tuple[ExperimentStore, DatasetColumns, str]:
         """Clean the dataset, infer column mapping, and compute statistics.
 
         Keyword arguments:
         detect_columns -- Toggle automatic column detection based on heuristics.
 
         Return value:
-        Tuple containing the aggregated dataset, resolved column names, and a
+        Tuple containing the experiment store, resolved column names, and a
         statistics report.
         """
         if self.dataset.empty:
@@ -59,10 +310,10 @@ class AdsorptionDataProcessor:
             self.identify_columns()
 
         cleaned = self.drop_invalid_values(self.dataset)
-        grouped = self.aggregate_by_experiment(cleaned)
-        stats = self.build_statistics(cleaned, grouped)
+        store = self.build_experiment_store(cleaned)
+        stats = self.build_statistics(cleaned, store)
 
-        return grouped, self.columns, stats
+        return store, self.columns, stats
 
     # -------------------------------------------------------------------------
     def identify_columns(self) -> None:
@@ -102,15 +353,68 @@ class AdsorptionDataProcessor:
         dataset -- Dataset that should be filtered using the resolved column mapping.
 
         Return value:
-        DataFrame limited to valid rows with non-negative measurements and
-        temperatures above zero.
+        DataFrame limited to the detected columns and to valid rows with
+        non-negative measurements and temperatures above zero. Measurements are
+        coerced to float64 and experiments to a categorical column in a single
+        pass, and the number of rows failing each rule is kept in ``rejections``.
+        """
+        cols = self.columns.as_dict()
+        missing_columns = [name for name in cols.values() if name not in dataset]
+        if missing_columns:
+            raise ValueError(f"Missing dataset columns: {', '.join(missing_columns)}")
+
+        experiments = dataset[cols["experiment"]]
+        missing = experiments.isna().to_numpy()
+        non_numeric = np.zeros(dataset.shape[0], dtype=bool)
+        values: dict[str, np.ndarray] = {}
+        for name in ("temperature", "pressure", "uptake"):
+            series = dataset[cols[name]]
+            # Float columns pass through without copies, other cells that cannot
+            # be read as numbers become NaN and are counted separately.
+            coerced = pd.to_numeric(series, errors="coerce").to_numpy(
+                dtype=np.float64, na_value=np.nan
+            )
+            absent = series.isna().to_numpy()
+            missing |= absent
+            non_numeric |= np.isnan(coerced) & ~absent
+            values[name] = coerced
+
+        rules = {
+            "missing": missing,
+            "non_numeric": non_numeric,
+            "temperature": values["temperature"] <= 0,
+            "pressure": values["pressure"] < 0,
+            "uptake": values["uptake"] < 0,
+        }
+        invalid = np.logical_or.reduce(list(rules.values()))
+        self.rejections = {rule: int(mask.sum()) for rule, mask in rules.items()}
+        self.rejections["total"] = int(invalid.sum())
+
+        valid = ~invalid
+        cleaned = {
+            cols["experiment"]: pd.Categorical(experiments.array)[valid],
+            **{cols[name]: array[valid] for name, array in values.items()},
+        }
+        return pd.DataFrame(cleaned, copy=False)
+
+    # -------------------------------------------------------------------------
+    def build_experiment_store(self, dataset: pd.DataFrame) -> ExperimentStore:
+        """Group cleaned measurements by experiment into a contiguous store.
+
+        Keyword arguments:
+        dataset -- Filtered dataset containing valid measurements.
+
+        Return value:
+        Experiment store holding flat pressure and uptake arrays delimited by
+        per-experiment offsets.
         """
         cols = self.columns.as_dict()
-        valid = dataset.dropna(subset=list(cols.values()))
-        valid = valid[valid[cols["temperature"]].astype(float) > 0]
-        valid = valid[valid[cols["pressure"]].astype(float) >= 0]
-        valid = valid[valid[cols["uptake"]].astype(float) >= 0]
-        return valid.reset_index(drop=True)
+        return ExperimentStore.from_measurements(
+            dataset[cols["experiment"]].array,
+            dataset[cols["temperature"]].to_numpy(),
+            dataset[cols["pressure"]].to_numpy(dtype=np.float64),
+            dataset[cols["uptake"]].to_numpy(dtype=np.float64),
+        )
 
     # -------------------------------------------------------------------------
     def aggregate_by_experiment(self, dataset: pd.DataFrame) -> pd.DataFrame:
@@ -123,41 +427,24 @@ class AdsorptionDataProcessor:
         DataFrame with one row per experiment including pressure and uptake vectors and
         summary stats.
         """
-        cols = self.columns.as_dict()
-        aggregate = {
-            cols["temperature"]: "first",
-            cols["pressure"]: list,
-            cols["uptake"]: list,
-        }
-        # ``groupby`` collects all measurements for each experiment so downstream
-        # fitting can consume full pressure/uptake vectors.
-        grouped = (
-            dataset.groupby(cols["experiment"], as_index=False)
-            .agg(aggregate)
-            .rename(columns={cols["experiment"]: "experiment"})
-        )
-        grouped["measurement_count"] = grouped[cols["pressure"]].apply(len)
-        grouped["min_pressure"] = grouped[cols["pressure"]].apply(min)
-        grouped["max_pressure"] = grouped[cols["pressure"]].apply(max)
-        grouped["min_uptake"] = grouped[cols["uptake"]].apply(min)
-        grouped["max_uptake"] = grouped[cols["uptake"]].apply(max)
-        return grouped
+        return self.build_experiment_store(dataset).to_dataframe(self.columns)
 
     # -------------------------------------------------------------------------
-    def build_statistics(self, cleaned: pd.DataFrame, grouped: pd.DataFrame) -> str:
+    def build_statistics(self, cleaned: pd.DataFrame, store: ExperimentStore) -> str:
         """Produce a Markdown report describing dataset sizes and cleansing outcomes.
 
         Keyword arguments:
         cleaned -- Dataset after removing invalid rows.
-        grouped -- Aggregated dataset produced by :meth:`aggregate_by_experiment`.
+        store -- Experiment store produced by :meth:`build_experiment_store`.
 
         Return value:
         Markdown-formatted string summarizing per-column usage and high-level
         metrics.
         """
         total_measurements = cleaned.shape[0]
-        total_experiments = grouped.shape[0]
-        removed_nan = self.dataset.shape[0] - total_measurements
+        total_experiments = store.experiment_count
+        rejections = self.rejections
+        removed = rejections.get("total", self.dataset.shape[0] - total_measurements)
         avg_measurements = (
             total_measurements / total_experiments if total_experiments else 0
         )
@@ -168,7 +455,12 @@ class AdsorptionDataProcessor:
             f"**Temperature column:** {self.columns.temperature}\n"
             f"**Pressure column:** {self.columns.pressure}\n"
             f"**Uptake column:** {self.columns.uptake}\n\n"
-            f"**Number of NaN values removed:** {removed_nan}\n"
+            f"**Number of rows removed:** {removed}\n"
+            f"- Missing values: {rejections.get('missing', 0)}\n"
+            f"- Non-numeric values: {rejections.get('non_numeric', 0)}\n"
+            f"- Temperature not above zero: {rejections.get('temperature', 0)}\n"
+            f"- Negative pressure: {rejections.get('pressure', 0)}\n"
+            f"- Negative uptake: {rejections.get('uptake', 0)}\n\n"
             f"**Number of experiments:** {total_experiments}\n"
             f"**Number of measurements:** {total_measurements}\n"
             f"**Average measurements per experiment:** {avg_measurements:.1f}"
@@ -188,17 +480,18 @@ class DatasetAdapter:
         Keyword arguments:
         fitting_results -- Mapping of model names to experiment-level fitting
         diagnostics.
-        dataset -- Aggregated dataset to be enriched with fitting outputs.
+        dataset -- Aggregated dataset to be enriched with fitting outputs; columns
+        are appended in place.
 
         Return value:
-        DataFrame with additional columns per model containing LSS and parameter
-        estimates.
+        The same DataFrame with additional columns per model containing LSS and
+        parameter estimates.
         """
         if not fitting_results:
             logger.warning("No fitting results were provided")
             return dataset
 
-        result_df = dataset.copy()
+        result_df = dataset
         for model_name, entries in fitting_results.items():
             if not entries:
                 logger.info("Model %s produced no entries", model_name)
@@ -219,6 +512,156 @@ class DatasetAdapter:
                 ]
         return result_df
 
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def build_model_fits(
+        fitting_results: dict[str, list[dict[str, Any]]],
+        experiments: np.ndarray | list[str],
+    ) -> pd.DataFrame:
+        """Flatten model fitting diagnostics into one row per experiment and model.
+
+        Keyword arguments:
+        fitting_results -- Mapping of model names to experiment-level fitting
+        diagnostics, aligned with ``experiments``.
+        experiments -- Experiment names in the order of the diagnostics.
+
+        Return value:
+        Long-format DataFrame with the model name, least squares score, the
+        comma-separated parameter names and float64 arrays of the optimal
+        parameters and their errors.
+        """
+        names: list[str] = []
+        models: list[str] = []
+        scores: list[float] = []
+        parameter_names: list[str] = []
+        parameters: list[np.ndarray] = []
+        errors: list[np.ndarray] = []
+        for model_name, entries in fitting_results.items():
+            if not entries:
+                continue
+            arguments = list(entries[0].get("arguments", []))
+            missing = [np.nan] * len(arguments)
+            joined = ",".join(arguments)
+            for experiment, entry in zip(experiments, entries, strict=True):
+                names.append(experiment)
+                models.append(model_name)
+                scores.append(entry.get("LSS", np.nan))
+                parameter_names.append(joined)
+                parameters.append(
+                    np.asarray(entry.get("optimal_params", missing), dtype=np.float64)
+                )
+                errors.append(
+                    np.asarray(entry.get("errors", missing), dtype=np.float64)
+                )
+        return pd.DataFrame(
+            {
+                "experiment": names,
+                "model": models,
+                "lss": np.asarray(scores, dtype=np.float64),
+                "parameter_names": parameter_names,
+                "parameters": parameters,
+                "errors": errors,
+            }
+        )
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def hash_experiments(dataset: pd.DataFrame, columns: DatasetColumns) -> pd.Series:
+        """Compute a content hash for every serialized experiment row.
+
+        Keyword arguments:
+        dataset -- Processed dataset whose pressure and uptake vectors are stored as
+        float64 BLOBs, as persisted in ``ADSORPTION_PROCESSED_DATA``.
+        columns -- Resolved column mapping of the dataset.
+
+        Return value:
+        Series of unsigned 64-bit hashes indexed by experiment name. Experiments
+        with identical temperature and measurements share the same hash.
+        """
+        content_columns = [columns.temperature, columns.pressure, columns.uptake]
+        if dataset.empty or any(col not in dataset.columns for col in content_columns):
+            return pd.Series(dtype=np.uint64)
+        # Encoded vectors are hashed as raw bytes
+        content = dataset[content_columns].astype({columns.temperature: np.float64})
+        hashes = pd.util.hash_pandas_object(content, index=False)
+        hashes.index = dataset["experiment"].to_numpy()
+        return hashes
+
+    # -------------------------------------------------------------------------
+    def diff_experiments(
+        self,
+        current: pd.DataFrame,
+        stored: pd.DataFrame,
+        fitted_experiments: set[str],
+        columns: DatasetColumns,
+    ) -> ExperimentDiff:
+        """Compare processed experiments with the stored ones by name and content.
+
+        Keyword arguments:
+        current -- Serialized processed dataset of the current request.
+        stored -- Content of ``ADSORPTION_PROCESSED_DATA``.
+        fitted_experiments -- Experiment names with stored fitting results.
+        columns -- Resolved column mapping of the dataset.
+
+        Return value:
+        Experiment names split into added, modified, unchanged and deleted groups.
+        Stored experiments without fitting results are reported as modified.
+        """
+        current_hashes = self.hash_experiments(current, columns)
+        stored_hashes = self.hash_experiments(stored, columns)
+        stored_lookup = stored_hashes.to_dict()
+        added: list[str] = []
+        modified: list[str] = []
+        unchanged: list[str] = []
+        for name, content_hash in current_hashes.items():
+            if name not in stored_lookup:
+                added.append(name)
+            elif stored_lookup[name] != content_hash or name not in fitted_experiments:
+                modified.append(name)
+            else:
+                unchanged.append(name)
+        deleted = [name for name in stored_lookup if name not in current_hashes.index]
+        return ExperimentDiff(
+            added=added, modified=modified, unchanged=unchanged, deleted=deleted
+        )
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def build_best_row(
+        experiment: str, entry: dict[str, dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Summarize the best and worst model of a single fitted experiment.
+
+        Keyword arguments:
+        experiment -- Experiment name.
+        entry -- Per-model fitting results of the experiment.
+
+        Return value:
+        Row with the experiment name, best and worst models and their least squares
+        scores, following the ``compute_best_models`` selection rules.
+        """
+        scores = {
+            model: float(result.get("LSS", np.nan)) for model, result in entry.items()
+        }
+        finite = {model: lss for model, lss in scores.items() if np.isfinite(lss)}
+        if not finite:
+            return {
+                "experiment": experiment,
+                "best model": None,
+                "worst model": None,
+                "best LSS": None,
+                "worst LSS": None,
+            }
+        best = min(finite, key=finite.__getitem__)
+        worst = max(finite, key=finite.__getitem__)
+        return {
+            "experiment": experiment,
+            "best model": best,
+            "worst model": worst,
+            "best LSS": finite[best],
+            "worst LSS": finite[worst],
+        }
+
     # -------------------------------------------------------------------------
     @staticmethod
     def compute_best_models(dataset: pd.DataFrame) -> pd.DataFrame:
@@ -228,18 +671,17 @@ class DatasetAdapter:
         dataset -- Dataset containing least squares score columns for each model.
 
         Return value:
-        DataFrame extended with ``best model`` and ``worst model`` columns.
+        The same DataFrame extended in place with ``best model`` and ``worst model``
+        columns.
         """
         lss_columns = [column for column in dataset.columns if column.endswith("LSS")]
         if not lss_columns:
             logger.info("No LSS columns found; best model computation skipped")
             return dataset
 
-        best = dataset.copy()
+        scores = dataset[lss_columns]
         # Minimum LSS identifies the best fitting model per experiment while the
         # maximum highlights underperforming fits for diagnostics.
-        best["best model"] = dataset[lss_columns].idxmin(axis=1).str.replace(" LSS", "")
-        best["worst model"] = (
-            dataset[lss_columns].idxmax(axis=1).str.replace(" LSS", "")
-        )
-        return best
+        dataset["best model"] = scores.idxmin(axis=1).str.replace(" LSS", "")
+        dataset["worst model"] = scores.idxmax(axis=1).str.replace(" LSS", "")
+        return dataset
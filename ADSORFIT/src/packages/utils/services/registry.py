@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from collections import OrderedDict
+from collections.abc import Sequence
+
+import pandas as pd
+
+from ADSORFIT.src.packages.configurations import configurations
+from ADSORFIT.src.packages.constants import DATASETS_PATH
+from ADSORFIT.src.packages.logger import logger
+from ADSORFIT.src.packages.singleton import singleton
+from ADSORFIT.src.packages.utils.services.wire import ColumnarCodec
+
+# Identifiers are SHA-256 digests, anything else never reaches the spill path
+DATASET_ID_PATTERN = r"^[0-9a-f]{64}$"
+SPILL_EXTENSION = ".npz"
+
+
+###############################################################################
+@singleton
+class DatasetRegistry:
+    def __init__(self) -> None:
+        settings = configurations.server.datasets
+        self.memory_budget = settings.registry_memory_mb * 1024 * 1024
+        self.disk_budget = settings.registry_disk_mb * 1024 * 1024
+        self.spill_path = DATASETS_PATH
+        self.datasets: OrderedDict[str, pd.DataFrame] = OrderedDict()
+        self.sizes: dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.codec = ColumnarCodec()
+        os.makedirs(self.spill_path, exist_ok=True)
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def compute_dataset_id(
+        payload: bytes, filename: str | None, options: Sequence[str] = ()
+    ) -> str:
+        # The extension and the parsing options are part of the key because the
+        # same bytes are parsed differently as CSV or Excel, or with other sheets.
+        extension = ""
+        if isinstance(filename, str):
+            extension = os.path.splitext(filename)[1].lower()
+        digest = hashlib.sha256()
+        digest.update(extension.encode("utf-8"))
+        for option in options:
+            digest.update(b"\0" + option.encode("utf-8"))
+        digest.update(payload)
+        return digest.hexdigest()
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def is_valid_id(dataset_id: str) -> bool:
+        return isinstance(dataset_id, str) and (
+            re.fullmatch(DATASET_ID_PATTERN, dataset_id) is not None
+        )
+
+    # -------------------------------------------------------------------------
+    def spill_file(self, dataset_id: str) -> str:
+        if not self.is_valid_id(dataset_id):
+            raise ValueError(f"Invalid dataset identifier {dataset_id!r}.")
+        return os.path.join(self.spill_path, f"{dataset_id}{SPILL_EXTENSION}")
+
+    # -------------------------------------------------------------------------
+    def contains(self, dataset_id: str) -> bool:
+        if not self.is_valid_id(dataset_id):
+            return False
+        with self.lock:
+            if dataset_id in self.datasets:
+                return True
+        return os.path.exists(self.spill_file(dataset_id))
+
+    # -------------------------------------------------------------------------
+    def register(self, dataset_id: str, dataframe: pd.DataFrame) -> None:
+        """Persist a parsed dataset and keep it in memory while within budget.
+
+        Keyword arguments:
+        dataset_id -- Content hash computed by :meth:`compute_dataset_id`.
+        dataframe -- Parsed dataset to register.
+
+        Return value:
+        None
+        """
+        if not self.is_valid_id(dataset_id):
+            raise ValueError(f"Invalid dataset identifier {dataset_id!r}.")
+        # Datasets are written through before they become visible, so restarts,
+        # other server workers and evictions always find them on disk.
+        self.spill(dataset_id, dataframe)
+        size = int(dataframe.memory_usage(deep=True).sum())
+        with self.lock:
+            self.datasets[dataset_id] = dataframe
+            self.datasets.move_to_end(dataset_id)
+            self.sizes[dataset_id] = size
+            total = sum(self.sizes.values())
+            # The most recent dataset always stays in memory, even when it alone
+            # exceeds the budget.
+            while total > self.memory_budget and len(self.datasets) > 1:
+                evicted_id, _ = self.datasets.popitem(last=False)
+                total -= self.sizes.pop(evicted_id, 0)
+
+    # -------------------------------------------------------------------------
+    def spill(self, dataset_id: str, dataframe: pd.DataFrame) -> None:
+        path = self.spill_file(dataset_id)
+        if os.path.exists(path):
+            # Identical content is already stored, only its recency is refreshed
+            os.utime(path)
+        else:
+            # Spills use the typed columnar archive, which loads without pickle.
+            # The archive is renamed into place once complete, so readers never
+            # decode a partially written file.
+            descriptor, temporary = tempfile.mkstemp(
+                dir=self.spill_path, prefix=f"{dataset_id}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(descriptor, "wb") as file:
+                    file.write(self.codec.encode(dataframe))
+                os.replace(temporary, path)
+            except BaseException:
+                os.remove(temporary)
+                raise
+            logger.debug("Stored dataset %s on disk", dataset_id)
+        self.trim_disk(keep=path)
+
+    # -------------------------------------------------------------------------
+    def trim_disk(self, keep: str | None = None) -> None:
+        entries = []
+        for name in os.listdir(self.spill_path):
+            if not name.endswith(SPILL_EXTENSION):
+                continue
+            path = os.path.join(self.spill_path, name)
+            # The dataset being registered is never trimmed, even over budget
+            if path == keep:
+                continue
+            stats = os.stat(path)
+            entries.append((stats.st_mtime, stats.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.disk_budget:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Another server worker trimmed the same file concurrently
+                pass
+            total -= size
+
+    # -------------------------------------------------------------------------
+    def get(self, dataset_id: str) -> pd.DataFrame | None:
+        """Retrieve a registered dataset from memory or from the spill directory.
+
+        Keyword arguments:
+        dataset_id -- Identifier returned when the dataset was uploaded.
+
+        Return value:
+        Registered DataFrame, or None when the dataset is unknown or was trimmed
+        from disk.
+        """
+        if not self.is_valid_id(dataset_id):
+            return None
+        with self.lock:
+            dataframe = self.datasets.get(dataset_id)
+            if dataframe is not None:
+                self.datasets.move_to_end(dataset_id)
+                return dataframe
+        path = self.spill_file(dataset_id)
+        try:
+            with open(path, "rb") as file:
+                dataframe, _ = self.codec.decode(file.read())
+        except FileNotFoundError:
+            return None
+        self.register(dataset_id, dataframe)
+        return dataframe
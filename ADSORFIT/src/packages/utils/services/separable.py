@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+from scipy.optimize import least_squares
+
+from ADSORFIT.src.packages.utils.services.models import ModelSpec
+
+
+###############################################################################
+class SeparableSolver:
+    def __init__(self) -> None:
+        self.handlers: dict[
+            str,
+            Callable[
+                [ModelSpec, np.ndarray, np.ndarray, np.ndarray, int],
+                dict[str, Any] | None,
+            ],
+        ] = {
+            "TEMKIN": self.solve_temkin,
+            "LANGMUIR": self.solve_projected,
+            "SIPS": self.solve_projected,
+        }
+        # Parameters entering the model linearly, solved in closed form by the
+        # variable projection path.
+        self.linear_parameters = {"LANGMUIR": "qsat", "SIPS": "qsat"}
+        self.difference_step = float(np.sqrt(np.finfo(np.float64).eps))
+
+    # -------------------------------------------------------------------------
+    def solve(
+        self,
+        spec: ModelSpec,
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        max_iterations: int,
+        weights: np.ndarray | None = None,
+    ) -> dict[str, Any] | None:
+        """Fit partially or fully linear models without a full nonlinear search.
+
+        Keyword arguments:
+        spec -- Specification of the model to fit.
+        pressure -- Pressure observations expressed as a NumPy array.
+        uptake -- Measured uptakes corresponding to the pressure values.
+        max_iterations -- Evaluation budget for the remaining nonlinear parameters.
+        weights -- Optional per-measurement weights, uniform when omitted.
+
+        Return value:
+        Fitting result with the layout produced by ``ModelSolver.fit_model``, or None
+        when the model has no fast path or its solution violates the bounds, in which
+        case the caller should fall back to the general solver.
+        """
+        handler = self.handlers.get(spec.name.upper())
+        if handler is None or pressure.shape[0] <= spec.parameter_count:
+            return None
+        if weights is None:
+            weights = np.ones_like(uptake)
+        try:
+            with np.errstate(all="ignore"):
+                return handler(spec, pressure, uptake, weights, max_iterations)
+        except (ValueError, np.linalg.LinAlgError):
+            return None
+
+    # -------------------------------------------------------------------------
+    def solve_temkin(
+        self,
+        spec: ModelSpec,
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        weights: np.ndarray,
+        max_iterations: int,
+    ) -> dict[str, Any] | None:
+        if np.any(pressure <= 0):
+            return None
+        # beta*ln(k*p) = a + b*ln(p) with b = beta and a = beta*ln(k)
+        design = np.column_stack((np.ones_like(pressure), np.log(pressure)))
+        root_weights = np.sqrt(weights)
+        coefficients, _, rank, _ = np.linalg.lstsq(
+            design * root_weights[:, None], uptake * root_weights, rcond=None
+        )
+        if rank < 2:
+            return None
+        intercept, slope = coefficients
+        if slope <= 0:
+            return None
+        parameters = np.empty(spec.parameter_count, dtype=np.float64)
+        index = {name: position for position, name in enumerate(spec.parameters)}
+        parameters[index["k"]] = np.exp(intercept / slope)
+        parameters[index["beta"]] = slope
+        if not self.within_bounds(spec, parameters):
+            return None
+
+        residuals = uptake - design @ coefficients
+        variance = float(np.sum(weights * residuals**2)) / (pressure.shape[0] - 2)
+        linear_covariance = np.linalg.inv(design.T @ (design * weights[:, None]))
+        linear_covariance *= variance
+        # Delta method from (a, b) to (k, beta): k = exp(a / b), beta = b
+        k = parameters[index["k"]]
+        transform = np.zeros((spec.parameter_count, 2), dtype=np.float64)
+        transform[index["k"]] = (k / slope, -k * intercept / slope**2)
+        transform[index["beta"]] = (0.0, 1.0)
+        covariance = transform @ linear_covariance @ transform.T
+        return self.build_result(spec, pressure, uptake, parameters, covariance, 1)
+
+    # -------------------------------------------------------------------------
+    def solve_projected(
+        self,
+        spec: ModelSpec,
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        weights: np.ndarray,
+        max_iterations: int,
+    ) -> dict[str, Any] | None:
+        linear_name = self.linear_parameters[spec.name.upper()]
+        linear_index = spec.parameters.index(linear_name)
+        nonlinear = np.array(
+            [index for index in range(spec.parameter_count) if index != linear_index]
+        )
+        linear_lower = spec.lower[linear_index]
+        linear_upper = spec.upper[linear_index]
+        parameters = spec.initial.copy()
+
+        def project(theta: np.ndarray) -> tuple[np.ndarray, float]:
+            parameters[nonlinear] = theta
+            parameters[linear_index] = 1.0
+            basis = spec.evaluate(pressure, parameters)
+            weighted_basis = weights * basis
+            denominator = float(np.dot(weighted_basis, basis))
+            amplitude = (
+                float(np.dot(weighted_basis, uptake)) / denominator
+                if denominator > 0
+                else linear_lower
+            )
+            # The linear subproblem is a 1-D convex fit, so clipping the unconstrained
+            # optimum yields the bound-constrained one.
+            return basis, float(np.clip(amplitude, linear_lower, linear_upper))
+
+        def residuals(theta: np.ndarray) -> np.ndarray:
+            basis, amplitude = project(theta)
+            return np.sqrt(weights) * (uptake - amplitude * basis)
+
+        lower, upper = spec.lower[nonlinear], spec.upper[nonlinear]
+        solution = least_squares(
+            residuals,
+            np.clip(spec.initial[nonlinear], lower, upper),
+            bounds=(lower, upper),
+            max_nfev=max(1, int(max_iterations)),
+        )
+        if solution.status <= 0:
+            return None
+
+        _, amplitude = project(solution.x)
+        parameters[nonlinear] = solution.x
+        parameters[linear_index] = amplitude
+        if not np.all(np.isfinite(parameters)):
+            return None
+
+        jacobian = self.full_jacobian(spec, pressure, parameters)
+        weighted_jacobian = jacobian * np.sqrt(weights)[:, None]
+        fitted = spec.evaluate(pressure, parameters)
+        variance = float(np.sum(weights * (uptake - fitted) ** 2)) / (
+            pressure.shape[0] - spec.parameter_count
+        )
+        covariance = np.linalg.pinv(weighted_jacobian.T @ weighted_jacobian) * variance
+        return self.build_result(
+            spec, pressure, uptake, parameters, covariance, int(solution.nfev)
+        )
+
+    # -------------------------------------------------------------------------
+    def full_jacobian(
+        self, spec: ModelSpec, pressure: np.ndarray, parameters: np.ndarray
+    ) -> np.ndarray:
+        if spec.jacobian is not None:
+            return np.asarray(spec.jacobian(pressure, *parameters), dtype=np.float64)
+        baseline = spec.evaluate(pressure, parameters)
+        jacobian = np.empty((pressure.shape[0], spec.parameter_count))
+        for index in range(spec.parameter_count):
+            step = self.difference_step * max(abs(parameters[index]), 1.0)
+            if parameters[index] + step > spec.upper[index]:
+                step = -step
+            shifted = parameters.copy()
+            shifted[index] += step
+            jacobian[:, index] = (spec.evaluate(pressure, shifted) - baseline) / step
+        return jacobian
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def within_bounds(spec: ModelSpec, parameters: np.ndarray) -> bool:
+        return bool(
+            np.all(np.isfinite(parameters))
+            and np.all(parameters >= spec.lower)
+            and np.all(parameters <= spec.upper)
+        )
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def build_result(
+        spec: ModelSpec,
+        pressure: np.ndarray,
+        uptake: np.ndarray,
+        parameters: np.ndarray,
+        covariance: np.ndarray,
+        evaluations: int,
+    ) -> dict[str, Any]:
+        predicted = spec.evaluate(pressure, parameters)
+        lss = float(np.sum((uptake - predicted) ** 2, dtype=np.float64))
+        return {
+            "optimal_params": parameters.tolist(),
+            "covariance": covariance.tolist(),
+            "errors": np.sqrt(np.diag(covariance)).tolist(),
+            "LSS": lss,
+            "arguments": list(spec.parameters),
+            "evaluations": evaluations,
+        }
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import io
+import json
+import zipfile
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+
+COLUMNAR_MEDIA_TYPE = "application/vnd.adsorfit.npz"
+COLUMNS_KEY = "__columns__"
+METADATA_KEY = "__metadata__"
+# Boolean, signed and unsigned integers, floats and fixed-width unicode strings
+ALLOWED_KINDS = frozenset("biufU")
+
+
+###############################################################################
+class ColumnarCodec:
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def is_columnar(media_type: str | None) -> bool:
+        if not media_type:
+            return False
+        return any(
+            part.split(";")[0].strip().lower() == COLUMNAR_MEDIA_TYPE
+            for part in media_type.split(",")
+        )
+
+    # -------------------------------------------------------------------------
+    @staticmethod
+    def to_array(series: pd.Series) -> tuple[np.ndarray, np.ndarray | None]:
+        if is_bool_dtype(series.dtype):
+            return series.to_numpy(dtype=bool), None
+        if is_numeric_dtype(series.dtype):
+            # Missing numbers travel as NaN, so integer columns holding gaps are
+            # widened to float64 like pandas does.
+            if series.dtype.kind in "iu" and not series.isna().any():
+                return series.to_numpy(dtype=np.int64), None
+            return series.to_numpy(dtype=np.float64, na_value=np.nan), None
+        mask = series.isna().to_numpy()
+        values = series.astype(object).where(~mask, "").astype(str).to_numpy(dtype=str)
+        return values, mask if mask.any() else None
+
+    # -------------------------------------------------------------------------
+    def encode(
+        self, dataframe: pd.DataFrame, metadata: dict[str, Any] | None = None
+    ) -> bytes:
+        """Serialize a DataFrame into typed columnar arrays packed as an npz archive.
+
+        Keyword arguments:
+        dataframe -- Dataset to encode.
+        metadata -- Optional JSON-serializable document stored next to the columns.
+
+        Return value:
+        Archive bytes holding one typed array per column, null masks for text
+        columns with missing values, the column names and the metadata document.
+        """
+        arrays: dict[str, np.ndarray] = {}
+        for index, (_, series) in enumerate(dataframe.items()):
+            values, mask = self.to_array(series)
+            arrays[f"column_{index}"] = values
+            if mask is not None:
+                arrays[f"mask_{index}"] = mask
+        arrays[COLUMNS_KEY] = np.array(
+            [str(column) for column in dataframe.columns], dtype=str
+        )
+        arrays[METADATA_KEY] = np.array(json.dumps(metadata or {}))
+        buffer = io.BytesIO()
+        np.savez(buffer, **arrays)
+        return buffer.getvalue()
+
+    # -------------------------------------------------------------------------
+    def decode(self, payload: bytes) -> tuple[pd.DataFrame, dict[str, Any]]:
+        """Rebuild a DataFrame from an archive produced by :meth:`encode`.
+
+        Keyword arguments:
+        payload -- Archive bytes received from the client.
+
+        Return value:
+        Tuple with the decoded DataFrame and the metadata document. Raises
+        ValueError when the archive is malformed or holds unsupported column types;
+        types are checked once per column rather than per cell.
+        """
+        try:
+            archive = np.load(io.BytesIO(payload), allow_pickle=False)
+        except (OSError, ValueError, zipfile.BadZipFile) as exc:
+            raise ValueError("Invalid columnar payload.") from exc
+
+        with archive:
+            if COLUMNS_KEY not in archive.files:
+                raise ValueError("Columnar payload does not declare its columns.")
+            columns = archive[COLUMNS_KEY].tolist()
+            metadata: dict[str, Any] = {}
+            if METADATA_KEY in archive.files:
+                metadata = json.loads(str(archive[METADATA_KEY]))
+            data: dict[str, Any] = {}
+            length: int | None = None
+            for index, name in enumerate(columns):
+                key = f"column_{index}"
+                if key not in archive.files:
+                    raise ValueError(f"Column {name} is missing from the payload.")
+                values = archive[key]
+                if values.ndim != 1 or values.dtype.kind not in ALLOWED_KINDS:
+                    raise ValueError(
+                        f"Column {name} has unsupported type {values.dtype}."
+                    )
+                if length is None:
+                    length = values.shape[0]
+                elif values.shape[0] != length:
+                    raise ValueError(f"Column {name} has {values.shape[0]} rows.")
+                if values.dtype.kind == "U":
+                    values = values.astype(object)
+                    mask_key = f"mask_{index}"
+                    if mask_key in archive.files:
+                        mask = archive[mask_key]
+                        # Masks index the column directly, a malformed one would
+                        # otherwise surface as an IndexError from NumPy
+                        if mask.dtype != np.bool_ or mask.shape != values.shape:
+                            raise ValueError(
+                                f"Column {name} has an invalid missing-value mask."
+                            )
+                        values[mask] = None
+                data[name] = values
+        if not isinstance(metadata, dict):
+            raise ValueError("Columnar payload metadata must be a JSON object.")
+        return pd.DataFrame(data, columns=columns), metadata
@@ -7,6 +7,7 @@ from ADSORFIT.src.packages.variables import env_variables
 from ADSORFIT.src.packages.configurations import configurations
 from ADSORFIT.src.server.endpoints.datasets import router as dataset_router
 from ADSORFIT.src.server.endpoints.fitting import router as fit_router
+from ADSORFIT.src.server.endpoints.results import router as results_router
 
 
 ###############################################################################
@@ -19,6 +20,7 @@ app = FastAPI(
 
 app.include_router(dataset_router)
 app.include_router(fit_router)
+app.include_router(results_router)
 
 @app.get("/")
 def redirect_to_docs() -> RedirectResponse:
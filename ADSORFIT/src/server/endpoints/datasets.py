@@ -1,20 +1,52 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, File, HTTPException, UploadFile, status
+from typing import Any
+
+from fastapi import APIRouter, File, Form, Header, HTTPException, UploadFile, status
+from fastapi.responses import Response
 
 from ADSORFIT.src.server.schemas.datasets import DatasetLoadResponse
 from ADSORFIT.src.packages.logger import logger
 from ADSORFIT.src.packages.utils.services.datasets import DatasetService
+from ADSORFIT.src.packages.utils.services.wire import (
+    COLUMNAR_MEDIA_TYPE,
+    ColumnarCodec,
+)
 
 router = APIRouter(prefix="/datasets", tags=["load"])
 dataset_service = DatasetService()
+codec = ColumnarCodec()
+
+
+# -------------------------------------------------------------------------------
+def build_columnar_response(
+    payload: bytes, filename: str | None, sheets: list[str]
+) -> Response:
+    # Columnar clients receive the preview as typed arrays, while the identifier
+    # and summary travel in the archive metadata document.
+    dataset_id, dataframe = dataset_service.register_upload(payload, filename, sheets)
+    metadata = {
+        "status": "success",
+        "summary": dataset_service.format_dataset_summary(dataframe),
+        "dataset_id": dataset_id,
+        "row_count": int(dataframe.shape[0]),
+    }
+    content = codec.encode(dataframe.head(dataset_service.preview_rows), metadata)
+    return Response(content=content, media_type=COLUMNAR_MEDIA_TYPE)
 
 
 # -------------------------------------------------------------------------------
 @router.post(
     "/load", response_model=DatasetLoadResponse, status_code=status.HTTP_200_OK
 )
-async def load_dataset(file: UploadFile = File(...)) -> DatasetLoadResponse:
+async def load_dataset(
+    file: UploadFile = File(...),
+    sheets: str | None = Form(default=None),
+    accept: str | None = Header(default=None),
+) -> Any:
+    # Worksheets are selected with a comma-separated list, all sheets by default
+    selected_sheets = [sheet.strip() for sheet in (sheets or "").split(",")]
+    selected_sheets = [sheet for sheet in selected_sheets if sheet]
     try:
         payload = await file.read()
     except Exception as exc:  # noqa: BLE001
@@ -25,8 +57,10 @@ async def load_dataset(file: UploadFile = File(...)) -> DatasetLoadResponse:
         ) from exc
 
     try:
+        if codec.is_columnar(accept):
+            return build_columnar_response(payload, file.filename, selected_sheets)
         dataset_payload, summary = dataset_service.load_from_bytes(
-            payload, file.filename
+            payload, file.filename, selected_sheets
         )
     except ValueError as exc:
         logger.warning("Invalid dataset upload: %s", exc)
@@ -40,4 +74,6 @@ async def load_dataset(file: UploadFile = File(...)) -> DatasetLoadResponse:
             detail="Failed to process uploaded dataset.",
         ) from exc
 
-    return DatasetLoadResponse(summary=summary, dataset=dataset_payload)
+    # The registry identifier is the only reference fitting requests need, the
+    # preview rows are shown to the user but never sent back.
+    return DatasetLoadResponse(summary=summary, **dataset_payload)
@@ -1,45 +1,160 @@
 from __future__ import annotations
 
 import asyncio
+import json
+from collections.abc import AsyncIterator
 from typing import Any
 
-from fastapi import APIRouter, HTTPException, status
+import pandas as pd
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, status
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import Response, StreamingResponse
+from pydantic import ValidationError
 
-from ADSORFIT.src.server.schemas.fitting import FittingRequest, FittingResponse
+from ADSORFIT.src.server.schemas.fitting import (
+    FittingJobStatus,
+    FittingJobSubmitResponse,
+    FittingRequest,
+    FittingResponse,
+)
+from ADSORFIT.src.packages.configurations import configurations
 from ADSORFIT.src.packages.logger import logger
 from ADSORFIT.src.packages.utils.services.fitting import FittingPipeline
+from ADSORFIT.src.packages.utils.services.jobs import (
+    TERMINAL_JOB_STATES,
+    FittingJobManager,
+    JobCancelledError,
+    JobQueueFullError,
+)
+from ADSORFIT.src.packages.utils.services.persistence import PersistenceError
+from ADSORFIT.src.packages.utils.services.registry import DatasetRegistry
+from ADSORFIT.src.packages.utils.services.wire import (
+    COLUMNAR_MEDIA_TYPE,
+    ColumnarCodec,
+)
 
 router = APIRouter(prefix="/fitting", tags=["fitting"])
 pipeline = FittingPipeline()
+job_manager = FittingJobManager(pipeline, configurations.server.jobs)
+dataset_registry = DatasetRegistry()
+codec = ColumnarCodec()
 
 
 # -------------------------------------------------------------------------------
-@router.post("/run", response_model=FittingResponse, status_code=status.HTTP_200_OK)
-async def run_fitting_job(payload: FittingRequest) -> Any:
+def decode_columnar_request(body: bytes) -> FittingRequest:
+    # The archive carries the measurements as typed columns and the remaining
+    # request fields as its metadata document; the decoded dataset is registered
+    # so the job only references it by identifier.
+    dataframe, metadata = codec.decode(body)
+    if dataframe.empty:
+        raise ValueError("Uploaded dataset is empty.")
+    dataset_id = dataset_registry.compute_dataset_id(body, ".npz")
+    dataset_registry.register(dataset_id, dataframe)
+    metadata.pop("dataset", None)
+    return FittingRequest.model_validate({**metadata, "dataset_id": dataset_id})
+
+
+# -------------------------------------------------------------------------------
+async def parse_fitting_request(request: Request) -> FittingRequest:
+    body = await request.body()
+    try:
+        if codec.is_columnar(request.headers.get("content-type")):
+            return await asyncio.to_thread(decode_columnar_request, body)
+        return FittingRequest.model_validate_json(body)
+    except ValidationError as exc:
+        raise RequestValidationError(exc.errors()) from exc
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+
+
+# -------------------------------------------------------------------------------
+def build_fitting_response(response: dict[str, Any] | None, accept: str | None) -> Any:
+    if response is None or not codec.is_columnar(accept):
+        return response
+    preview = pd.DataFrame.from_records(response.get("best_model_preview") or [])
+    metadata = {
+        key: value for key, value in response.items() if key != "best_model_preview"
+    }
+    return Response(
+        content=codec.encode(preview, metadata), media_type=COLUMNAR_MEDIA_TYPE
+    )
+
+
+# -------------------------------------------------------------------------------
+def build_run_arguments(payload: FittingRequest) -> dict[str, Any]:
+    # Registered datasets are resolved server-side by the pipeline, so only the
+    # identifier travels with the job.
+    if payload.from_database:
+        dataset_payload: dict[str, Any] = {"source": "database"}
+    elif payload.dataset_id:
+        dataset_payload = {"dataset_id": payload.dataset_id}
+    else:
+        dataset_payload = payload.dataset.model_dump()
+    return {
+        "dataset_payload": dataset_payload,
+        "configuration": {
+            name: config.model_dump()
+            for name, config in payload.parameter_bounds.items()
+        },
+        "max_iterations": payload.max_iterations,
+        "save_best": payload.save_best,
+        "use_cache": payload.use_cache,
+        "incremental": payload.incremental,
+        "streaming": payload.streaming,
+    }
+
+
+# -------------------------------------------------------------------------------
+def submit_job(payload: FittingRequest) -> tuple[str, Any]:
     logger.info(
         "Received fitting request: iterations=%s, save_best=%s",
         payload.max_iterations,
         payload.save_best,
     )
+    if (
+        not payload.from_database
+        and payload.dataset_id
+        and not dataset_registry.contains(payload.dataset_id)
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Unknown dataset {payload.dataset_id}, please upload it again.",
+        )
+    try:
+        return job_manager.submit(build_run_arguments(payload))
+    except JobQueueFullError as exc:
+        logger.warning("Rejected fitting request: %s", exc)
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS, detail=str(exc)
+        ) from exc
 
+
+# -------------------------------------------------------------------------------
+@router.post("/run", response_model=FittingResponse, status_code=status.HTTP_200_OK)
+async def run_fitting_job(
+    payload: FittingRequest = Depends(parse_fitting_request),
+    accept: str | None = Header(default=None),
+) -> Any:
+    # Submission records the job in the database, which must not block the loop
+    _, future = await asyncio.to_thread(submit_job, payload)
     try:
-        response = await asyncio.to_thread(
-            pipeline.run,
-            payload.dataset.model_dump(),
-            {
-                name: config.model_dump()
-                for name, config in payload.parameter_bounds.items()
-            },
-            payload.max_iterations,
-            payload.save_best,
-        )
+        response = await asyncio.wrap_future(future)
+    except JobCancelledError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT, detail="Fitting job was cancelled."
+        ) from exc
+    except PersistenceError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Fitting results could not be saved to the database.",
+        ) from exc
     except ValueError as exc:
-        logger.warning("Invalid fitting request: %s", exc)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
         ) from exc
     except Exception as exc:  # noqa: BLE001
-        logger.exception("ADSORFIT fitting job failed")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to complete the fitting job.",
@@ -49,4 +164,106 @@ async def run_fitting_job(payload: FittingRequest) -> Any:
         "Fitting job completed successfully with %s experiments",
         response.get("processed_rows"),
     )
-    return response
+    return build_fitting_response(response, accept)
+
+
+# -------------------------------------------------------------------------------
+@router.post(
+    "/jobs",
+    response_model=FittingJobSubmitResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def submit_fitting_job(
+    payload: FittingRequest = Depends(parse_fitting_request),
+) -> Any:
+    job_id, _ = await asyncio.to_thread(submit_job, payload)
+    return {"job_id": job_id, "status": "queued"}
+
+
+# -------------------------------------------------------------------------------
+@router.get(
+    "/jobs/{job_id}", response_model=FittingJobStatus, status_code=status.HTTP_200_OK
+)
+async def get_fitting_job(job_id: str) -> Any:
+    record = await asyncio.to_thread(job_manager.get_status, job_id)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown job {job_id}."
+        )
+    return record
+
+
+# -------------------------------------------------------------------------------
+async def stream_job_events(job_id: str) -> AsyncIterator[str]:
+    cursor = 0
+    interval = configurations.server.jobs.stream_interval
+    while True:
+        event = await asyncio.to_thread(job_manager.get_events, job_id, cursor)
+        if event is None:
+            break
+        cursor += len(event["rows"])
+        yield f"event: progress\ndata: {json.dumps(event)}\n\n"
+        if event["status"] in TERMINAL_JOB_STATES:
+            break
+        await asyncio.sleep(interval)
+
+
+# -------------------------------------------------------------------------------
+@router.get("/jobs/{job_id}/events", status_code=status.HTTP_200_OK)
+async def stream_fitting_job(job_id: str) -> StreamingResponse:
+    record = await asyncio.to_thread(job_manager.get_status, job_id)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown job {job_id}."
+        )
+    return StreamingResponse(
+        stream_job_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
+
+
+# -------------------------------------------------------------------------------
+@router.get(
+    "/jobs/{job_id}/result",
+    response_model=FittingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_fitting_job_result(
+    job_id: str, accept: str | None = Header(default=None)
+) -> Any:
+    record = await asyncio.to_thread(job_manager.get_status, job_id)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown job {job_id}."
+        )
+    if record.get("status") != "completed":
+        detail = record.get("error") or f"Job {job_id} is {record.get('status')}."
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=detail)
+    response = await asyncio.to_thread(job_manager.get_result, job_id)
+    return build_fitting_response(response, accept)
+
+
+# -------------------------------------------------------------------------------
+@router.delete(
+    "/jobs/{job_id}", response_model=FittingJobStatus, status_code=status.HTTP_200_OK
+)
+async def cancel_fitting_job(job_id: str) -> Any:
+    record = await asyncio.to_thread(job_manager.cancel, job_id)
+    if record is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail=f"Unknown job {job_id}."
+        )
+    return record
+
+
+# -------------------------------------------------------------------------------
+@router.delete("/cache", status_code=status.HTTP_200_OK)
+async def purge_fit_cache() -> dict[str, str]:
+    try:
+        await asyncio.to_thread(pipeline.purge_cache)
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+    return {"status": "success"}
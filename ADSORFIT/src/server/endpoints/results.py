@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import Any
+
+import numpy as np
+import pandas as pd
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+
+from ADSORFIT.src.server.schemas.results import ResultsPageResponse
+from ADSORFIT.src.packages.configurations import configurations
+from ADSORFIT.src.packages.utils.repository.queries import ResultsQuery
+from ADSORFIT.src.packages.utils.repository.serializer import DataSerializer
+
+router = APIRouter(prefix="/results", tags=["results"])
+serializer = DataSerializer()
+page_settings = configurations.server.results
+
+
+# -------------------------------------------------------------------------------
+def parse_results_query(
+    run_id: str | None = None,
+    limit: int = Query(
+        default=page_settings.default_page_size,
+        ge=1,
+        le=page_settings.max_page_size,
+    ),
+    columns: list[str] | None = Query(default=None),
+    sort: str = "experiment",
+    descending: bool = False,
+    cursor: str | None = None,
+    experiment_prefix: str | None = None,
+    min_temperature: float | None = None,
+    max_temperature: float | None = None,
+    model: str | None = None,
+    max_lss: float | None = None,
+) -> ResultsQuery:
+    # The latest completed run is read when no run is requested; on best-fit
+    # pages the model and LSS filters apply to the best model of each experiment.
+    return ResultsQuery(
+        limit=limit,
+        run_id=run_id,
+        columns=tuple(columns or ()),
+        sort=sort,
+        descending=descending,
+        cursor=cursor,
+        experiment_prefix=experiment_prefix,
+        min_temperature=min_temperature,
+        max_temperature=max_temperature,
+        model=model,
+        max_lss=max_lss,
+    )
+
+
+# -------------------------------------------------------------------------------
+def serialize_value(value: Any) -> Any:
+    # JSON has no NaN, so missing scores and parameters become null
+    if isinstance(value, np.ndarray):
+        return [serialize_value(item) for item in value.tolist()]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    return value
+
+
+# -------------------------------------------------------------------------------
+def serialize_rows(rows: pd.DataFrame) -> list[dict[str, Any]]:
+    return [
+        {column: serialize_value(value) for column, value in record.items()}
+        for record in rows.to_dict(orient="records")
+    ]
+
+
+# -------------------------------------------------------------------------------
+async def load_results_page(view_name: str, query: ResultsQuery) -> dict[str, Any]:
+    try:
+        page = await asyncio.to_thread(
+            serializer.load_results_page, view_name, query
+        )
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)
+        ) from exc
+    return {
+        "run_id": page.run_id,
+        "rows": serialize_rows(page.rows),
+        "next_cursor": page.next_cursor,
+    }
+
+
+# -------------------------------------------------------------------------------
+@router.get(
+    "/fits", response_model=ResultsPageResponse, status_code=status.HTTP_200_OK
+)
+async def get_model_fits(
+    query: ResultsQuery = Depends(parse_results_query),
+) -> Any:
+    return await load_results_page("fits", query)
+
+
+# -------------------------------------------------------------------------------
+@router.get(
+    "/best", response_model=ResultsPageResponse, status_code=status.HTTP_200_OK
+)
+async def get_best_fits(
+    query: ResultsQuery = Depends(parse_results_query),
+) -> Any:
+    return await load_results_page("best", query)
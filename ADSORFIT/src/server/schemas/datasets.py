@@ -4,11 +4,12 @@ from typing import Any
 
 from pydantic import BaseModel, Field
 
-from ADSORFIT.src.server.schemas.fitting import DatasetPayload
-
 
 ###############################################################################
 class DatasetLoadResponse(BaseModel):
     status: str = Field(default="success")
     summary: str
-    dataset: DatasetPayload | dict[str, Any] | None = None
+    dataset_id: str
+    columns: list[str] = Field(default_factory=list)
+    preview: list[dict[str, Any]] = Field(default_factory=list)
+    row_count: int = 0
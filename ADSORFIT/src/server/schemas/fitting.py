@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_validator
+
+from ADSORFIT.src.packages.utils.services.registry import DATASET_ID_PATTERN
 
 
 ###############################################################################
@@ -22,15 +24,53 @@ class ModelParameterConfig(BaseModel):
 class FittingRequest(BaseModel):
     max_iterations: int = Field(..., ge=1)
     save_best: bool = False
+    use_cache: bool = True
+    incremental: bool = False
+    streaming: bool = False
+    from_database: bool = False
     parameter_bounds: dict[str, ModelParameterConfig]
-    dataset: DatasetPayload
+    dataset: DatasetPayload | None = None
+    dataset_id: str | None = Field(default=None, pattern=DATASET_ID_PATTERN)
+
+    # -------------------------------------------------------------------------
+    @model_validator(mode="after")
+    def check_dataset_source(self) -> FittingRequest:
+        # Runs over the stored raw measurements need no uploaded dataset
+        if self.dataset is None and not self.dataset_id and not self.from_database:
+            raise ValueError("Either dataset or dataset_id must be provided.")
+        return self
 
 
 ###############################################################################
 class FittingResponse(BaseModel):
     status: str = Field(default="success")
     summary: str
+    run_id: str | None = None
     processed_rows: int
     models: list[str]
     best_model_saved: bool
     best_model_preview: list[dict[str, Any]] | None = None
+    evaluation_report: dict[str, dict[str, float]] | None = None
+    cache_statistics: dict[str, int] | None = None
+    incremental_summary: dict[str, int] | None = None
+
+
+###############################################################################
+class FittingJobSubmitResponse(BaseModel):
+    job_id: str
+    status: str
+
+
+###############################################################################
+class FittingJobStatus(BaseModel):
+    job_id: str
+    status: str
+    completed: int = 0
+    total: int = 0
+    cancel_requested: bool = False
+    submitted_at: float | None = None
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
+    persisted: bool = False
+    persist_error: str | None = None
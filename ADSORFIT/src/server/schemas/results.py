@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+
+###############################################################################
+class ResultsPageResponse(BaseModel):
+    run_id: str | None = None
+    rows: list[dict[str, Any]] = Field(default_factory=list)
+    next_cursor: str | None = None
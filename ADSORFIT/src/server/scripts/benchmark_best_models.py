@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import sqlalchemy
+
+from ADSORFIT.src.packages.configurations import build_database_settings
+from ADSORFIT.src.packages.utils.repository.database import database
+from ADSORFIT.src.packages.utils.repository.serializer import DataSerializer
+from ADSORFIT.src.packages.utils.repository.sqlite import SQLiteRepository
+from ADSORFIT.src.packages.utils.repository.vectors import encode_vector
+from ADSORFIT.src.packages.utils.services.processing import DatasetAdapter
+
+EXPERIMENTS = 100_000
+MODELS = ("Langmuir", "Sips", "Freundlich", "Temkin", "Toth", "Dubinin-Radushkevich")
+RUN_ID = "benchmark"
+
+
+# -------------------------------------------------------------------------------
+def build_model_fits(experiments: int) -> pd.DataFrame:
+    generator = np.random.default_rng(42)
+    names = [f"Experiment {index}" for index in range(experiments)]
+    frames = [
+        pd.DataFrame(
+            {
+                "run_id": RUN_ID,
+                "experiment": names,
+                "model": model,
+                "lss": generator.uniform(0.0, 1.0, experiments),
+                "parameter_names": "k,qsat",
+                "parameters": [encode_vector(generator.uniform(0, 10, 2))]
+                * experiments,
+                "errors": [encode_vector(np.zeros(2))] * experiments,
+            }
+        )
+        for model in MODELS
+    ]
+    return pd.concat(frames, ignore_index=True)
+
+
+# -------------------------------------------------------------------------------
+def pandas_selection(fits: pd.DataFrame) -> pd.DataFrame:
+    # Previous behaviour: pivot to the wide layout and pick models with idxmin
+    wide = fits.pivot(index="experiment", columns="model", values="lss")
+    wide.columns = [f"{model} LSS" for model in wide.columns]
+    return DatasetAdapter.compute_best_models(wide.reset_index())
+
+
+# -------------------------------------------------------------------------------
+def main() -> None:
+    fits = build_model_fits(EXPERIMENTS)
+    with tempfile.TemporaryDirectory() as folder:
+        repository = SQLiteRepository(
+            build_database_settings({}), os.path.join(folder, "sqlite.db")
+        )
+        database.backend = repository
+        repository.append_into_database(fits, "ADSORPTION_MODEL_FITS")
+
+        start = time.perf_counter()
+        stored = repository.read_query(
+            sqlalchemy.text(
+                'SELECT experiment, model, lss FROM "ADSORPTION_MODEL_FITS" '
+                "WHERE run_id = :run_id"
+            ).bindparams(run_id=RUN_ID)
+        )
+        expected = pandas_selection(stored)
+        pandas_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        selected = DataSerializer().load_best_models(RUN_ID)
+        sql_time = time.perf_counter() - start
+        repository.engine.dispose()
+        repository.reader_engine.dispose()
+
+    merged = expected.merge(selected, on="experiment", suffixes=("", " sql"))
+    assert merged.shape[0] == EXPERIMENTS, "Experiments are missing from the query"
+    assert (merged["best model"] == merged["best model sql"]).all()
+    assert (merged["worst model"] == merged["worst model sql"]).all()
+    print(f"{EXPERIMENTS:,} experiments x {len(MODELS)} models")
+    print(f"load and pandas idxmin: {pandas_time:6.2f} s")
+    print(f"SQL window query:       {sql_time:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+import sqlalchemy
+from sqlalchemy.engine import Connection, Engine
+
+from ADSORFIT.src.packages.utils.repository.bulk import (
+    build_insert_statement,
+    insert_rows,
+)
+from ADSORFIT.src.packages.utils.repository.postgres import copy_dataframe
+from ADSORFIT.src.packages.utils.repository.schema import Base
+
+ROWS = 500_000
+BATCH_SIZE = 20_000
+TABLE_NAME = "ADSORPTION_DATA"
+# Optional SQLAlchemy URL of a scratch PostgreSQL database, its ADSORPTION_DATA
+# table is emptied by the benchmark.
+POSTGRES_URL_VARIABLE = "ADSORFIT_BENCHMARK_POSTGRES_URL"
+
+
+# -------------------------------------------------------------------------------
+def build_measurements(rows: int) -> pd.DataFrame:
+    generator = np.random.default_rng(42)
+    experiments = np.arange(rows) // 20
+    pressure = generator.uniform(1.0, 1e5, rows)
+    return pd.DataFrame(
+        {
+            "run_id": "benchmark",
+            "experiment": np.char.add("Experiment ", experiments.astype(str)),
+            "temperature [K]": 273 + (experiments % 5) * 25,
+            "pressure [Pa]": pressure,
+            "uptake [mol/g]": 5.0 * pressure / (1e4 + pressure),
+        }
+    )
+
+
+# -------------------------------------------------------------------------------
+def pandas_writer(conn: Connection, df: pd.DataFrame) -> None:
+    df.to_sql(TABLE_NAME, conn, if_exists="append", index=False)
+
+
+# -------------------------------------------------------------------------------
+def executemany_writer(conn: Connection, df: pd.DataFrame) -> None:
+    statement = build_insert_statement(conn.engine, TABLE_NAME, list(df.columns))
+    insert_rows(conn, statement, df, BATCH_SIZE)
+
+
+# -------------------------------------------------------------------------------
+def copy_writer(conn: Connection, df: pd.DataFrame) -> None:
+    if not copy_dataframe(conn, df, TABLE_NAME, BATCH_SIZE):
+        raise RuntimeError("The PostgreSQL driver does not support COPY")
+
+
+# -------------------------------------------------------------------------------
+def measure(
+    engine: Engine,
+    backend: str,
+    writers: dict[str, Callable[[Connection, pd.DataFrame], None]],
+    df: pd.DataFrame,
+) -> None:
+    Base.metadata.create_all(engine)
+    for label, writer in writers.items():
+        with engine.begin() as conn:
+            conn.execute(sqlalchemy.text(f'DELETE FROM "{TABLE_NAME}"'))
+        start = time.perf_counter()
+        with engine.begin() as conn:
+            writer(conn, df)
+        elapsed = time.perf_counter() - start
+        print(f"{backend:<9}{label:<12}{df.shape[0] / elapsed:>14,.0f} rows/s")
+
+
+# -------------------------------------------------------------------------------
+def main() -> None:
+    df = build_measurements(ROWS)
+    print(f"Rows: {ROWS:,}")
+    with tempfile.TemporaryDirectory() as folder:
+        engine = sqlalchemy.create_engine(
+            f"sqlite:///{os.path.join(folder, 'benchmark.db')}", future=True
+        )
+        measure(
+            engine,
+            "sqlite",
+            {"to_sql": pandas_writer, "executemany": executemany_writer},
+            df,
+        )
+        engine.dispose()
+
+    postgres_url = os.environ.get(POSTGRES_URL_VARIABLE)
+    if not postgres_url:
+        print(f"postgres skipped, set {POSTGRES_URL_VARIABLE} to include it")
+        return
+    engine = sqlalchemy.create_engine(postgres_url, future=True)
+    measure(
+        engine,
+        "postgres",
+        {
+            "to_sql": pandas_writer,
+            "executemany": executemany_writer,
+            "copy": copy_writer,
+        },
+        df,
+    )
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import io
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from ADSORFIT.src.packages.constants import DATASET_FALLBACK_DELIMITERS
+from ADSORFIT.src.packages.utils.services.datasets import (
+    PYARROW_AVAILABLE,
+    DatasetService,
+)
+
+TARGET_MB = 100
+POINTS_PER_EXPERIMENT = 20
+
+
+# -------------------------------------------------------------------------------
+def build_payload(target_mb: int) -> bytes:
+    # Mimics the semicolon-separated layout of the adsorption_data.csv template
+    rows = target_mb * 1024 * 1024 // 48
+    generator = np.random.default_rng(42)
+    experiments = np.arange(rows) // POINTS_PER_EXPERIMENT
+    pressure = generator.uniform(1.0, 1e5, rows)
+    dataframe = pd.DataFrame(
+        {
+            "experiment": np.char.add("Experiment ", experiments.astype(str)),
+            "temperature [K]": 273 + (experiments % 5) * 25,
+            "pressure [Pa]": pressure,
+            "uptake [mol/g]": 5.0 * pressure / (1e4 + pressure),
+        }
+    )
+    return dataframe.to_csv(sep=";", index=False, float_format="%.6E").encode()
+
+
+# -------------------------------------------------------------------------------
+def legacy_read(payload: bytes) -> pd.DataFrame:
+    buffer = io.BytesIO(payload)
+    dataframe = pd.read_csv(buffer)
+    if dataframe.shape[1] == 1:
+        column_name = dataframe.columns[0]
+        for delimiter in DATASET_FALLBACK_DELIMITERS:
+            if delimiter in column_name:
+                buffer.seek(0)
+                dataframe = pd.read_csv(buffer, sep=delimiter)
+                break
+    return dataframe
+
+
+# -------------------------------------------------------------------------------
+def main() -> None:
+    payload = build_payload(TARGET_MB)
+    service = DatasetService()
+    print(f"Payload: {len(payload) / 1e6:.1f} MB, pyarrow={PYARROW_AVAILABLE}")
+    for label, reader in (
+        ("legacy", legacy_read),
+        ("sniffed", lambda data: service.read_dataframe(data, "upload.csv")),
+    ):
+        start = time.perf_counter()
+        dataframe = reader(payload)
+        elapsed = time.perf_counter() - start
+        memory = dataframe.memory_usage(deep=True).sum() / 1e6
+        del dataframe
+        # Allocation tracing slows parsing down, so the peak is measured on a
+        # separate run rather than on the timed one
+        tracemalloc.start()
+        try:
+            reader(payload)
+            peak = tracemalloc.get_traced_memory()[1] / 1e6
+        finally:
+            tracemalloc.stop()
+        print(
+            f"{label:<8} parse={elapsed:6.2f} s memory={memory:8.1f} MB "
+            f"peak={peak:8.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from ADSORFIT.src.packages.constants import MODEL_PARAMETER_DEFAULTS
+from ADSORFIT.src.packages.utils.repository.serializer import DataSerializer
+from ADSORFIT.src.packages.utils.services.fitting import ModelSolver
+from ADSORFIT.src.packages.utils.services.processing import (
+    AdsorptionDataProcessor,
+    DatasetAdapter,
+)
+
+ROWS = 200_000
+POINTS_PER_EXPERIMENT = 20
+MAX_ITERATIONS = 200
+# Peak traced memory allowed for the in-memory pipeline stages, as a multiple of
+# the deep memory usage of the uploaded DataFrame.
+MAX_PEAK_RATIO = 4.0
+
+
+# -------------------------------------------------------------------------------
+def build_dataset(rows: int) -> pd.DataFrame:
+    generator = np.random.default_rng(42)
+    experiments = np.arange(rows) // POINTS_PER_EXPERIMENT
+    pressure = generator.uniform(1.0, 1e5, rows)
+    noise = generator.normal(1.0, 0.01, rows)
+    return pd.DataFrame(
+        {
+            "experiment": np.char.add("Experiment ", experiments.astype(str)),
+            "temperature [K]": 273.0 + (experiments % 5) * 25.0,
+            "pressure [Pa]": pressure,
+            "uptake [mol/g]": 5.0 * pressure / (1e4 + pressure) * noise,
+        }
+    )
+
+
+# -------------------------------------------------------------------------------
+def build_configuration() -> dict[str, dict[str, dict[str, float]]]:
+    return {
+        model: {
+            "min": {name: lower for name, (lower, _) in bounds.items()},
+            "max": {name: upper for name, (_, upper) in bounds.items()},
+            "initial": {
+                name: (lower + upper) / 2 for name, (lower, upper) in bounds.items()
+            },
+        }
+        for model, bounds in MODEL_PARAMETER_DEFAULTS.items()
+    }
+
+
+# -------------------------------------------------------------------------------
+def run_stages(dataframe: pd.DataFrame) -> None:
+    # Mirrors FittingPipeline.run without the database writes
+    serializer = DataSerializer()
+    adapter = DatasetAdapter()
+    processor = AdsorptionDataProcessor(dataframe)
+    store, columns, _ = processor.preprocess(detect_columns=True)
+    store.to_dataframe(columns, encoder=serializer.encode_vector)
+    results = ModelSolver().bulk_data_fitting(
+        store, build_configuration(), MAX_ITERATIONS
+    )
+    fits = adapter.build_model_fits(results, store.experiments)
+    serializer.encode_vector_columns(fits)
+
+
+# -------------------------------------------------------------------------------
+def main() -> None:
+    dataframe = build_dataset(ROWS)
+    input_size = int(dataframe.memory_usage(deep=True).sum())
+    tracemalloc.start()
+    try:
+        run_stages(dataframe)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    ratio = peak / input_size
+    print(
+        f"Input: {input_size / 1e6:.1f} MB, peak: {peak / 1e6:.1f} MB "
+        f"({ratio:.2f}x, limit {MAX_PEAK_RATIO:.1f}x)"
+    )
+    assert ratio <= MAX_PEAK_RATIO, "Pipeline peak memory exceeds the allowed ratio"
+
+
+if __name__ == "__main__":
+    main()
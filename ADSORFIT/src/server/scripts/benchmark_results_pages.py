@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import sqlalchemy
+
+from ADSORFIT.src.packages.configurations import build_database_settings
+from ADSORFIT.src.packages.utils.repository.database import database
+from ADSORFIT.src.packages.utils.repository.queries import (
+    ResultsQuery,
+    encode_cursor,
+)
+from ADSORFIT.src.packages.utils.repository.serializer import DataSerializer
+from ADSORFIT.src.packages.utils.repository.sqlite import SQLiteRepository
+from ADSORFIT.src.packages.utils.repository.vectors import encode_vector
+
+EXPERIMENTS = 250_000
+MODELS = ("Langmuir", "Sips", "Freundlich", "Temkin")
+PAGE_SIZE = 100
+DEPTHS = (0.0, 0.25, 0.5, 0.99)
+RUN_ID = "benchmark"
+# Page latency may grow by this factor from the first to the deepest page
+MAX_LATENCY_RATIO = 3.0
+
+
+# -------------------------------------------------------------------------------
+def build_tables(experiments: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    generator = np.random.default_rng(42)
+    names = [f"Experiment {index:07d}" for index in range(experiments)]
+    processed = pd.DataFrame(
+        {
+            "run_id": RUN_ID,
+            "experiment": names,
+            "temperature [K]": 273 + (np.arange(experiments) % 5) * 25,
+            "pressure [Pa]": [encode_vector(np.linspace(1.0, 1e5, 20))] * experiments,
+            "uptake [mol/g]": [encode_vector(np.linspace(0.0, 5.0, 20))] * experiments,
+            "measurement_count": 20,
+        }
+    )
+    fits = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "run_id": RUN_ID,
+                    "experiment": names,
+                    "model": model,
+                    "lss": generator.uniform(0.0, 1.0, experiments),
+                    "parameter_names": "k,qsat",
+                    "parameters": [encode_vector([1.0, 2.0])] * experiments,
+                    "errors": [encode_vector([0.1, 0.2])] * experiments,
+                }
+            )
+            for model in MODELS
+        ],
+        ignore_index=True,
+    )
+    return processed, fits
+
+
+# -------------------------------------------------------------------------------
+def cursor_at(repository: SQLiteRepository, query: ResultsQuery, depth: float) -> str:
+    # Deep cursors are built from the stored rows instead of walking every page
+    row_count = repository.count_rows("ADSORPTION_MODEL_FITS")
+    row = repository.read_query(
+        sqlalchemy.text(
+            'SELECT experiment, id FROM "ADSORPTION_MODEL_FITS" '
+            "ORDER BY experiment, id LIMIT 1 OFFSET :offset"
+        ).bindparams(offset=int(row_count * depth))
+    ).iloc[0]
+    return encode_cursor(query, row["experiment"], row["id"])
+
+
+# -------------------------------------------------------------------------------
+def main() -> None:
+    processed, fits = build_tables(EXPERIMENTS)
+    serializer = DataSerializer()
+    query = ResultsQuery(limit=PAGE_SIZE, run_id=RUN_ID)
+    latencies: list[float] = []
+    with tempfile.TemporaryDirectory() as folder:
+        repository = SQLiteRepository(
+            build_database_settings({}), os.path.join(folder, "sqlite.db")
+        )
+        database.backend = repository
+        repository.append_into_database(processed, "ADSORPTION_PROCESSED_DATA")
+        repository.append_into_database(fits, "ADSORPTION_MODEL_FITS")
+        print(f"Model fit rows: {fits.shape[0]:,}, page size {PAGE_SIZE}")
+        for depth in DEPTHS:
+            cursor = cursor_at(repository, query, depth) if depth else None
+            page_query = ResultsQuery(limit=PAGE_SIZE, run_id=RUN_ID, cursor=cursor)
+            start = time.perf_counter()
+            page = serializer.load_results_page("fits", page_query)
+            latencies.append(time.perf_counter() - start)
+            assert page.rows.shape[0] == PAGE_SIZE, "Page returned too few rows"
+            print(f"page at {depth:>5.0%}: {latencies[-1] * 1000:8.2f} ms")
+        repository.engine.dispose()
+        repository.reader_engine.dispose()
+
+    ratio = max(latencies) / min(latencies)
+    assert ratio <= MAX_LATENCY_RATIO, "Deep pages are slower than the first one"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+import sqlalchemy
+
+from ADSORFIT.src.packages.utils.repository.schema import Base
+from ADSORFIT.src.packages.utils.repository.vectors import encode_vector
+
+EXPERIMENTS = 100_000
+EXISTING_RUNS = 3
+POINTS_PER_EXPERIMENT = 20
+TABLE_NAME = "ADSORPTION_FITTING_RESULTS"
+
+
+# -------------------------------------------------------------------------------
+def build_results(experiments: int) -> pd.DataFrame:
+    generator = np.random.default_rng(42)
+    vectors = generator.uniform(1.0, 1e5, (experiments, POINTS_PER_EXPERIMENT))
+    return pd.DataFrame(
+        {
+            "experiment": [f"Experiment {index}" for index in range(experiments)],
+            "temperature [K]": 273 + (np.arange(experiments) % 5) * 25,
+            "pressure [Pa]": [encode_vector(row) for row in vectors],
+            "uptake [mol/g]": [encode_vector(row / 1e4) for row in vectors],
+            "measurement_count": POINTS_PER_EXPERIMENT,
+            "Langmuir LSS": generator.uniform(0.0, 1.0, experiments),
+            "Langmuir k": generator.uniform(0.0, 1.0, experiments),
+            "Langmuir qsat": generator.uniform(0.0, 10.0, experiments),
+        }
+    )
+
+
+# -------------------------------------------------------------------------------
+def rewrite_table(engine: sqlalchemy.Engine, results: pd.DataFrame) -> float:
+    # Previous behaviour: every run deletes the whole table and rewrites it
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(sqlalchemy.text(f'DELETE FROM "{TABLE_NAME}"'))
+        results.to_sql(TABLE_NAME, conn, if_exists="append", index=False)
+    return time.perf_counter() - start
+
+
+# -------------------------------------------------------------------------------
+def append_run(engine: sqlalchemy.Engine, results: pd.DataFrame, run: str) -> float:
+    start = time.perf_counter()
+    tagged = results.copy(deep=False)
+    tagged["run_id"] = run
+    with engine.begin() as conn:
+        tagged.to_sql(TABLE_NAME, conn, if_exists="append", index=False)
+    return time.perf_counter() - start
+
+
+# -------------------------------------------------------------------------------
+def main() -> None:
+    results = build_results(EXPERIMENTS)
+    with tempfile.TemporaryDirectory() as folder:
+        engine = sqlalchemy.create_engine(
+            f"sqlite:///{os.path.join(folder, 'benchmark.db')}", future=True
+        )
+        Base.metadata.create_all(engine)
+        rewrite_table(engine, results)
+        rewrite = rewrite_table(engine, results)
+
+        with engine.begin() as conn:
+            conn.execute(sqlalchemy.text(f'DELETE FROM "{TABLE_NAME}"'))
+        for index in range(EXISTING_RUNS):
+            append_run(engine, results, f"existing-{index}")
+        append = append_run(engine, results, "benchmark")
+        engine.dispose()
+
+    print(f"Run of {EXPERIMENTS:,} experiments, {EXISTING_RUNS} runs already stored")
+    print(f"delete and rewrite: {rewrite:6.2f} s")
+    print(f"append new run:     {append:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from ADSORFIT.src.packages.utils.repository.vectors import (
+    decode_vector,
+    encode_vector,
+    parse_legacy_vector,
+)
+
+VECTORS = 1_000_000
+POINTS_PER_VECTOR = 20
+
+
+# -------------------------------------------------------------------------------
+def legacy_encode(values: np.ndarray) -> str:
+    # Comma-joined text layout used before the BLOB columns
+    return ",".join(str(value) for value in values.tolist())
+
+
+# -------------------------------------------------------------------------------
+def measure(
+    label: str,
+    encode: Callable[[np.ndarray], Any],
+    decode: Callable[[Any], Any],
+    vectors: list[np.ndarray],
+) -> None:
+    start = time.perf_counter()
+    stored = [encode(values) for values in vectors]
+    encoded = time.perf_counter() - start
+    start = time.perf_counter()
+    for value in stored:
+        decode(value)
+    decoded = time.perf_counter() - start
+    size = sum(len(value) for value in stored) / 1e6
+    print(
+        f"{label:<7} encode={len(vectors) / encoded:>12,.0f} vec/s "
+        f"decode={len(vectors) / decoded:>12,.0f} vec/s stored={size:8.1f} MB"
+    )
+
+
+# -------------------------------------------------------------------------------
+def main() -> None:
+    generator = np.random.default_rng(42)
+    matrix = generator.uniform(1.0, 1e5, (VECTORS, POINTS_PER_VECTOR))
+    vectors = list(matrix)
+    print(f"Vectors: {VECTORS:,} of {POINTS_PER_VECTOR} float64 values")
+    measure("text", legacy_encode, parse_legacy_vector, vectors)
+    measure("blob", encode_vector, decode_vector, vectors)
+
+
+if __name__ == "__main__":
+    main()
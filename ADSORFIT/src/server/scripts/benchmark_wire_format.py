@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import time
+
+import numpy as np
+import pandas as pd
+
+from ADSORFIT.src.packages.utils.services.wire import ColumnarCodec
+from ADSORFIT.src.server.schemas.fitting import DatasetPayload
+
+ROWS = 1_000_000
+POINTS_PER_EXPERIMENT = 20
+
+
+# -------------------------------------------------------------------------------
+def build_dataset(rows: int) -> pd.DataFrame:
+    generator = np.random.default_rng(42)
+    experiments = np.arange(rows) // POINTS_PER_EXPERIMENT
+    pressure = generator.uniform(1.0, 1e5, rows)
+    return pd.DataFrame(
+        {
+            "experiment": np.char.add("exp_", experiments.astype(str)),
+            "temperature [K]": 273.15 + (experiments % 5) * 25.0,
+            "pressure [Pa]": pressure,
+            "uptake [mol/g]": 5.0 * pressure / (1e4 + pressure),
+        }
+    )
+
+
+# -------------------------------------------------------------------------------
+def measure(label: str, encode, decode) -> None:
+    start = time.perf_counter()
+    payload = encode()
+    encoded = time.perf_counter()
+    decode(payload)
+    decoded = time.perf_counter()
+    print(
+        f"{label:<10} size={len(payload) / 1e6:8.1f} MB "
+        f"encode={encoded - start:6.2f} s decode={decoded - encoded:6.2f} s"
+    )
+
+
+# -------------------------------------------------------------------------------
+def main() -> None:
+    dataframe = build_dataset(ROWS)
+    codec = ColumnarCodec()
+
+    def encode_json() -> bytes:
+        document = {
+            "columns": list(dataframe.columns),
+            "records": dataframe.to_dict(orient="records"),
+        }
+        return json.dumps(document).encode("utf-8")
+
+    def decode_json(payload: bytes) -> pd.DataFrame:
+        # Mirrors the legacy request path: per-record validation followed by a
+        # row-wise DataFrame rebuild.
+        dataset = DatasetPayload.model_validate_json(payload)
+        return pd.DataFrame.from_records(dataset.records, columns=dataset.columns)
+
+    print(f"Encoding {ROWS} measurements")
+    measure("json", encode_json, decode_json)
+    measure("columnar", lambda: codec.encode(dataframe), codec.decode)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import numpy as np
+
+from ADSORFIT.src.packages.constants import MODEL_PARAMETER_DEFAULTS
+from ADSORFIT.src.packages.utils.services.models import AdsorptionModels
+
+SAMPLES_PER_MODEL = 200
+POINTS_PER_SAMPLE = 25
+EPSILON = float(np.finfo(np.float64).eps)
+# Central differences are second-order accurate, so a relative step near the
+# cube root of machine epsilon balances truncation and rounding errors.
+RELATIVE_STEP = float(np.cbrt(EPSILON))
+MAX_RELATIVE_ERROR = 1e-6
+
+
+# -------------------------------------------------------------------------------
+def central_differences(
+    model: object, pressure: np.ndarray, parameters: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    # The rounding floor is returned so the caller can ignore differences the
+    # stencil cannot resolve
+    jacobian = np.empty((pressure.shape[0], parameters.shape[0]), dtype=np.float64)
+    resolution = np.empty(parameters.shape[0], dtype=np.float64)
+    for index in range(parameters.shape[0]):
+        step = RELATIVE_STEP * abs(parameters[index])
+        forward = parameters.copy()
+        backward = parameters.copy()
+        forward[index] += step
+        backward[index] -= step
+        upper = model(pressure, *forward)
+        lower = model(pressure, *backward)
+        jacobian[:, index] = (upper - lower) / (2.0 * step)
+        magnitude = max(np.abs(upper).max(), np.abs(lower).max())
+        resolution[index] = 10.0 * EPSILON * magnitude / step
+    return jacobian, resolution
+
+
+# -------------------------------------------------------------------------------
+def check_model(
+    models: AdsorptionModels,
+    model_name: str,
+    bounds: dict[str, tuple[float, float]],
+    generator: np.random.Generator,
+) -> float:
+    model = models.get_model(model_name)
+    jacobian = models.get_jacobian(model_name)
+    lower = np.array([low for low, _ in bounds.values()], dtype=np.float64)
+    upper = np.array([high for _, high in bounds.values()], dtype=np.float64)
+    worst = 0.0
+    for _ in range(SAMPLES_PER_MODEL):
+        # Parameters are drawn on a log scale strictly inside the bounds, so the
+        # central stencil never crosses them
+        low = np.maximum(lower, 1e-6) * 1.01
+        high = upper * 0.99
+        parameters = np.exp(generator.uniform(np.log(low), np.log(high)))
+        pressure = np.sort(10 ** generator.uniform(1.0, 6.0, POINTS_PER_SAMPLE))
+        analytic = np.asarray(jacobian(pressure, *parameters), dtype=np.float64)
+        numeric, resolution = central_differences(model, pressure, parameters)
+        assert analytic.shape == numeric.shape, f"{model_name}: wrong Jacobian shape"
+        # Errors are measured against the column scale, so parameters whose
+        # derivative nearly vanishes on some points do not inflate the ratio.
+        # Differences smaller than the rounding floor of the stencil are ignored.
+        error = np.maximum(np.abs(analytic - numeric) - resolution, 0.0)
+        scale = np.maximum(np.abs(numeric).max(axis=0), np.finfo(np.float64).tiny)
+        worst = max(worst, float((error / scale).max()))
+    return worst
+
+
+# -------------------------------------------------------------------------------
+def main() -> None:
+    models = AdsorptionModels()
+    generator = np.random.default_rng(42)
+    failures: list[str] = []
+    for model_name, bounds in MODEL_PARAMETER_DEFAULTS.items():
+        error = check_model(models, model_name, bounds, generator)
+        print(f"{model_name:<12} max relative error {error:.2e}")
+        if not error <= MAX_RELATIVE_ERROR:
+            failures.append(model_name)
+    assert not failures, f"Analytic Jacobians disagree: {', '.join(failures)}"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+
+from ADSORFIT.src.packages.configurations import build_database_settings
+from ADSORFIT.src.packages.utils.repository.sqlite import SQLiteRepository
+
+WRITE_ROWS = 2_000_000
+READER_THREADS = 4
+# Reads must keep completing while the write transaction is open
+MAX_READ_LATENCY = 1.0
+
+
+# -------------------------------------------------------------------------------
+def build_measurements(rows: int) -> pd.DataFrame:
+    generator = np.random.default_rng(42)
+    experiments = np.arange(rows) // 20
+    pressure = generator.uniform(1.0, 1e5, rows)
+    return pd.DataFrame(
+        {
+            "run_id": "concurrency",
+            "experiment": np.char.add("Experiment ", experiments.astype(str)),
+            "temperature [K]": 273 + (experiments % 5) * 25,
+            "pressure [Pa]": pressure,
+            "uptake [mol/g]": 5.0 * pressure / (1e4 + pressure),
+        }
+    )
+
+
+# -------------------------------------------------------------------------------
+def read_until(
+    repository: SQLiteRepository,
+    done: threading.Event,
+    latencies: list[float],
+    errors: list[str],
+) -> None:
+    while not done.is_set():
+        start = time.perf_counter()
+        try:
+            repository.load_from_database("ADSORPTION_BEST_FIT")
+            repository.count_rows("ADSORPTION_DATA")
+        except Exception as exc:  # noqa: BLE001
+            errors.append(str(exc))
+            return
+        latencies.append(time.perf_counter() - start)
+
+
+# -------------------------------------------------------------------------------
+def main() -> None:
+    measurements = build_measurements(WRITE_ROWS)
+    settings = build_database_settings({})
+    with tempfile.TemporaryDirectory() as folder:
+        repository = SQLiteRepository(settings, os.path.join(folder, "sqlite.db"))
+        done = threading.Event()
+        latencies: list[float] = []
+        errors: list[str] = []
+        readers = [
+            threading.Thread(
+                target=read_until, args=(repository, done, latencies, errors)
+            )
+            for _ in range(READER_THREADS)
+        ]
+        for reader in readers:
+            reader.start()
+        start = time.perf_counter()
+        try:
+            repository.append_into_database(measurements, "ADSORPTION_DATA")
+        finally:
+            write_time = time.perf_counter() - start
+            done.set()
+            for reader in readers:
+                reader.join()
+            repository.engine.dispose()
+            repository.reader_engine.dispose()
+
+    print(
+        f"Wrote {WRITE_ROWS:,} rows in {write_time:.2f} s with journal mode "
+        f"{settings.sqlite_journal_mode}"
+    )
+    print(
+        f"Reads completed during the write: {len(latencies)}, max latency "
+        f"{max(latencies, default=0.0):.3f} s"
+    )
+    assert not errors, f"Concurrent reads failed: {errors[0]}"
+    assert latencies, "No read completed while the write was running"
+    assert max(latencies) <= MAX_READ_LATENCY, "Reads waited for the writer"
+
+
+if __name__ == "__main__":
+    main()